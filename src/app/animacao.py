@@ -0,0 +1,253 @@
+import time
+import queue
+import threading
+import tkinter as tk
+
+from PIL import ImageTk
+
+# Notas:
+# - Player de animação em streaming (gif do menu): os quadros são decodificados numa thread,
+#   poucos à frente da reprodução, e entregues por uma fila limitada (BUFFER_QUADROS).
+#   Quando a fila enche a thread espera: memória fica limitada a ~BUFFER_QUADROS quadros,
+#   não importa quantos quadros a animação tenha.
+# - O primeiro quadro é decodificado na hora (síncrono), então o label já aparece com imagem.
+# - Na tela, só 2 PhotoImage se alternam (paste no que não está visível), sem criar imagem Tk
+#   nova a cada quadro.
+# - Animação curta (cabe inteira no buffer) é guardada depois da primeira volta e a thread para;
+#   as longas são decodificadas de novo a cada volta.
+# - Ninguém tem cadeia de after própria: um AgendadorAnimacoes por root (agendador_de) roda todas
+#   as animações num timer só, dormindo até o próximo quadro vencido. Animação cujo widget não
+#   está visível (janela withdraw/iconify, widget fora do pack) fica pausada e não agenda nada;
+#   o <Map> do widget/janela acorda o agendador. Sem nada visível, nenhum timer fica rodando.
+# - Sob carga (tick chegou atrasado) o passo recebe o atraso e pode pular quadros.
+# - quadros_fn() devolve um iterador de (PIL.Image RGBA, duração_ms) de UMA volta da animação
+#   (ex.: data/animacoes.cache_animacoes.quadros, que lê o pacote pré-renderizado do gif).
+
+BUFFER_QUADROS = 8
+ESPERA_QUADRO_MS = 10   # decodificador atrasado: tenta de novo nesse intervalo
+
+
+class _Entrada:
+    __slots__ = ("agendador", "widget", "passo", "proximo", "pausada")
+
+    def __init__(self, agendador, widget, passo, proximo):
+        self.agendador = agendador
+        self.widget = widget
+        self.passo = passo
+        self.proximo = proximo
+        self.pausada = False
+
+    def cancelar(self):
+        self.agendador.remover(self)
+
+
+class AgendadorAnimacoes:
+    def __init__(self, root):
+        self.root = root
+        self._entradas = []
+        self._after = None
+        self._ligados = set()   # janelas que já têm o <Map> que acorda o agendador
+        self.ticks = 0
+
+    @staticmethod
+    def _agora():
+        return time.perf_counter() * 1000.0
+
+    def registrar(self, widget, passo, espera_ms=0):
+        # passo(atraso_ms) roda quando vencer e devolve a espera até o próximo (None = parar)
+        entrada = _Entrada(self, widget, passo, self._agora() + espera_ms)
+        self._entradas.append(entrada)
+        widget.bind("<Map>", lambda e: self._acordar(), add="+")
+        janela = widget.winfo_toplevel()
+        if str(janela) not in self._ligados:
+            self._ligados.add(str(janela))
+            janela.bind("<Map>", lambda e: self._acordar(), add="+")
+        self._acordar()
+        return entrada
+
+    def remover(self, entrada):
+        try:
+            self._entradas.remove(entrada)
+        except ValueError:
+            pass
+
+    def _acordar(self):
+        if self._after is not None:
+            try:
+                self.root.after_cancel(self._after)
+            except tk.TclError:
+                pass
+        self._after = self.root.after(0, self._tick)
+
+    def _tick(self):
+        self._after = None
+        self.ticks += 1
+        agora = self._agora()
+        proximo = None
+        for entrada in list(self._entradas):
+            try:
+                vivo = entrada.widget.winfo_exists()
+                visivel = vivo and entrada.widget.winfo_viewable()
+            except tk.TclError:
+                vivo = visivel = False
+            if not vivo:
+                self.remover(entrada)
+                continue
+            if not visivel:
+                entrada.pausada = True
+                continue
+            if entrada.pausada:
+                # voltou a aparecer: o tempo escondido não conta como atraso
+                entrada.pausada = False
+                entrada.proximo = max(entrada.proximo, agora)
+            if entrada.proximo <= agora:
+                try:
+                    espera = entrada.passo(agora - entrada.proximo)
+                except Exception as e:
+                    print(f"[AVISO] Animação falhou e foi parada: {e}")
+                    espera = None
+                if espera is None:
+                    self.remover(entrada)
+                    continue
+                entrada.proximo = agora + espera
+            if proximo is None or entrada.proximo < proximo:
+                proximo = entrada.proximo
+        if proximo is not None:
+            self._after = self.root.after(max(1, int(proximo - agora)), self._tick)
+
+
+def agendador_de(widget):
+    # um agendador por interpretador Tk (guardado no root)
+    root = widget._root()
+    agendador = getattr(root, "_agendador_animacoes", None)
+    if agendador is None:
+        agendador = root._agendador_animacoes = AgendadorAnimacoes(root)
+    return agendador
+
+
+class PlayerAnimacao:
+    def __init__(self, parent, quadros_fn, buffer=BUFFER_QUADROS, **label_kw):
+        self._quadros_fn = quadros_fn
+        self._fila = queue.Queue(maxsize=buffer)
+        self._parar = threading.Event()
+        self._buffer = buffer
+        self._completa = None      # [(PIL, dur)] quando a animação inteira coube no buffer
+        self._pos = 0
+        self._fotos = []           # até 2 PhotoImage alternando
+        self._atual = 0
+        self._entrada = None
+        self._fim = False          # decodificador morreu: para no quadro atual
+        self.quadros_pulados = 0
+
+        iterador = iter(quadros_fn())
+        primeiro = next(iterador, None)
+        if primeiro is None:
+            raise ValueError("animação sem quadros")
+
+        self.label = tk.Label(parent, **label_kw)
+        self.label.bind("<Destroy>", lambda e: self.parar() if e.widget is self.label else None, add="+")
+        self._mostrar(primeiro[0])
+
+        self._thread = threading.Thread(
+            target=self._decodificar, args=(iterador, primeiro), daemon=True, name="animacao"
+        )
+        self._thread.start()
+        self._entrada = agendador_de(self.label).registrar(self.label, self._passo, primeiro[1])
+
+    # thread de decodificação ------------------------------------------------
+    def _entregar(self, item):
+        # put que desiste se o player parar (label destruído) enquanto a fila está cheia
+        while not self._parar.is_set():
+            try:
+                self._fila.put(item, timeout=0.2)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _decodificar(self, iterador, primeiro):
+        try:
+            vistos = [primeiro]
+            for quadro in iterador:
+                if vistos is not None:
+                    vistos.append(quadro)
+                    if len(vistos) > self._buffer:
+                        vistos = None   # não cabe: segue em streaming
+                if not self._entregar(quadro):
+                    return
+            if vistos is not None:
+                # animação curta: entrega a lista inteira e a reprodução passa a girar nela
+                self._entregar(("completa", vistos))
+                return
+            # animação longa: decodifica de novo a cada volta
+            while not self._parar.is_set():
+                for quadro in self._quadros_fn():
+                    if not self._entregar(quadro):
+                        return
+        except Exception as e:
+            print(f"[AVISO] Falha decodificando animação: {e}")
+            self._entregar(("erro", None))
+
+    # thread do Tk ------------------------------------------------------------
+    def _mostrar(self, pil_img):
+        # paste na PhotoImage que não está na tela (mesmo tamanho) ou cria uma nova
+        livre = 1 - self._atual
+        if len(self._fotos) < 2 or self._fotos[livre].width() != pil_img.width or \
+                self._fotos[livre].height() != pil_img.height:
+            foto = ImageTk.PhotoImage(pil_img, master=self.label)
+            if len(self._fotos) < 2:
+                self._fotos.append(foto)
+                livre = len(self._fotos) - 1
+            else:
+                self._fotos[livre] = foto
+        else:
+            self._fotos[livre].paste(pil_img)
+        self._atual = livre
+        self.label.config(image=self._fotos[livre])
+
+    def _pegar(self):
+        # próximo quadro pronto, None se o decodificador está atrasado, "fim" se a animação morreu
+        # (o "fim" fica marcado em _fim: não se perde se quem pegou estava pulando quadros)
+        if self._fim:
+            return "fim"
+        if self._completa is not None:
+            quadro = self._completa[self._pos]
+            self._pos = (self._pos + 1) % len(self._completa)
+            return quadro
+        try:
+            quadro = self._fila.get_nowait()
+        except queue.Empty:
+            return None
+        if isinstance(quadro[0], str):
+            if quadro[0] == "erro":
+                self._fim = True
+                return "fim"
+            self._completa, self._pos = quadro[1], 0   # ("completa", lista)
+            return self._pegar()
+        return quadro
+
+    def _passo(self, atraso_ms):
+        # chamado pelo agendador; devolve a espera até o próximo quadro (None = acabou)
+        if self._fim:
+            return None
+        quadro = self._pegar()
+        if quadro == "fim":
+            return None   # fica parado no último quadro
+        if quadro is None:
+            return ESPERA_QUADRO_MS
+        # atrasado mais que a duração do quadro: pula sem desenhar (sem paste nem config)
+        while atraso_ms >= quadro[1]:
+            seguinte = self._pegar()
+            if seguinte is None or seguinte == "fim":
+                break   # "fim" fica em _fim: o próximo passo encerra
+            atraso_ms -= quadro[1]
+            quadro = seguinte
+            self.quadros_pulados += 1
+        self._mostrar(quadro[0])
+        return max(quadro[1] // 2, quadro[1] - atraso_ms)
+
+    def parar(self):
+        self._parar.set()
+        if self._entrada is not None:
+            self._entrada.cancelar()
+            self._entrada = None
@@ -0,0 +1,297 @@
+import bisect
+import tkinter as tk
+
+# Notas:
+# - Grade virtualizada num Canvas: a scrollregion tem a altura da lista inteira, mas só existem
+#   células pras linhas visíveis + OVERSCAN acima/abaixo. Ao rolar, as células que saem da vista
+#   são reaproveitadas (recolocadas com coords + preenchidas de novo) pras que entram.
+# - Número de widgets fica constante (~ linhas visíveis x colunas), não importa o tamanho da lista.
+# - Quem usa decide o conteúdo: criar_celula(master) devolve o widget da célula (uma vez por
+#   célula do pool) e preencher(celula, item) atualiza a célula pra mostrar outro item;
+#   soltar(celula) (opcional) roda quando a célula sai da vista.
+
+OVERSCAN = 1   # linhas extras montadas acima e abaixo da área visível
+
+
+class GradeVirtual:
+    def __init__(self, canvas, colunas, largura_celula, altura_celula, criar_celula, preencher,
+                 soltar=None, scrollbar=None, overscan=OVERSCAN):
+        self.canvas = canvas
+        self.colunas = colunas
+        self.largura_celula = largura_celula
+        self.altura_celula = altura_celula
+        self._criar_celula = criar_celula
+        self._preencher = preencher
+        self._soltar = soltar
+        self._scrollbar = scrollbar
+        self.overscan = overscan
+        self.itens = []
+        self._visiveis = {}   # índice do item -> (widget da célula, id da janela no canvas)
+        self._livres = []     # (widget, id) escondidas, prontas pra reuso
+        self._agendado = None
+        self._regiao = None   # última scrollregion aplicada
+        self._vista = None    # último (primeiro, ultimo) recebido do yscrollcommand
+
+        # a grade é quem sabe quando a vista mudou: rolagem passa pelo yscrollcommand
+        canvas.configure(yscrollcommand=self._on_scroll)
+        canvas.bind("<Configure>", lambda e: self._agendar(), add="+")
+
+    @property
+    def total_celulas(self):
+        return len(self._visiveis) + len(self._livres)
+
+    def definir_itens(self, itens):
+        # troca a lista inteira (ex.: outra aba) reaproveitando as células que já existem
+        for indice in list(self._visiveis):
+            self._esconder(indice)
+        self.itens = list(itens)
+        linhas = -(-len(self.itens) // self.colunas)
+        self._definir_regiao((0, 0, self._largura_total(), linhas * self.altura_celula))
+        self.canvas.yview_moveto(0)
+        self._atualizar()
+
+    def atualizar_item(self, indice):
+        # preenche de novo só a célula de um item, se ela estiver montada
+        atual = self._visiveis.get(indice)
+        if atual is not None:
+            self._preencher(atual[0], self.itens[indice])
+
+    def _largura_total(self):
+        return max(self.canvas.winfo_width(), self.colunas * self.largura_celula)
+
+    def _visivel(self):
+        try:
+            return bool(self.canvas.winfo_viewable())
+        except tk.TclError:
+            return False
+
+    def _on_scroll(self, primeiro, ultimo):
+        # grade escondida (outra aba com a mesma scrollbar) não mexe na scrollbar nem se redesenha;
+        # ao voltar, o <Configure> do canvas agenda a atualização
+        if not self._visivel():
+            return
+        if self._scrollbar is not None:
+            self._scrollbar.set(primeiro, ultimo)
+        # o Tk chama o yscrollcommand a cada configure(scrollregion=...): só vista nova conta,
+        # senão _atualizar -> scrollregion -> _on_scroll -> _atualizar nunca para de rodar
+        if (primeiro, ultimo) == self._vista:
+            return
+        self._vista = (primeiro, ultimo)
+        self._agendar()
+
+    def _definir_regiao(self, regiao):
+        if regiao != self._regiao:
+            self._regiao = regiao
+            self.canvas.configure(scrollregion=regiao)
+
+    def _agendar(self):
+        # várias mudanças de vista no mesmo ciclo viram uma atualização só
+        if self._agendado is None:
+            self._agendado = self.canvas.after_idle(self._atualizar)
+
+    def _atualizar(self):
+        if self._agendado is not None:
+            self.canvas.after_cancel(self._agendado)
+            self._agendado = None
+        if not self.itens or not self._visivel():
+            return
+        topo = self.canvas.canvasy(0)
+        altura = max(self.canvas.winfo_height(), self.altura_celula)
+        linhas = -(-len(self.itens) // self.colunas)
+        primeira = max(0, int(topo // self.altura_celula) - self.overscan)
+        ultima = min(linhas - 1, int((topo + altura) // self.altura_celula) + self.overscan)
+        alvo = range(primeira * self.colunas, min(len(self.itens), (ultima + 1) * self.colunas))
+
+        for indice in [i for i in self._visiveis if i not in alvo]:
+            self._esconder(indice)
+
+        # centraliza as colunas na largura atual do canvas
+        largura = self._largura_total()
+        self._definir_regiao((0, 0, largura, linhas * self.altura_celula))
+        x0 = max(0, (largura - self.colunas * self.largura_celula) // 2)
+        for indice in alvo:
+            x = x0 + (indice % self.colunas) * self.largura_celula
+            y = (indice // self.colunas) * self.altura_celula
+            atual = self._visiveis.get(indice)
+            if atual is not None:
+                self.canvas.coords(atual[1], x, y)
+                continue
+            if self._livres:
+                celula, janela = self._livres.pop()
+                self.canvas.coords(janela, x, y)
+                self.canvas.itemconfigure(janela, state='normal')
+            else:
+                celula = self._criar_celula(self.canvas)
+                janela = self.canvas.create_window(
+                    x, y, window=celula, anchor='nw', width=self.largura_celula, height=self.altura_celula
+                )
+            self._visiveis[indice] = (celula, janela)
+            self._preencher(celula, self.itens[indice])
+
+    def _esconder(self, indice):
+        celula, janela = self._visiveis.pop(indice)
+        self.canvas.itemconfigure(janela, state='hidden')
+        if self._soltar:
+            self._soltar(celula)
+        self._livres.append((celula, janela))
+
+
+# ----------------------------------------------------------------------------
+# Lista virtualizada de altura variável (lista de eventos)
+# - itens: [(chave, tipo, dados)]; widgets vêm do pool (app/pool.py, pegar(tipo, canvas)) e cada
+#   tipo tem suas margens.
+# - Tabela de offsets: offsets[i] = y do topo da linha i (margem incluída), offsets[-1] = altura total.
+#   Linha nunca vista usa a altura estimada do tipo (primeira medida); quando o widget aparece,
+#   o <Configure> dele traz a altura real e os offsets daí pra baixo são refeitos.
+# - Só as linhas na vista (+ overscan_px) têm widget; as que saem voltam pro pool e são
+#   reaproveitadas pelas que entram. Custo de montar a lista não depende do número de linhas.
+#   Widget devolvido guarda a janela do canvas (escondida): reuso é coords + state, sem create_window.
+# - Linhas que continuam visíveis entre dois definir_itens (mesma chave) não são preenchidas de novo.
+
+OVERSCAN_PX = 200
+ALTURA_ESTIMADA = 28   # antes de medir a primeira linha de um tipo
+
+
+class ListaVirtual:
+    def __init__(self, canvas, pool, preencher, soltar=None, scrollbar=None, largura=None,
+                 margem_topo=10, overscan_px=OVERSCAN_PX):
+        self.canvas = canvas
+        self.pool = pool               # PoolWidgets (app/pool.py)
+        self._preencher = preencher    # preencher(widget, (chave, tipo, dados))
+        self._soltar = soltar
+        self._scrollbar = scrollbar
+        self._largura = largura        # largura() -> largura das linhas; None = largura do canvas
+        self.margem_topo = margem_topo
+        self.overscan_px = overscan_px
+        self.itens = []
+        self._posicao = {}       # chave -> índice em itens
+        self._margens = {}       # tipo -> (cima, baixo)
+        self._alturas = {}       # chave -> altura medida
+        self._estimativa = {}    # tipo -> altura da primeira linha medida desse tipo
+        self._offsets = [margem_topo]
+        self._visiveis = {}      # chave -> (widget, id da janela no canvas)
+        self._chave_de = {}      # widget -> chave que ele mostra agora
+        self._janela_de = {}     # widget -> id da janela no canvas (visível ou escondida no pool)
+        self._agendado = None
+        self._regiao = None      # última scrollregion aplicada
+        self._vista = None       # último (primeiro, ultimo) recebido do yscrollcommand
+
+        canvas.configure(yscrollcommand=self._on_scroll)
+        canvas.bind("<Configure>", lambda e: self._agendar(), add="+")
+
+    @property
+    def total_widgets(self):
+        return len(self._janela_de)
+
+    def definir_itens(self, itens, margens=None):
+        itens = list(itens)
+        self.itens = itens
+        self._regiao = None   # quem usa pode ter mexido na scrollregion enquanto a lista estava vazia
+        self._posicao = {chave: i for i, (chave, _, _) in enumerate(itens)}
+        if margens:
+            self._margens.update(margens)
+        for chave in [c for c in self._visiveis if c not in self._posicao]:
+            self._esconder(chave)
+        self._refazer_offsets()
+        self._atualizar()
+
+    def esquecer_alturas(self):
+        # troca de dono (outra carta/cavala): as alturas medidas não valem mais
+        self._alturas.clear()
+
+    def _altura(self, i):
+        chave, tipo, _ = self.itens[i]
+        h = self._alturas.get(chave) or self._estimativa.get(tipo, ALTURA_ESTIMADA)
+        cima, baixo = self._margens.get(tipo, (0, 0))
+        return h + cima + baixo
+
+    def _refazer_offsets(self, desde=0):
+        del self._offsets[desde + 1:]
+        y = self._offsets[desde] if desde else self.margem_topo
+        self._offsets[0] = self.margem_topo
+        for i in range(desde, len(self.itens)):
+            y += self._altura(i)
+            self._offsets.append(y)
+
+    def _medir(self, widget, altura):
+        chave = self._chave_de.get(widget)
+        if chave is None or chave not in self._posicao or self._alturas.get(chave) == altura:
+            return
+        self._alturas[chave] = altura
+        i = self._posicao[chave]
+        self._estimativa.setdefault(self.itens[i][1], altura)
+        self._refazer_offsets(i)
+        self._agendar()
+
+    def _on_scroll(self, primeiro, ultimo):
+        if self._scrollbar is not None:
+            self._scrollbar.set(primeiro, ultimo)
+        # o Tk chama o yscrollcommand a cada configure(scrollregion=...): só vista nova conta,
+        # senão _atualizar -> scrollregion -> _on_scroll -> _atualizar nunca para de rodar
+        if (primeiro, ultimo) == self._vista:
+            return
+        self._vista = (primeiro, ultimo)
+        if self.itens:
+            self._agendar()
+
+    def _definir_regiao(self, regiao):
+        if regiao != self._regiao:
+            self._regiao = regiao
+            self.canvas.configure(scrollregion=regiao)
+
+    def _agendar(self):
+        if self._agendado is None:
+            self._agendado = self.canvas.after_idle(self._atualizar)
+
+    def _atualizar(self):
+        if self._agendado is not None:
+            self.canvas.after_cancel(self._agendado)
+            self._agendado = None
+        if not self.itens:
+            return
+        topo = self.canvas.canvasy(0)
+        altura = max(self.canvas.winfo_height(), 1)
+        primeira = max(0, bisect.bisect_right(self._offsets, topo - self.overscan_px) - 1)
+        ultima = min(len(self.itens), bisect.bisect_left(self._offsets, topo + altura + self.overscan_px))
+        alvo = {self.itens[i][0]: i for i in range(primeira, ultima)}
+
+        for chave in [c for c in self._visiveis if c not in alvo]:
+            self._esconder(chave)
+
+        largura_canvas = self.canvas.winfo_width()
+        largura = self._largura() if self._largura else largura_canvas
+        x = largura_canvas // 2
+        for chave, i in alvo.items():
+            item = self.itens[i]
+            y = self._offsets[i] + self._margens.get(item[1], (0, 0))[0]
+            atual = self._visiveis.get(chave)
+            if atual is not None:
+                self.canvas.coords(atual[1], x, y)
+                self.canvas.itemconfigure(atual[1], width=largura)
+                continue
+            widget = self.pool.pegar(item[1], self.canvas)
+            janela = self._janela_de.get(widget)
+            if janela is not None:
+                self.canvas.coords(janela, x, y)
+                self.canvas.itemconfigure(janela, state='normal', width=largura)
+            else:
+                widget.bind("<Configure>", lambda e, w=widget: self._medir(w, e.height), add="+")
+                janela = self._janela_de[widget] = self.canvas.create_window(
+                    x, y, window=widget, anchor='n', width=largura
+                )
+            self._visiveis[chave] = (widget, janela)
+            self._chave_de[widget] = chave
+            self._preencher(widget, item)
+
+        self._definir_regiao((0, 0, largura_canvas, self._offsets[-1] + self.margem_topo))
+
+    def _esconder(self, chave):
+        widget, janela = self._visiveis.pop(chave)
+        self._chave_de.pop(widget, None)
+        self.canvas.itemconfigure(janela, state='hidden')
+        if self._soltar:
+            self._soltar(widget)
+        if not self.pool.devolver(widget):
+            # pool cheio: o widget foi destruído; o item de janela do canvas sai junto
+            del self._janela_de[widget]
+            self.canvas.delete(janela)
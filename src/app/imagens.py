@@ -0,0 +1,193 @@
+import os
+import queue
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import ImageTk, ImageOps
+
+from ..data.paths import BASE
+from ..data.miniaturas import cache_miniaturas
+from ..data.atlas import FUNDO_ICONES
+
+# Notas:
+# - Cache único de imagens Tk do app: um par (colorida, cinza) de PhotoImage por (arquivo, tamanho, fundo).
+# - Seletores e barra de cima pedem o par aqui em vez de criar PhotoImage cada um; a mesma carta
+#   aberta no seletor e exibida no deck usa as mesmas imagens Tk, desde que os dois peçam o mesmo
+#   tamanho e fundo (FUNDO_ICONES, ver data/atlas.py).
+# - Contagem de referências: prender(widget, par) segura o par enquanto o widget existir
+#   (solto no <Destroy>), então não precisa mais de btn.image / img_refs só pra manter vivo.
+# - Pares sem ninguém usando ficam num LRU (LIMITE_LIVRES) pra reabrir o seletor sem recriar nada;
+#   passando do limite o mais antigo é descartado. Pares em uso nunca são descartados.
+# - A versão cinza só é gerada na primeira vez que alguém pede (o seletor de cavala nem usa).
+# - Só na thread do Tk (PhotoImage pertence ao interpretador).
+# - pedir(): versão assíncrona pra grades grandes. Decodificação/redimensionamento (PIL) rodam num
+#   pool de threads; os resultados voltam por uma fila que a thread do Tk esvazia com after(),
+#   poucos por vez (LOTE_POR_TICK) pra janela continuar respondendo enquanto a grade preenche.
+
+LIMITE_LIVRES = 256
+LOTE_POR_TICK = 8
+INTERVALO_FILA_MS = 15
+PLACEHOLDER = os.path.join(BASE, "icon_tipos", "place_holder.png")
+
+
+class ParImagens:
+    __slots__ = ("chave", "colorida", "_pil", "_cinza", "refs")
+
+    def __init__(self, chave, pil_img, pil_cinza=None):
+        self.chave = chave
+        self.colorida = ImageTk.PhotoImage(pil_img)
+        self._pil = pil_cinza or pil_img     # guardado até a cinza ser gerada
+        self._cinza = None
+        self.refs = 0
+
+    @property
+    def cinza(self):
+        if self._cinza is None:
+            pil = self._pil if self._pil.mode == "L" else _cinza(self._pil)
+            self._cinza = ImageTk.PhotoImage(pil)
+            self._pil = None
+        return self._cinza
+
+
+def _cinza(pil_img):
+    return ImageOps.grayscale(pil_img.convert("RGB"))
+
+
+def _decodificar(chave):
+    # roda no pool: só PIL, nada de Tk
+    caminho, tamanho, fundo = chave
+    try:
+        img = cache_miniaturas.obter(caminho, tamanho, fundo)
+        return chave, img, _cinza(img), None
+    except Exception as e:
+        return chave, None, None, e
+
+
+class CacheImagens:
+    def __init__(self, limite_livres=LIMITE_LIVRES):
+        self.limite_livres = limite_livres
+        self._em_uso = {}              # chave -> ParImagens (refs > 0)
+        self._livres = OrderedDict()   # chave -> ParImagens (refs == 0), mais antigo primeiro
+        self.acertos = 0
+        self.falhas = 0
+        self._pool = None
+        self._prontos = queue.Queue()   # resultados do pool, esvaziada só pela thread do Tk
+        self._esperando = {}            # chave -> [(widget, ao_pronto, vincular)]
+        self._drenando = None           # widget usado pra agendar o after da fila
+
+    def adquirir(self, caminho, tamanho, fundo=None):
+        # devolve o par e conta uma referência; erro de arquivo/imagem sobe pra quem chamou
+        chave = (caminho, tamanho, fundo)
+        par = self._em_uso.get(chave)
+        if par is None:
+            par = self._livres.pop(chave, None)
+            if par is None:
+                par = ParImagens(chave, cache_miniaturas.obter(caminho, tamanho, fundo))
+                self.falhas += 1
+            else:
+                self.acertos += 1
+            self._em_uso[chave] = par
+        else:
+            self.acertos += 1
+        par.refs += 1
+        return par
+
+    def liberar(self, par):
+        par.refs -= 1
+        if par.refs > 0:
+            return
+        if self._em_uso.get(par.chave) is par:
+            del self._em_uso[par.chave]
+            self._livres[par.chave] = par
+            while len(self._livres) > self.limite_livres:
+                self._livres.popitem(last=False)
+
+    def prender(self, widget, par):
+        # a referência adquirida vale enquanto o widget existir
+        def _soltar(event):
+            if event.widget is widget:
+                self.liberar(par)
+        widget.bind("<Destroy>", _soltar, add="+")
+        return par
+
+    def pedir(self, widget, caminho, tamanho, fundo=None, ao_pronto=None, vincular=True):
+        # versão assíncrona de adquirir + prender: se o par já existe, ao_pronto(par) roda agora;
+        # senão a imagem é preparada no pool e ao_pronto(par) roda depois, na thread do Tk,
+        # se o widget ainda existir. devolve True se já estava pronto
+        # vincular=False: a referência não fica presa ao widget, quem chamou faz liberar(par)
+        # (células reaproveitadas da grade virtual, que não são destruídas ao trocar de carta)
+        chave = (caminho, tamanho, fundo)
+        if chave in self._em_uso or chave in self._livres:
+            par = self.adquirir(caminho, tamanho, fundo)
+            if vincular:
+                self.prender(widget, par)
+            if ao_pronto:
+                ao_pronto(par)
+            return True
+        esperando = self._esperando.get(chave)
+        if esperando is None:
+            esperando = self._esperando[chave] = []
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1),
+                                                thread_name_prefix="imagens")
+            self._pool.submit(_decodificar, chave).add_done_callback(lambda f: self._prontos.put(f.result()))
+        esperando.append((widget, ao_pronto, vincular))
+        if self._drenando is None:
+            self._drenando = widget._root()
+            self._drenando.after(INTERVALO_FILA_MS, self._drenar)
+        return False
+
+    def _drenar(self):
+        # thread do Tk: transforma alguns resultados em PhotoImage e entrega pros widgets vivos
+        for _ in range(LOTE_POR_TICK):
+            try:
+                chave, img, cinza, erro = self._prontos.get_nowait()
+            except queue.Empty:
+                break
+            esperando = self._esperando.pop(chave, [])
+            if erro is not None:
+                print(f"Erro ao carregar imagem {chave[0]}: {erro}")
+                continue
+            vivos = [(w, cb, v) for w, cb, v in esperando if _existe(w)]
+            # alguém pode ter pedido a mesma imagem de forma síncrona nesse meio tempo
+            par = self._em_uso.get(chave) or self._livres.pop(chave, None) or ParImagens(chave, img, cinza)
+            if not vivos:
+                # ninguém mais esperando (aba trocada / janela fechada): fica no LRU pra próxima
+                if par.refs == 0:
+                    self._livres[chave] = par
+                    while len(self._livres) > self.limite_livres:
+                        self._livres.popitem(last=False)
+                continue
+            self.falhas += 1
+            self._em_uso[chave] = par
+            for w, cb, vincular in vivos:
+                par.refs += 1
+                if vincular:
+                    self.prender(w, par)
+                if cb:
+                    try:
+                        cb(par)
+                    except Exception as e:
+                        print(f"[ERRO] Falha aplicando imagem {chave[0]}: {e}")
+        if self._esperando:
+            self._drenando.after(INTERVALO_FILA_MS, self._drenar)
+        else:
+            self._drenando = None
+
+    def placeholder(self, tamanho, fundo=None):
+        # par do ícone de "carregando" no tamanho pedido (síncrono, é um só e fica no cache)
+        return self.adquirir(PLACEHOLDER, tamanho, fundo)
+
+    def estatisticas(self):
+        return {"em_uso": len(self._em_uso), "livres": len(self._livres),
+                "acertos": self.acertos, "falhas": self.falhas}
+
+
+def _existe(widget):
+    try:
+        return bool(widget.winfo_exists())
+    except Exception:
+        return False
+
+
+cache_imagens = CacheImagens()
@@ -0,0 +1,95 @@
+from tkinter.font import Font
+
+# Notas:
+# - Serviço de medidas de layout: largura de texto, altura de linha e número de linhas quebradas
+#   calculados pelas métricas do tkinter.font (font measure/metrics), sem update_idletasks.
+#   Antes, cada painel/botão criava widget, forçava um passe de layout síncrono e lia winfo_req*.
+# - Fontes são criadas uma vez por descrição e compartilhadas (antes cada EventoExpandivel criava
+#   duas fontes Tk nomeadas); larguras de palavras e contagens de linha ficam em cache.
+# - Um serviço por root (medidas_de), igual ao agendador de animações.
+# - As contas imitam o Tk (wrap='word', Label com borda/padding padrão); erro de 1 linha/alguns px
+#   no pior caso, que é o que o app tolerava antes contando só as linhas lógicas.
+
+LIMITE_CACHE = 4096
+INSET_LABEL = 6   # Label padrão: 2 * (borderwidth 2 + pady/padx 1)
+
+
+class Medidas:
+    def __init__(self, root):
+        self.root = root
+        self._fontes = {}    # descrição -> Font
+        self._larguras = {}  # (descrição, texto) -> px
+        self._linhas = {}    # (segmentos, largura) -> nº de linhas
+        self._px_por_cm = None
+
+    def fonte(self, descricao):
+        # descricao: ("Arial", 10) / ("Arial", 10, "bold")
+        f = self._fontes.get(descricao)
+        if f is None:
+            familia, tamanho, *resto = descricao
+            f = self._fontes[descricao] = Font(
+                root=self.root, family=familia, size=tamanho, weight=resto[0] if resto else "normal"
+            )
+        return f
+
+    def largura(self, texto, descricao):
+        chave = (descricao, texto)
+        px = self._larguras.get(chave)
+        if px is None:
+            if len(self._larguras) >= LIMITE_CACHE:
+                self._larguras.clear()
+            px = self._larguras[chave] = self.fonte(descricao).measure(texto)
+        return px
+
+    def altura_linha(self, descricao):
+        return self.fonte(descricao).metrics("linespace")
+
+    def px_por_cm(self):
+        if self._px_por_cm is None:
+            self._px_por_cm = self.root.winfo_fpixels('1c')
+        return self._px_por_cm
+
+    def tamanho_rotulo(self, texto, descricao):
+        # (largura, altura) pedidas por um tk.Label padrão com esse texto
+        linhas = texto.split("\n")
+        w = max(self.largura(linha, descricao) for linha in linhas)
+        return w + INSET_LABEL, len(linhas) * self.altura_linha(descricao) + INSET_LABEL
+
+    def linhas_quebradas(self, segmentos, largura_px, fontes):
+        # quantas linhas um tk.Text(wrap='word') com essa largura útil mostra pros segmentos
+        # segmentos: [(estilo, texto)], fontes: estilo -> descrição da fonte
+        chave = (segmentos, largura_px)
+        n = self._linhas.get(chave)
+        if n is not None:
+            return n
+        if len(self._linhas) >= LIMITE_CACHE:
+            self._linhas.clear()
+
+        n, x = 1, 0
+        for estilo, trecho in segmentos:
+            descricao = fontes.get(estilo) or next(iter(fontes.values()))
+            espaco = self.largura(" ", descricao)
+            for i, linha in enumerate(trecho.split("\n")):
+                if i:
+                    n, x = n + 1, 0   # quebra de linha lógica
+                for palavra in linha.split(" "):
+                    w = self.largura(palavra, descricao)
+                    proximo = x + (espaco if x else 0) + w
+                    if x and proximo > largura_px:
+                        n, x = n + 1, 0
+                        proximo = w
+                    if w > largura_px:
+                        # palavra maior que a linha: o Tk quebra no meio dela
+                        extra, resto = divmod(w - 1, max(1, largura_px))
+                        n, proximo = n + extra, resto + 1
+                    x = proximo
+        self._linhas[chave] = n
+        return n
+
+
+def medidas_de(widget):
+    root = widget._root()
+    medidas = getattr(root, "_medidas_layout", None)
+    if medidas is None:
+        medidas = root._medidas_layout = Medidas(root)
+    return medidas
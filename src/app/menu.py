@@ -1,17 +1,20 @@
 # src/app/menu.py
 import os
+import time
 import threading
 import random
 import glob
 import tkinter as tk
 from tkinter import messagebox
-from PIL import Image, ImageTk
 
 from .windows import criar_janela_centrada_custom
 from .splash import mostrar_splash_custom
-from ..data.loaders import carregar_cartas, carregar_cavalas
+from .animacao import PlayerAnimacao
+from ..data.loaders import carregar_cartas, carregar_cavalas, relatorio_tempos
+from ..data.watcher import RecarregadorCatalogo, aplicar_mudancas
 from .uma_app import UmaApp
-from ..data.paths import asset_path
+from ..data.paths import asset_path, cache_path
+from ..data.animacoes import cache_animacoes
 
 ICON_ICO = asset_path("icon_geral", "uma_icon.ico")
 SOUNDS = asset_path("sounds")
@@ -24,6 +27,7 @@ FONTE_TIT = ("Arial", 16, "bold")
 FONTE_BTN = ("Arial", 11, "bold")
 
 SPLASH_DUR_MS = 5000
+RELOAD_INTERVALO_MS = 1500
 
 SND_MAIN = os.path.join(SOUNDS, "menu_1.wav")
 SND_MAIN_R1 = os.path.join(SOUNDS, "menu_raro_1.wav")
@@ -83,34 +87,20 @@ def _carregar_gif_aleatorio(parent, largura=700, altura=400):
     arquivos = [p for p in arquivos if any(p.endswith(f"main_menu_{i}.gif") for i in range(1, 13))]
     if not arquivos:
         return None
+    caminho = random.choice(arquivos)
+    # os outros gifs vão sendo pré-renderizados pra próxima vez que o menu aparecer; só a primeira
+    # chamada do processo cria a thread, e só gera pacote que falta ou está velho. o gif que está
+    # tocando vai por último: até lá o próprio player já gravou o pacote dele
+    outros = [p for p in arquivos if p != caminho]
+    cache_animacoes.preparar_em_segundo_plano(outros + [caminho], largura, altura)
     try:
-        pil = Image.open(random.choice(arquivos))
-        frames, durations = [], []
-        try:
-            while True:
-                frm = pil.convert("RGBA").copy()
-                frm.thumbnail((largura, altura), Image.Resampling.LANCZOS)
-                frames.append(frm)
-                dur = pil.info.get("duration", 80)
-                durations.append(max(20, int(dur)))
-                pil.seek(pil.tell() + 1)
-        except EOFError:
-            pass
-        if not frames:
-            return None
-        tk_frames = [ImageTk.PhotoImage(f, master=parent) for f in frames]
-        lbl = tk.Label(parent, bg=COR_BG, bd=0, highlightthickness=0)
-        lbl.pack()
-        def anim(idx=0):
-            if not lbl.winfo_exists():
-                return
-            lbl.config(image=tk_frames[idx])
-            lbl.image = tk_frames[idx]
-            next_idx = (idx + 1) % len(tk_frames)
-            delay = durations[idx] if idx < len(durations) else 80
-            lbl.after(delay, anim, next_idx)
-        anim(0)
-        return lbl
+        # quadros em streaming numa thread (app/animacao.py); vêm do pacote pré-renderizado se existir
+        player = PlayerAnimacao(
+            parent, lambda: cache_animacoes.quadros(caminho, largura, altura),
+            bg=COR_BG, bd=0, highlightthickness=0
+        )
+        player.label.pack()
+        return player.label
     except Exception as e:
         print(f"[AVISO] Falha ao carregar GIF: {e}")
         return None
@@ -198,6 +188,7 @@ def _construir_trainer(root, content, estado):
     dummy_app = UmaApp(root, body, estado["cartas"], estado["cavalas"])
 
     def voltar():
+        estado["app"] = None
         for w in content.winfo_children():
             w.destroy()
         _mostrar_menu(root, content, estado)
@@ -217,6 +208,7 @@ def _construir_trainer(root, content, estado):
         w.destroy()
 
     app = UmaApp(root, body, estado["cartas"], estado["cavalas"])
+    estado["app"] = app
     app.mostrar()
     try:
         if not getattr(app, "cavala_selecionada", None) and not getattr(app, "deck", None) and not getattr(app, "carta_avulsa", None):
@@ -224,14 +216,50 @@ def _construir_trainer(root, content, estado):
     except Exception:
         pass
 
+def _vigiar_catalogo(root, estado):
+    # hot-reload: verifica cartas/ e cavalas/ e empurra as mudanças pro trainer aberto
+    recarregador = estado.get("recarregador")
+    if recarregador is not None:
+        try:
+            mudancas = recarregador.verificar()
+            if mudancas:
+                app = estado.get("app")
+                if app is not None:
+                    app.atualizar_catalogo(mudancas)
+                else:
+                    aplicar_mudancas(estado["cartas"], mudancas.get("cartas", {}))
+                    aplicar_mudancas(estado["cavalas"], mudancas.get("cavalas", {}))
+        except Exception as e:
+            print(f"[RELOAD] Falha ao recarregar catálogo: {e}")
+    try:
+        root.after(RELOAD_INTERVALO_MS, _vigiar_catalogo, root, estado)
+    except tk.TclError:
+        pass
+
 def main():
-    estado = {"cartas": {}, "cavalas": {}}
+    estado = {"cartas": {}, "cavalas": {}, "app": None, "recarregador": None}
 
     def carregar_dados():
         try:
-            estado["cartas"] = carregar_cartas(asset_path("cartas"))
-            estado["cavalas"] = carregar_cavalas(asset_path("cavalas"))
-            print(f"[DADOS] cartas: {len(estado['cartas'])} | cavalas: {len(estado['cavalas'])}")
+            tempos = {}
+            origens_cartas, origens_cavalas = {}, {}
+            t0 = time.perf_counter()
+            # o observador é criado antes da leitura: o que mudar durante o load é relido depois
+            recarregador = RecarregadorCatalogo(asset_path("cartas"), asset_path("cavalas"))
+            estado["cartas"] = carregar_cartas(
+                asset_path("cartas"), paralelo=True, tempos=tempos, snapshot=cache_path("cartas.snapshot"),
+                origens=origens_cartas
+            )
+            estado["cavalas"] = carregar_cavalas(
+                asset_path("cavalas"), paralelo=True, tempos=tempos, snapshot=cache_path("cavalas.snapshot"),
+                origens=origens_cavalas
+            )
+            recarregador.registrar_origens("cartas", origens_cartas)
+            recarregador.registrar_origens("cavalas", origens_cavalas)
+            estado["recarregador"] = recarregador
+            print(f"[DADOS] cartas: {len(estado['cartas'])} | cavalas: {len(estado['cavalas'])} "
+                  f"| {(time.perf_counter() - t0) * 1000:.1f} ms")
+            relatorio_tempos(tempos)
         except Exception as e:
             print(f"[ERRO] Falha ao carregar dados: {e}")
             estado["cartas"], estado["cavalas"] = {}, {}
@@ -264,6 +292,7 @@ def main():
             except Exception:
                 pass
             _mostrar_menu(root, content, estado)
+            root.after(RELOAD_INTERVALO_MS, _vigiar_catalogo, root, estado)
         _quando_pronto()
 
     mostrar_splash_custom(
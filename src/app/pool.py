@@ -0,0 +1,59 @@
+# Notas:
+# - Pool de widgets recicláveis (linhas da lista de eventos, resultados da busca global).
+#   Quem usa pega um widget pronto com pegar(tipo, master), preenche com os dados novos e devolve
+#   com devolver(widget) quando a linha sai da tela; nada é destruído ao trocar de carta/cavala
+#   ou ao filtrar.
+# - criar(tipo, master) só roda quando não há sobra daquele (tipo, master).
+# - Limite: no máximo `limite` widgets parados (somando os tipos); devolver além disso destrói o
+#   widget e devolve False, pra quem chamou esquecer dele.
+# - Métricas em estatisticas(): criados, reusados, descartados, livres.
+
+LIMITE_POOL = 96
+
+
+class PoolWidgets:
+    def __init__(self, criar, limite=LIMITE_POOL):
+        self._criar = criar
+        self.limite = limite
+        self._livres = {}     # (tipo, master) -> [widget]
+        self._origem = {}     # widget -> (tipo, master)
+        self._n_livres = 0
+        self.criados = 0
+        self.reusados = 0
+        self.descartados = 0
+
+    def pegar(self, tipo, master):
+        livres = self._livres.get((tipo, master))
+        if livres:
+            self._n_livres -= 1
+            self.reusados += 1
+            return livres.pop()
+        widget = self._criar(tipo, master)
+        self._origem[widget] = (tipo, master)
+        self.criados += 1
+        return widget
+
+    def devolver(self, widget):
+        # True = guardado pra reuso; False = destruído (pool cheio)
+        origem = self._origem.get(widget)
+        if origem is None:
+            return False
+        if self._n_livres >= self.limite:
+            del self._origem[widget]
+            self.descartados += 1
+            widget.destroy()
+            return False
+        self._livres.setdefault(origem, []).append(widget)
+        self._n_livres += 1
+        return True
+
+    def possui(self, widget):
+        return widget in self._origem
+
+    def tipo(self, widget):
+        origem = self._origem.get(widget)
+        return origem[0] if origem else None
+
+    def estatisticas(self):
+        return {"criados": self.criados, "reusados": self.reusados,
+                "descartados": self.descartados, "livres": self._n_livres}
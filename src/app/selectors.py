@@ -1,7 +1,6 @@
 import os
 import tkinter as tk
 from tkinter import ttk
-from PIL import Image, ImageTk, ImageOps
 
 # Notas:
 # - Seletor de cavala e seletor de cartas (deck e avulsa) extraídos da UmaApp.
@@ -10,22 +9,61 @@ from PIL import Image, ImageTk, ImageOps
 
 from .widgets import criar_painel_arredondado, criar_botao_arredondado
 from ..data.paths import BASE
+from .imagens import cache_imagens, FUNDO_ICONES
+from ..data.atlas import atlas
+from .grade import GradeVirtual
 from .windows import criar_toplevel_custom
 
+# célula do seletor de cartas: botão 96x96 + nome em até 2 linhas
+LARGURA_CELULA = 170
+ALTURA_CELULA = 150
+
 def abrir_seletor_cavala(app):
+    # a janela é montada uma vez e só escondida ao fechar/escolher; reabrir = mostrar de novo
+    # e atualizar a marcação da cavala escolhida. só é remontada se o catálogo de cavalas mudou
+    # (app.versao_cavalas, incrementada no hot-reload)
     if app.janela_cavala_aberta:
         return
+    seletor = getattr(app, "_seletor_cavala", None)
+    versao = getattr(app, "versao_cavalas", 0)
+    if seletor is not None:
+        try:
+            valido = seletor["win"].winfo_exists() and seletor["versao"] == versao
+        except tk.TclError:
+            valido = False
+        if not valido:
+            try:
+                seletor["win"].destroy()
+            except tk.TclError:
+                pass
+            seletor = None
+    if seletor is None:
+        seletor = app._seletor_cavala = _montar_seletor_cavala(app, versao)
+
+    win = seletor["win"]
     app.janela_cavala_aberta = True
+    win.deiconify()
+    win.lift()
+    win.transient(app.root)
+    win.grab_set()
+    win.focus_force()
+    seletor["marcar"](app.cavala_selecionada)
+
 
+def _ao_fechar_cavala(app):
+    app.janela_cavala_aberta = False
+    atlas.descarregar()   # os ícones já estão nos botões; a folha decodificada não precisa ficar
+
+
+def _montar_seletor_cavala(app, versao):
     largura = 1245
     altura = 715
     win, win_content, _fechar = criar_toplevel_custom(
         app.root, largura, altura, "Selecione sua Cavala",
-        on_close=lambda: setattr(app, "janela_cavala_aberta", False)
+        on_close=lambda: _ao_fechar_cavala(app), esconder_ao_fechar=True
     )
-    win.transient(app.root)
-    win.grab_set()
-    win.focus_force()
+    # a janela escondida morre junto com a tela do trainer
+    app.top_bar.bind("<Destroy>", lambda e: win.destroy() if e.widget is app.top_bar and win.winfo_exists() else None, add="+")
 
     painel_canvas, grade_frame, _ = criar_painel_arredondado(
         win_content, fill='#505050', outline='#6a6a6a', radius=16, pad=10, min_height=670, pady=(10, 10), padx=10
@@ -107,16 +145,13 @@ def abrir_seletor_cavala(app):
         btn.pack()
         app.btn_cavala = btn
 
+    botoes = {}   # nome -> botão, pra marcar a escolhida sem remontar nada
+
     for nome, dados in app.cv.items():
-        caminho_img = os.path.join(BASE, dados.get("imagem", ""))
+        caminho_img = os.path.join(BASE, dados.imagem or "")
         try:
-            from PIL import Image
-            pil_img = Image.open(caminho_img).convert("RGBA")
-            # ADICIONE ESTA LINHA:
-            pil_img = pil_img.resize((96, 96), Image.Resampling.LANCZOS)
-            bg = Image.new("RGBA", pil_img.size, "#505050")
-            pil_img = Image.alpha_composite(bg, pil_img)
-            img = ImageTk.PhotoImage(pil_img)
+            # miniatura 96x96 já composta no fundo, do cache compartilhado (imagens.py)
+            par = cache_imagens.adquirir(caminho_img, (96, 96), FUNDO_ICONES)
         except Exception as e:
             print(f"Erro ao carregar imagem de {nome}: {e}")
             continue
@@ -125,19 +160,18 @@ def abrir_seletor_cavala(app):
             app.cavala_selecionada = n
             atualizar_botao_cavala(f"Cavala selecionada: {n}", largura=220)
             app.mostrar()
-            try:
-                win.destroy()
-            finally:
-                app.janela_cavala_aberta = False
+            _fechar()   # esconde (esconder_ao_fechar) e libera o flag via on_close
 
         frame_interno = tk.Frame(frame, bg='#505050')
         frame_interno.grid(row=linha, column=coluna, padx=10, pady=10)
 
         btn = tk.Button(
-            frame_interno, image=img, command=selecionar_cavala,
-            borderwidth=0, highlightthickness=0, bg='#1a1a1a', activebackground='#333333'
+            frame_interno, image=par.colorida, command=selecionar_cavala,
+            borderwidth=0, highlightthickness=3, highlightbackground='#505050', highlightcolor='#505050',
+            bg='#1a1a1a', activebackground='#333333'
         )
-        btn.image = img
+        cache_imagens.prender(btn, par)
+        botoes[nome] = btn
         btn.pack()
         tk.Label(frame_interno, text=nome, fg='white', bg='#505050').pack()
 
@@ -146,9 +180,22 @@ def abrir_seletor_cavala(app):
             coluna = 0
             linha += 1
 
+    marcada = {"nome": None}
+
+    def marcar(nome):
+        # só mexe nos dois botões envolvidos (a escolhida antes e a de agora)
+        if marcada["nome"] == nome:
+            return
+        for n, cor in ((marcada["nome"], '#505050'), (nome, '#ffff99')):
+            btn = botoes.get(n)
+            if btn is not None:
+                btn.config(highlightbackground=cor, highlightcolor=cor)
+        marcada["nome"] = nome
+
+    return {"win": win, "versao": versao, "marcar": marcar}
+
 
 def abrir_seletor_cartas(app, limite, ao_confirmar):
-    app.root.update_idletasks()
     scr_h = app.root.winfo_screenheight()
     largura = 1245
     altura = min(715, scr_h - 120)
@@ -158,6 +205,7 @@ def abrir_seletor_cartas(app, limite, ao_confirmar):
             app.janela_cartas_aberta = False
         else:
             app.janela_avulsa_aberta = False
+        atlas.descarregar()   # solta a folha do atlas; as imagens em uso ficam em cache_imagens
 
     win, win_content, fechar = criar_toplevel_custom(
         app.root, largura, altura, "Selecione seu deck", on_close=_on_close_flag
@@ -206,34 +254,30 @@ def abrir_seletor_cartas(app, limite, ao_confirmar):
     )
     btn_confirm.grid(row=1, column=1, padx=8, pady=(0, 8))
 
-    canvas = tk.Canvas(conteiner_grade, bg='#505050', highlightthickness=0)
-    scrollbar = ttk.Scrollbar(conteiner_grade, orient="vertical", command=canvas.yview)
-    canvas.configure(yscrollcommand=scrollbar.set)
-    canvas.pack(side="left", fill="both", expand=True, padx=(6, 6), pady=6)
+    # uma aba (Canvas + GradeVirtual) por tipo, montada na primeira visita e mantida até a janela
+    # fechar: trocar de aba só esconde uma e mostra a outra (mesmas células, imagens e rolagem)
+    scrollbar = ttk.Scrollbar(conteiner_grade, orient="vertical")
     scrollbar.pack(side="right", fill="y", pady=6)
+    abas = {}                  # tipo -> {"canvas", "grade", "indices": card_id -> índice na grade}
+    ativa = {"tipo": None}
 
-    conteudo_frame = tk.Frame(canvas, bg='#505050')
-    id_janela = canvas.create_window((0, 0), window=conteudo_frame, anchor='nw')
-
-    def on_configure(event):
-        canvas.configure(scrollregion=canvas.bbox("all"))
-    conteudo_frame.bind("<Configure>", on_configure)
-
-    def on_canvas_configure(event):
-        canvas.itemconfig(id_janela, width=event.width)
-    canvas.bind("<Configure>", on_canvas_configure)
+    def canvas_ativo():
+        aba = abas.get(ativa["tipo"])
+        return aba["canvas"] if aba else None
 
     def sync_canvas_height_cartas(event=None):
         h = getattr(painel_grade_canvas, "_round_inner_height", 400)
         altura_util = max(200, h - 24)
-        canvas.config(height=altura_util)
+        for aba in abas.values():
+            aba["canvas"].config(height=altura_util)
     painel_grade_canvas.bind("<Configure>", sync_canvas_height_cartas)
     conteiner_grade.bind("<Configure>", sync_canvas_height_cartas)
     win.bind("<Configure>", sync_canvas_height_cartas)
     win.after(0, sync_canvas_height_cartas)
 
     def _on_mousewheel(event):
-        if hasattr(event, "delta") and event.delta:
+        canvas = canvas_ativo()
+        if canvas and hasattr(event, "delta") and event.delta:
             up = event.delta > 0
             top, bottom = canvas.yview()
             if up and top <= 0.0:
@@ -243,131 +287,164 @@ def abrir_seletor_cartas(app, limite, ao_confirmar):
             canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
             return "break"
     def _on_button4(event):
+        canvas = canvas_ativo()
+        if canvas is None:
+            return "break"
         top, _ = canvas.yview()
         if top <= 0.0:
             return "break"
         canvas.yview_scroll(-1, "units")
         return "break"
     def _on_button5(event):
+        canvas = canvas_ativo()
+        if canvas is None:
+            return "break"
         _, bottom = canvas.yview()
         if bottom >= 1.0:
             return "break"
         canvas.yview_scroll(1, "units")
         return "break"
     def _bind_wheel(_):
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
-        canvas.bind_all("<Button-4>")
-        canvas.bind_all("<Button-5>")
+        win.bind_all("<MouseWheel>", _on_mousewheel)
+        win.bind_all("<Button-4>")
+        win.bind_all("<Button-5>")
     def _unbind_wheel(_):
-        canvas.unbind_all("<MouseWheel>")
-        canvas.unbind_all("<Button-4>")
-        canvas.unbind_all("<Button-5>")
-    canvas.bind("<Enter>", _bind_wheel)
-    canvas.bind("<Leave>", _unbind_wheel)
+        win.unbind_all("<MouseWheel>")
+        win.unbind_all("<Button-4>")
+        win.unbind_all("<Button-5>")
 
     app.botoes_cartas = {}
 
-    def extrair_raridade(nome_arquivo):
-        if nome_arquivo.endswith("_SSR.png"):
-            return 0
-        elif nome_arquivo.endswith("_SR.png"):
-            return 1
-        elif nome_arquivo.endswith("_R.png"):
-            return 2
-        return 3
-
-    def mostrar_cartas_por_tipo(tipo):
-        for widget in conteudo_frame.winfo_children():
-            widget.destroy()
-
-        inner_grade_wrap = tk.Frame(conteudo_frame, bg=conteudo_frame['bg'])
-        inner_grade_wrap.pack(fill='x', pady=4)
-
-        inner_grade = tk.Frame(inner_grade_wrap, bg=conteudo_frame['bg'])
-        inner_grade.pack(anchor='center')
-
-        linha = 0
-        coluna = 0
-        max_colunas = 6
-
+    ordem_raridade = {"SSR": 0, "SR": 1, "R": 2}
+    def extrair_raridade(dados):
+        # raridade já vem no cabeçalho da carta (ver loaders._cabecalho)
+        return ordem_raridade.get(dados.raridade, 3)
+
+    # grade virtualizada (grade.py): só as linhas visíveis (+ overscan) têm widgets, e as células
+    # são reaproveitadas ao rolar e ao trocar de aba. a imagem de cada carta vem em segundo plano
+    # (imagens.pedir); até lá a célula mostra o placeholder
+    try:
+        placeholder = cache_imagens.prender(conteiner_grade, cache_imagens.placeholder((96, 96), FUNDO_ICONES))
+        img_placeholder = placeholder.colorida
+    except Exception as e:
+        print(f"Erro ao carregar placeholder: {e}")
+        img_placeholder = ''
+
+    def carta_selecionada(cid):
+        return (limite > 1 and cid in app.deck) or (limite == 1 and app.carta_avulsa == cid)
+
+    def atualizar_celula(cell):
+        par = cell.par
+        cell.btn.config(image=(par.colorida if carta_selecionada(cell.card_id) else par.cinza) if par else img_placeholder)
+
+    def alternar_carta(cell):
+        cid = cell.card_id
+        if limite > 1:
+            if cid in app.deck:
+                app.deck.remove(cid)
+            elif len(app.deck) < limite:
+                app.deck.append(cid)
+        else:
+            app.carta_avulsa = None if app.carta_avulsa == cid else cid
+        sincronizar_selecao()
+        app._remover_dica_inicial()
+        app.mostrar()
+        atualiza_contador()
+        if (limite > 1 and len(app.deck) == limite) or (limite == 1 and app.carta_avulsa):
+            win.after(300, lambda: (ao_confirmar(), _close_and_reset()))
+
+    def soltar_celula(cell):
+        if cell.par is not None:
+            cache_imagens.liberar(cell.par)
+            cell.par = None
+
+    def criar_celula(master):
+        cell = tk.Frame(master, bg='#505050')
+        cell.card_id = None
+        cell.par = None
+        cell.btn = tk.Button(
+            cell, image=img_placeholder, borderwidth=0, highlightthickness=0,
+            bg='#1a1a1a', activebackground='#333333', command=lambda: alternar_carta(cell)
+        )
+        cell.btn.pack(pady=(10, 0))
+        cell.lbl = tk.Label(cell, fg='white', bg='#505050', wraplength=LARGURA_CELULA - 12, justify='center')
+        cell.lbl.pack()
+        # célula só é destruída junto com a janela: devolve a imagem que estiver segurando
+        cell.bind("<Destroy>", lambda e: soltar_celula(cell) if e.widget is cell else None, add="+")
+        return cell
+
+    def preencher_celula(cell, item):
+        card_id, dados = item
+        if cell.card_id == card_id:
+            atualizar_celula(cell)
+            return
+        soltar_celula(cell)
+        cell.card_id = card_id
+        cell.lbl.config(text=dados.nome or "Carta")
+        atualizar_celula(cell)
+
+        def ao_pronto(par, cid=card_id):
+            if cell.card_id != cid:   # a célula já foi reaproveitada pra outra carta
+                cache_imagens.liberar(par)
+                return
+            cell.par = par
+            atualizar_celula(cell)
+        cache_imagens.pedir(cell, os.path.join(BASE, card_id), (96, 96), FUNDO_ICONES, ao_pronto, vincular=False)
+
+    def selecao_atual():
+        return set(app.deck) if limite > 1 else ({app.carta_avulsa} if app.carta_avulsa else set())
+
+    selecao_exibida = selecao_atual()
+
+    def sincronizar_selecao():
+        # aplica nas abas já montadas só o que mudou na seleção (colorida <-> cinza)
+        nonlocal selecao_exibida
+        atual = selecao_atual()
+        for cid in atual ^ selecao_exibida:
+            for aba in abas.values():
+                indice = aba["indices"].get(cid)
+                if indice is not None:
+                    aba["grade"].atualizar_item(indice)
+        selecao_exibida = atual
+
+    def montar_aba(tipo):
+        canvas = tk.Canvas(conteiner_grade, bg='#505050', highlightthickness=0)
+        canvas.bind("<Enter>", _bind_wheel)
+        canvas.bind("<Leave>", _unbind_wheel)
+        grade = GradeVirtual(
+            canvas, colunas=6, largura_celula=LARGURA_CELULA, altura_celula=ALTURA_CELULA,
+            criar_celula=criar_celula, preencher=preencher_celula, soltar=soltar_celula, scrollbar=scrollbar
+        )
         cartas_filtradas = [
             (card_id, dados) for card_id, dados in app.c.items()
-            if tipo in card_id
+            if dados.tipo == tipo
         ]
-        cartas_ordenadas = sorted(cartas_filtradas, key=lambda item: extrair_raridade(item[0]))
-
+        cartas_ordenadas = sorted(cartas_filtradas, key=lambda item: extrair_raridade(item[1]))
         for card_id, dados in cartas_ordenadas:
-            img_path = os.path.join(BASE, card_id)
-            nome = dados.get("nome", "Carta")
-            try:
-                pil_image = Image.open(img_path).convert("RGBA")
-                # ADICIONE ESTA LINHA:
-                pil_image = pil_image.resize((96, 96), Image.Resampling.LANCZOS)
-                bg = Image.new("RGBA", pil_image.size, "#505050")
-                pil_image_colorida = Image.alpha_composite(bg, pil_image)
-                pil_image_cinza = ImageOps.grayscale(pil_image_colorida.convert("RGB"))
-                img_colorida = ImageTk.PhotoImage(pil_image_colorida)
-                img_cinza = ImageTk.PhotoImage(pil_image_cinza)
-            except Exception as e:
-                print(f"Erro ao carregar imagem da carta {nome}: {e}")
-                continue
-
             app.card_by_id[card_id] = dados
-            app.name_by_id[card_id] = nome
-
-            def alternar_carta_normal(cid=card_id, btn_ref=None, colorida=None, cinza=None):
-                if cid in app.deck:
-                    app.deck.remove(cid)
-                    btn_ref.config(image=cinza); btn_ref.image = cinza
-                elif len(app.deck) < limite:
-                    app.deck.append(cid)
-                    btn_ref.config(image=colorida); btn_ref.image = colorida
-                app._remover_dica_inicial()
-                app.mostrar()
-                atualiza_contador()
-                if len(app.deck) == limite:
-                    win.after(300, lambda: (ao_confirmar(), _close_and_reset()))
-
-            def alternar_carta_avulsa(cid=card_id, btn_ref=None, colorida=None, cinza=None):
-                if app.carta_avulsa == cid:
-                    app.carta_avulsa = None
-                    btn_ref.config(image=cinza); btn_ref.image = cinza
-                else:
-                    app.carta_avulsa = cid
-                    btn_ref.config(image=colorida); btn_ref.image = colorida
-                app._remover_dica_inicial()
-                app.mostrar()
-                atualiza_contador()
-                if app.carta_avulsa:
-                    win.after(300, lambda: (ao_confirmar(), _close_and_reset()))
-
-            cell = tk.Frame(inner_grade, bg='#505050')
-            cell.grid(row=linha, column=coluna, padx=10, pady=10)
-
-            selecionada = ((limite > 1 and card_id in app.deck) or
-                           (limite == 1 and app.carta_avulsa == card_id))
-            imagem = img_colorida if selecionada else img_cinza
+            app.name_by_id[card_id] = dados.nome or "Carta"
+        abas[tipo] = {"canvas": canvas, "grade": grade,
+                      "indices": {cid: i for i, (cid, _) in enumerate(cartas_ordenadas)}}
+        return cartas_ordenadas
 
-            btn = tk.Button(
-                cell, image=imagem, borderwidth=0, highlightthickness=0,
-                bg='#1a1a1a', activebackground='#333333'
-            )
-            btn.image = imagem
-            btn.pack()
-            tk.Label(cell, text=nome, fg='white', bg='#505050').pack()
-
-            if limite > 1:
-                btn.config(command=lambda cid=card_id, b=btn, c=img_colorida, g=img_cinza: alternar_carta_normal(cid, b, c, g))
-            else:
-                btn.config(command=lambda cid=card_id, b=btn, c=img_colorida, g=img_cinza: alternar_carta_avulsa(cid, b, c, g))
-
-            coluna += 1
-            if coluna >= max_colunas:
-                coluna = 0
-                linha += 1
-
-        canvas.update_idletasks()
-        canvas.yview_moveto(0)
+    def mostrar_cartas_por_tipo(tipo):
+        if ativa["tipo"] == tipo:
+            return
+        anterior = canvas_ativo()
+        if anterior is not None:
+            anterior.pack_forget()
+        nova = tipo not in abas
+        cartas = montar_aba(tipo) if nova else None
+        ativa["tipo"] = tipo
+        aba = abas[tipo]
+        aba["canvas"].pack(side="left", fill="both", expand=True, padx=(6, 6), pady=6)
+        scrollbar.config(command=aba["canvas"].yview)
+        sync_canvas_height_cartas()
+        if nova:
+            aba["grade"].definir_itens(cartas)
+        else:
+            scrollbar.set(*aba["canvas"].yview())
+            sincronizar_selecao()
 
     tipos = ['speed', 'wisdom', 'power', 'stamina', 'guts', 'pal']
     for tipo in tipos:
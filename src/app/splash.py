@@ -5,6 +5,8 @@ import random
 import tkinter as tk
 from PIL import Image, ImageTk
 
+from .animacao import agendador_de
+
 def _carregar_e_tocar_wav(caminho):
     try:
         import sys
@@ -87,17 +89,12 @@ def mostrar_splash_custom(
     lbl_loading = tk.Label(cont, text="Carregando", fg="#e0e0e0", bg="#2b2b2b", font=("Arial", 11))
     lbl_loading.pack(pady=(0, 6))
     dots = {"n": 0}
-    anim_id = {"id": None}
-    def anim():
-        if not splash.winfo_exists():
-            return
+    def anim(atraso_ms):
         dots["n"] = (dots["n"] + 1) % 4
-        try:
-            lbl_loading.config(text="Carregando" + "." * dots["n"])
-        except tk.TclError:
-            return
-        anim_id["id"] = splash.after(300, anim)
-    anim_id["id"] = splash.after(300, anim)
+        lbl_loading.config(text="Carregando" + "." * dots["n"])
+        return 300
+    # roda no agendador compartilhado (app/animacao.py), não numa cadeia de after própria
+    anim_id = {"id": agendador_de(splash).registrar(lbl_loading, anim, 300)}
 
     rodape = tk.Frame(cont, bg="#2b2b2b")
     rodape.pack(side="bottom", fill="x", pady=(0, 10))
@@ -111,11 +108,7 @@ def mostrar_splash_custom(
             threading.Thread(target=_carregar_e_tocar_wav, args=(som,), daemon=True).start()
 
     def fechar_splash():
-        try:
-            if anim_id["id"] is not None:
-                splash.after_cancel(anim_id["id"])
-        except Exception:
-            pass
+        anim_id["id"].cancelar()
         try:
             splash.destroy()
         except Exception:
@@ -1,7 +1,8 @@
 import os
+import math
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox
-from PIL import Image, ImageTk, ImageOps
 
 # Notas:
 # - Classe principal do "CAVALA Trainer".
@@ -17,7 +18,16 @@ from .widgets import (
     desenhar_roundrect,
 )
 from .selectors import abrir_seletor_cavala, abrir_seletor_cartas
+from .imagens import cache_imagens, FUNDO_ICONES
+from .grade import ListaVirtual
+from .pool import PoolWidgets
 from ..data.paths import BASE
+from ..data.watcher import aplicar_mudancas
+from ..data.busca import MODO_PREFIXO, MODO_CONTEM, MODO_APROXIMADO, BuscaIncremental, IndiceGlobal
+from ..data.eventos import ler_eventos
+
+POR_PAGINA_GLOBAL = 25
+DEBOUNCE_BUSCA_MS = 120  # espera a digitação parar antes de refazer a lista de eventos
 
 
 class UmaApp:
@@ -29,9 +39,9 @@ class UmaApp:
         # Adicionei esta linha junto com outras flags já existentes
         self._ultima_selecao_avulsa = None
 
-        # self.c: mapeia card_id (imagem relativa) -> dados (dict da carta)
+        # self.c: mapeia card_id (imagem relativa) -> Carta (ver data/catalogo.py)
         self.c = cartas_data
-        # self.cv: mapeia nome -> dados da cavala
+        # self.cv: mapeia nome -> Cavala
         self.cv = cavalas_data
 
         # estado atual de seleção
@@ -120,6 +130,26 @@ class UmaApp:
         )
         self.btn_clear_search.pack(side='left')
 
+        # modo do filtro: prefixo do título (padrão), "contém" ou aproximado (tolera erro de digitação)
+        self.modo_filtro = MODO_PREFIXO
+        self.btn_modo_busca = tk.Button(
+            self.search_frame, text=self._rotulo_modo_filtro(), width=11, command=self._alternar_modo_filtro,
+            fg='white', bg='#1a1a1a', activebackground='#333333', activeforeground='white', bd=0
+        )
+        self.btn_modo_busca.pack(side='left', padx=(6, 0))
+
+        # busca global: procura em todas as cartas/cavalas (índice montado na primeira vez)
+        self._busca_global = False
+        self._indice_global = None
+        self._indice_global_montando = None   # (thread, resultado) enquanto monta
+        self._indice_global_pendente = []     # mudanças de hot-reload que chegaram durante a montagem
+        self._pagina_global = 0
+        self.btn_busca_global = tk.Button(
+            self.search_frame, text="Global: off", width=10, command=self._alternar_busca_global,
+            fg='white', bg='#1a1a1a', activebackground='#333333', activeforeground='white', bd=0
+        )
+        self.btn_busca_global.pack(side='left', padx=(6, 0))
+
         right_spacer = tk.Frame(self.search_frame, bg='#606060')
         right_spacer.pack(side='left', expand=True)
 
@@ -141,10 +171,14 @@ class UmaApp:
         self.search_entry.bind("<FocusIn>", _remove_placeholder)
         self.search_entry.bind("<FocusOut>", lambda e: _apply_placeholder())
 
+        # digitação: junta as teclas numa janela de DEBOUNCE_BUSCA_MS e só então filtra
+        self._filtro_agendado = None
+        self._busca_incremental = None   # ((arquivo, assinatura, modo), BuscaIncremental)
+
         def _on_type(*_):
             if not self._search_active:
                 return
-            self._aplicar_filtro_eventos()
+            self._agendar_filtro_eventos()
         self.search_var.trace_add("write", lambda *args: _on_type())
 
         _apply_placeholder()
@@ -175,13 +209,27 @@ class UmaApp:
 
 
         def on_frame_configure(event):
-            self.canvas_eventos.configure(scrollregion=self.canvas_eventos.bbox("all"))
+            if not self.lista_eventos.itens:   # com a lista virtual ativa, ela é quem manda na scrollregion
+                self._ajustar_scroll_wrapper()
         self.wrapper_eventos.bind("<Configure>", on_frame_configure)
 
         def on_canvas_configure(event):
             self.canvas_eventos.itemconfig(self.wrapper_id, width=event.width)
         self.canvas_eventos.bind("<Configure>", on_canvas_configure)
 
+        # eventos do item selecionado: lista virtual direto no canvas (só as linhas na vista têm widget);
+        # wrapper_eventos/frame_eventos ficam pra dica inicial e resultados da busca global
+        self._evento_aberto = None    # chave da linha aberta (sobrevive à reciclagem dos widgets)
+        self._largura_evento = None   # largura pedida pelo botão de um EventoExpandivel
+        # linhas (categoria, evento, resultado global) vêm de um pool só, reaproveitado entre
+        # seleções, filtros e páginas da busca global (ver app/pool.py)
+        self.pool_linhas = PoolWidgets(self._criar_linha_evento)
+        self._resultados_exibidos = []   # botões da busca global emprestados do pool
+        self.lista_eventos = ListaVirtual(
+            self.canvas_eventos, self.pool_linhas, self._preencher_linha_evento,
+            scrollbar=self.scroll_eventos, largura=self._largura_linha_evento,
+        )
+
         # binds de scroll com limites
         def on_mousewheel(event):
             try:
@@ -234,9 +282,9 @@ class UmaApp:
         self.root.bind("<Button-5>", on_button5, add="+")
 
         # estruturas de controle
-        self.imagens_exibidas = {}
+        self.imagens_exibidas = {}   # chave do slot -> botão da imagem (ver _reconciliar_barra)
+        self._slots_barra = None     # chave -> (assinatura, slot); None até o primeiro mostrar()
         self.evento_expandido_atual = None
-        self.img_refs = {}
         self.selecionado = None
 
         # dica inicial
@@ -245,11 +293,15 @@ class UmaApp:
 
         # flags para janelas seletoras
         self.janela_cavala_aberta = False
+        self._seletor_cavala = None   # janela reaproveitada (ver selectors.abrir_seletor_cavala)
+        self.versao_cavalas = 0       # muda quando o catálogo de cavalas muda (hot-reload)
         self.janela_cartas_aberta = False
         self.janela_avulsa_aberta = False
 
         # cache do estado de eventos
         self._estado_eventos_cache = {"selecionado": None, "filtro": ""}
+        # dono da lista de eventos exibida (ver _renderizar_linhas)
+        self._linhas_dono = None
 
         if not self.cv:
             messagebox.showwarning("Aviso", "Nenhuma cavala encontrada em 'cavalas/'.")
@@ -283,16 +335,72 @@ class UmaApp:
             self.janela_avulsa_aberta = False
         self._abrir_seletor_cartas_base(limite=1, ao_confirmar=ao_confirmar)
 
+    # hot-reload do catálogo (chamado pelo menu quando cartas/ ou cavalas/ mudam)
+    def atualizar_catalogo(self, mudancas):
+        # mudancas: {"cartas": {card_id: dados | None}, "cavalas": {nome: dados | None}}
+        cartas = mudancas.get("cartas", {})
+        cavalas = mudancas.get("cavalas", {})
+
+        # nomes exibidos na barra superior antes da mudança (pra saber se precisa redesenhar)
+        def _nome(catalogo, chave):
+            item = catalogo.get(chave)
+            return item.nome if item else None
+        exibidas = [cid for cid in self.deck + [self.carta_avulsa] if cid in cartas]
+        nomes_antes = {cid: _nome(self.c, cid) for cid in exibidas}
+
+        aplicar_mudancas(self.c, cartas)
+        aplicar_mudancas(self.cv, cavalas)
+        if cavalas:
+            self.versao_cavalas += 1   # seletor de cavala é remontado na próxima abertura
+        self._atualizar_indice_global(cartas, cavalas)
+        for cid in cartas:
+            self.card_by_id.pop(cid, None)
+            self.name_by_id.pop(cid, None)
+
+        # itens removidos saem da seleção
+        redesenhar = any(_nome(self.c, cid) != nome for cid, nome in nomes_antes.items())
+        if self.cavala_selecionada and self.cavala_selecionada not in self.cv:
+            self.cavala_selecionada = None
+            for w in self.slot_cavala.winfo_children():
+                w.destroy()
+            self.btn_cavala = self.criar_botao_arredondado(
+                self.slot_cavala, "Escolha sua cavala", comando=self.abrir_seletor_cavala, min_w=180, min_h=40
+            )
+            self.btn_cavala.pack()
+            redesenhar = True
+        self.deck = [cid for cid in self.deck if cid in self.c]
+        if self.carta_avulsa and self.carta_avulsa not in self.c:
+            self.carta_avulsa = None
+
+        selecionado = self.selecionado
+        if redesenhar:
+            # a barra superior mudou: redesenha e restaura a seleção se ainda existir
+            self.mostrar()
+            if selecionado in self.imagens_exibidas:
+                self.atualizar_selecao(selecionado)
+            return
+
+        # só eventos mudaram: refaz apenas a lista do item selecionado (se for ele)
+        if selecionado == 'cavala':
+            afetado = self.cavala_selecionada in cavalas
+        elif isinstance(selecionado, str):
+            afetado = selecionado.split(":", 1)[-1] in cartas
+        else:
+            afetado = False
+        if afetado:
+            self._estado_eventos_cache["selecionado"] = None
+            self.mostrar_eventos(selecionado)
+
     # renderização principal
     def mostrar(self):
-        for widget in self.frame_exibicao.winfo_children():
-            widget.destroy()
         if not self._dica_visivel:
-            for widget in self.frame_eventos.winfo_children():
-                widget.destroy()
+            self._limpar_frame_eventos()
 
-        self.imagens_exibidas.clear()
-        self.img_refs.clear()
+        # seleção volta pro cinza (os slots que continuam na barra não são recriados)
+        antigo = self.imagens_exibidas.get(self.selecionado)
+        if antigo:
+            antigo.config(image=antigo.image_cinza)
+            antigo.image = antigo.image_cinza
         self.selecionado = None
 
         # estado da busca
@@ -305,121 +413,7 @@ class UmaApp:
         self.search_entry.bind("<FocusOut>", lambda e: self._on_search_focus_out())
         self.search_entry.focus_set()
 
-        # cavala
-        if self.cavala_selecionada:
-            dados_cavala = self.cv.get(self.cavala_selecionada)
-            if dados_cavala:
-                caminho_img_cavala = os.path.join(BASE, dados_cavala.get("imagem", ""))
-                try:
-                    pil_img_cavala = Image.open(caminho_img_cavala).convert("RGBA")
-                    pil_img_cavala_res = pil_img_cavala.resize((128, 128), Image.Resampling.LANCZOS)
-                    img_colorida = ImageTk.PhotoImage(pil_img_cavala_res)
-                    img_cinza = ImageTk.PhotoImage(ImageOps.grayscale(pil_img_cavala_res.convert("RGB")))
-                except Exception:
-                    img_colorida = img_cinza = None
-
-                if img_colorida and img_cinza:
-                    frame_cavala = tk.Frame(self.frame_exibicao, bg=self.area_cor)
-                    frame_cavala.pack(side='left', padx=10)
-
-                    def on_click_cavala():
-                        self._remover_dica_inicial()
-                        self.atualizar_selecao('cavala')
-
-                    btn_img = tk.Button(
-                        frame_cavala, image=img_cinza, borderwidth=0, command=on_click_cavala,
-                        bg=self.area_cor, activebackground=self.area_cor, highlightthickness=0
-                    )
-                    btn_img.image_colorida = img_colorida
-                    btn_img.image_cinza = img_cinza
-                    btn_img.pack()
-                    tk.Label(frame_cavala, text=self.cavala_selecionada, font=("Arial", 12, "bold"), fg='white', bg=self.area_cor).pack()
-
-                    self.imagens_exibidas['cavala'] = btn_img
-                    self.img_refs['cavala_colorida'] = img_colorida
-                    self.img_refs['cavala_cinza'] = img_cinza
-
-        # deck
-        frame_cartas = tk.Frame(self.frame_exibicao, bg=self.area_cor)
-        frame_cartas.pack(side='left', padx=20)
-
-        for card_id in self.deck:
-            dados_carta = self.card_by_id.get(card_id) or self.c.get(card_id)
-            nome_carta = self.name_by_id.get(card_id, dados_carta.get("nome", "Carta") if dados_carta else "Carta")
-            if not dados_carta:
-                continue
-            caminho_img_carta = os.path.join(BASE, card_id)
-            try:
-                pil_img_carta = Image.open(caminho_img_carta).convert("RGBA")
-                pil_img_carta_res = pil_img_carta.resize((96, 96), Image.Resampling.LANCZOS)
-                img_colorida = ImageTk.PhotoImage(pil_img_carta_res)
-                img_cinza = ImageTk.PhotoImage(ImageOps.grayscale(pil_img_carta_res.convert("RGB")))
-            except Exception as e:
-                print(f"Erro ao carregar imagem da carta {nome_carta}: {e}")
-                continue
-
-            frame_carta = tk.Frame(frame_cartas, bg=self.area_cor)
-            frame_carta.pack(side='left', padx=5)
-
-            def on_click_carta(cid=card_id):
-                self._remover_dica_inicial()
-                self.atualizar_selecao(cid)
-
-            btn_img_carta = tk.Button(
-                frame_carta, image=img_cinza, borderwidth=0, command=on_click_carta,
-                bg=self.area_cor, activebackground=self.area_cor, highlightthickness=0
-            )
-            btn_img_carta.image_colorida = img_colorida
-            btn_img_carta.image_cinza = img_cinza
-            btn_img_carta.pack()
-            tk.Label(frame_carta, text=nome_carta, fg='white', bg=self.area_cor).pack()
-
-            self.imagens_exibidas[card_id] = btn_img_carta
-            self.img_refs[f'{card_id}_colorida'] = img_colorida
-            self.img_refs[f'{card_id}_cinza'] = img_cinza
-
-        # separador
-        sep = criar_separador_vertical(self.frame_exibicao, altura=160, cor='#ffffff')
-        sep.pack(side='left', padx=10)
-
-        # avulsa
-        avulsa_frame = tk.Frame(self.frame_exibicao, bg=self.area_cor)
-        avulsa_frame.pack(side='left', padx=10)
-
-        if self.carta_avulsa:
-            dados_carta = self.card_by_id.get(self.carta_avulsa) or self.c.get(self.carta_avulsa)
-            nome_carta = self.name_by_id.get(self.carta_avulsa, dados_carta.get("nome", "Carta") if dados_carta else "Carta")
-            if dados_carta:
-                caminho_img_carta = os.path.join(BASE, self.carta_avulsa)
-                try:
-                    pil_img_carta = Image.open(caminho_img_carta).convert("RGBA")
-                    pil_img_carta_res = pil_img_carta.resize((96, 96), Image.Resampling.LANCZOS)
-                    img_colorida = ImageTk.PhotoImage(pil_img_carta_res)
-                    img_cinza = ImageTk.PhotoImage(ImageOps.grayscale(pil_img_carta_res.convert("RGB")))
-                except Exception as e:
-                    print(f"Erro ao carregar imagem da carta avulsa {nome_carta}: {e}")
-                    img_colorida = img_cinza = None
-
-                def on_click_avulsa(cid=self.carta_avulsa):
-                    self._remover_dica_inicial()
-                    self.atualizar_selecao(f"avulsa:{cid}")
-
-                if img_colorida and img_cinza:
-                    frame_carta = tk.Frame(avulsa_frame, bg=self.area_cor)
-                    frame_carta.pack(side='left', padx=5)
-
-                    btn_img_carta = tk.Button(
-                        frame_carta, image=img_cinza, borderwidth=0, command=on_click_avulsa,
-                        bg=self.area_cor, activebackground=self.area_cor, highlightthickness=0
-                    )
-                    btn_img_carta.image_colorida = img_colorida
-                    btn_img_carta.image_cinza = img_cinza
-                    btn_img_carta.pack()
-                    tk.Label(frame_carta, text=nome_carta, fg='white', bg=self.area_cor).pack()
-
-                    self.imagens_exibidas[f"avulsa:{self.carta_avulsa}"] = btn_img_carta
-                    self.img_refs[f"avulsa:{self.carta_avulsa}_colorida"] = img_colorida
-                    self.img_refs[f"avulsa:{self.carta_avulsa}_cinza"] = img_cinza
+        self._reconciliar_barra()
 
         # dica inicial
         if not self.cavala_selecionada and not self.deck and not self.carta_avulsa:
@@ -428,6 +422,104 @@ class UmaApp:
             self._remover_dica_inicial()
             self.mostrar_eventos(None)
 
+    # barra de cima: slots com chave ('cavala', card_id do deck, 'avulsa:<id>') reconciliados com a
+    # seleção atual; slot cujo conteúdo (imagem/nome/versão do item) não mudou fica como está,
+    # os do deck só são reempacotados se a ordem mudou
+    def _montar_barra(self):
+        self._frame_cartas = tk.Frame(self.frame_exibicao, bg=self.area_cor)
+        self._frame_cartas.pack(side='left', padx=20)
+        self._sep_barra = criar_separador_vertical(self.frame_exibicao, altura=160, cor='#ffffff')
+        self._frame_avulsa = tk.Frame(self.frame_exibicao, bg=self.area_cor)
+        self._frame_avulsa.pack(side='left', padx=10)
+
+    def _slots_desejados(self):
+        # chave -> (assinatura, container, caminho da imagem, tamanho, nome, fonte, padx, seleção ao clicar)
+        desejados = {}
+        if self.cavala_selecionada:
+            dados = self.cv.get(self.cavala_selecionada)
+            if dados:
+                caminho = os.path.join(BASE, dados.imagem or "")
+                desejados['cavala'] = ((caminho, self.cavala_selecionada, dados.assinatura), self.frame_exibicao,
+                                       caminho, (128, 128), self.cavala_selecionada, ("Arial", 12, "bold"), 10, 'cavala')
+        cartas = [(cid, self._frame_cartas, cid) for cid in self.deck]
+        if self.carta_avulsa:
+            cartas.append((f"avulsa:{self.carta_avulsa}", self._frame_avulsa, self.carta_avulsa))
+        for chave, container, cid in cartas:
+            dados = self.card_by_id.get(cid) or self.c.get(cid)
+            if not dados:
+                continue
+            nome = self.name_by_id.get(cid, dados.nome or "Carta")
+            caminho = os.path.join(BASE, cid)
+            desejados[chave] = ((caminho, nome, dados.assinatura), container, caminho, (96, 96), nome, None, 5, chave)
+        return desejados
+
+    def _criar_slot(self, chave, container, caminho, tamanho, nome, fonte, padx, selecao):
+        try:
+            # mesmo fundo dos seletores: a carta do deck reusa o par Tk do seletor de cartas
+            par = cache_imagens.adquirir(caminho, tamanho, FUNDO_ICONES)
+            img_colorida, img_cinza = par.colorida, par.cinza
+        except Exception as e:
+            print(f"Erro ao carregar imagem de {nome}: {e}")
+            return None
+
+        frame = tk.Frame(container, bg=self.area_cor)
+
+        def on_click():
+            self._remover_dica_inicial()
+            self.atualizar_selecao(selecao)
+
+        btn = tk.Button(
+            frame, image=img_cinza, borderwidth=0, command=on_click,
+            bg=self.area_cor, activebackground=self.area_cor, highlightthickness=0
+        )
+        btn.image_colorida = img_colorida
+        btn.image_cinza = img_cinza
+        cache_imagens.prender(btn, par)
+        btn.pack()
+        rotulo = dict(font=fonte) if fonte else {}
+        tk.Label(frame, text=nome, fg='white', bg=self.area_cor, **rotulo).pack()
+        return {"frame": frame, "btn": btn, "padx": padx}
+
+    def _reconciliar_barra(self, separador=True):
+        if self._slots_barra is None:
+            self._montar_barra()
+            self._slots_barra = {}   # chave -> (assinatura, slot)
+        desejados = self._slots_desejados()
+
+        # sai quem não está mais na seleção ou mudou de conteúdo (hot-reload)
+        for chave, (assinatura, slot) in list(self._slots_barra.items()):
+            if chave not in desejados or desejados[chave][0] != assinatura:
+                slot["frame"].destroy()
+                del self._slots_barra[chave]
+                self.imagens_exibidas.pop(chave, None)
+
+        # entra só o que é novo
+        for chave, (assinatura, *args) in desejados.items():
+            if chave not in self._slots_barra:
+                slot = self._criar_slot(chave, *args)
+                if slot is not None:
+                    self._slots_barra[chave] = (assinatura, slot)
+                    self.imagens_exibidas[chave] = slot["btn"]
+
+        # posição: cavala antes do deck; deck na ordem da seleção (reempacota só se mudou)
+        cavala = self._slots_barra.get('cavala')
+        if cavala and not cavala[1]["frame"].winfo_manager():
+            cavala[1]["frame"].pack(side='left', padx=10, before=self._frame_cartas)
+        for container, chaves in ((self._frame_cartas, self.deck),
+                                  (self._frame_avulsa, [f"avulsa:{self.carta_avulsa}"] if self.carta_avulsa else [])):
+            frames = [self._slots_barra[c][1]["frame"] for c in chaves if c in self._slots_barra]
+            if container.pack_slaves() != frames:
+                for f in container.pack_slaves():
+                    f.pack_forget()
+                for f in frames:
+                    f.pack(side='left', padx=5)
+
+        if separador:
+            if not self._sep_barra.winfo_manager():
+                self._sep_barra.pack(side='left', padx=10, before=self._frame_avulsa)
+        else:
+            self._sep_barra.pack_forget()
+
     # busca
     def _on_search_focus_in(self):
         if not self._search_active:
@@ -478,15 +570,15 @@ class UmaApp:
         if self._dica_visivel and selecionado is None and not (self.cavala_selecionada or self.deck or self.carta_avulsa):
             return
 
+        if self._busca_global:
+            self._mostrar_resultados_globais()
+            return
+
         filtro = self._texto_filtro()
 
         # cache
         if (self._estado_eventos_cache.get("selecionado") == selecionado and
             self._estado_eventos_cache.get("filtro") == filtro and not getattr(self, '_events_preserved', False)):
-            try:
-                self.canvas_eventos.update_idletasks()
-            except Exception:
-                pass
             return
 
         # Se a seleção for uma carta avulsa, extrai o ID real e adiciona verificação
@@ -496,33 +588,25 @@ class UmaApp:
 
         self._estado_eventos_cache["selecionado"] = selecionado
         self._estado_eventos_cache["filtro"] = filtro
-        
 
-        # Se for carta avulsa, salva os eventos abertos antes de recarregar
-        eventos_abertos = []
-        if isinstance(selecionado, str) and selecionado.startswith("avulsa:"):
-            for child in self.frame_eventos.winfo_children():
-                if isinstance(child, EventoExpandivel):
-                    if child.aberto:
-                        eventos_abertos.append(child.evento_id)
-
-        self._estado_eventos_cache["selecionado"] = selecionado
-        self._estado_eventos_cache["filtro"] = filtro
+        # eventos abertos sobrevivem a mudanças de filtro: _renderizar_linhas reaproveita as linhas
 
         # Limpa a flag de preservação após usar
         preserving = getattr(self, '_events_preserved', False)
         if hasattr(self, '_events_preserved'):
             self._events_preserved = False
 
-        for w in self.frame_eventos.winfo_children():
-            w.destroy()
         self._remover_dica_inicial()
 
         self.canvas_eventos.yview_moveto(0)
         if selecionado is None:
+            self._limpar_frame_eventos()
             return
         if selecionado == 'cavala':
             self.mostrar_eventos_cavala()
+        elif isinstance(selecionado, str) and selecionado.startswith("cavala:"):
+            # cavala que não é a selecionada (aberta a partir da busca global)
+            self.mostrar_eventos_cavala(selecionado.split(":", 1)[1])
         else:
                     # Verifica se é uma carta avulsa e ajusta o selecionado se necessário
             selecionado_real = selecionado
@@ -530,61 +614,86 @@ class UmaApp:
                 selecionado_real = selecionado.split(":", 1)[1]
             self.mostrar_eventos_carta(selecionado_real)
 
-                    # Se for avulsa, reabre eventos que estavam abertos
-        if isinstance(selecionado, str) and selecionado.startswith("avulsa:"):
-            for child in self.frame_eventos.winfo_children():
-                if isinstance(child, EventoExpandivel) and child.evento_id in eventos_abertos:
-                    child.toggle()  # Reabre o evento
-
-    def mostrar_eventos_cavala(self):
-        dados = self.cv.get(self.cavala_selecionada, {})
-        filtro = self._texto_filtro()
-        for cat, eventos in dados.get("eventos", {}).items():
-            eventos_filtrados = [ev for ev in eventos if self._combina_filtro(ev.get('nome', ''), filtro)]
-            if not eventos_filtrados:
-                continue
-            lbl_cat = tk.Label(self.frame_eventos, text=f"-- {cat} --", font=('Arial', 10, 'bold'), fg='white', bg='#606060')
-            lbl_cat.pack(fill='x', pady=(10, 2))  # ou (6, 2) se for o segundo caso
-
-            # repassar scroll pro canvas
-            def _scroll_event_categoria(event):
-                self.canvas_eventos.event_generate("<MouseWheel>", delta=event.delta)
-
-            lbl_cat.bind("<MouseWheel>", _scroll_event_categoria)
-            lbl_cat.bind("<Button-4>", lambda e: self.canvas_eventos.yview_scroll(-1, "units"))
-            lbl_cat.bind("<Button-5>", lambda e: self.canvas_eventos.yview_scroll(1, "units"))
-
-            for ev in eventos_filtrados:
-                titulo = ev.get('nome', 'Evento')
-                detalhes = ev.get('detalhes', '')
-                ev_expand = EventoExpandivel(self.frame_eventos, titulo, detalhes)
-                ev_expand.pack(fill='x', padx=10, pady=2)
+    def mostrar_eventos_cavala(self, nome=None):
+        cavala = self.cv.get(nome or self.cavala_selecionada)
+        if not cavala:
+            self._limpar_frame_eventos()
+            return
+        self._renderizar_linhas(cavala, pady_evento=2)
 
     def mostrar_eventos_carta(self, card_id):
         dados_carta = self.card_by_id.get(card_id) or self.c.get(card_id)
         if not dados_carta:
+            self._limpar_frame_eventos()
             return
-        filtro = self._texto_filtro()
-        for cat, eventos in dados_carta.get("eventos", {}).items():
-            eventos_filtrados = [ev for ev in eventos if self._combina_filtro(ev.get('nome', ''), filtro)]
-            if not eventos_filtrados:
-                continue
-            lbl_cat = tk.Label(self.frame_eventos, text=f"-- {cat} --", font=('Arial', 10, 'bold'), fg='white', bg='#606060')
-            lbl_cat.pack(fill='x', pady=(10, 2))  # ou (6, 2) se for o segundo caso
-
-            # repassar scroll pro canvas
-            def _scroll_event_categoria(event):
-                self.canvas_eventos.event_generate("<MouseWheel>", delta=event.delta)
-
-            lbl_cat.bind("<MouseWheel>", _scroll_event_categoria)
-            lbl_cat.bind("<Button-4>", lambda e: self.canvas_eventos.yview_scroll(-1, "units"))
-            lbl_cat.bind("<Button-5>", lambda e: self.canvas_eventos.yview_scroll(1, "units"))
+        self._renderizar_linhas(dados_carta, pady_evento=1)
+
+    def _renderizar_linhas(self, item, pady_evento):
+        # monta a lista de eventos do item na lista virtual: só as linhas visíveis ganham widget,
+        # linhas que continuam na vista (mesma chave) não são refeitas, a aberta continua aberta
+        dono = (self.selecionado, item.arquivo, item.assinatura)
+        if self._linhas_dono != dono:
+            self._limpar_frame_eventos()
+            self._linhas_dono = dono
+
+        linhas = []   # (chave, tipo, dados) na ordem de exibição
+        for ci, categoria, eventos in self._eventos_filtrados(item, self._texto_filtro()):
+            linhas.append((("cat", ci), "cat", categoria.nome))
+            for ei, ev in eventos:
+                linhas.append((("ev", ci, ei), "ev", ev))
+        self.canvas_eventos.itemconfigure(self.wrapper_id, state='hidden')
+        self.lista_eventos.definir_itens(linhas, margens={"cat": (10, 2), "ev": (pady_evento, pady_evento)})
+
+    def _criar_linha_evento(self, tipo, master):
+        if tipo == "cat":
+            lbl_cat = tk.Label(master, font=('Arial', 10, 'bold'), fg='white', bg='#606060')
+            self._repassar_scroll(lbl_cat)
+            return lbl_cat
+        if tipo == "resultado":
+            btn = tk.Button(
+                master, width=105,
+                fg='white', bg='#1a1a1a', activebackground='#333333', activeforeground='white', bd=0
+            )
+            self._repassar_scroll(btn)
+            return btn
+        linha = EventoExpandivel(master, "", (), ao_alternar=self._evento_alternado)
+        if self._largura_evento is None:
+            self._largura_evento = linha.botao.winfo_reqwidth()
+        return linha
+
+    def _preencher_linha_evento(self, widget, item):
+        chave, tipo, dados = item
+        if tipo == "cat":
+            widget.config(text=f"-- {dados} --")
+        else:
+            widget.chave = chave   # definir() fecha/abre conforme o modelo, não conforme o widget
+            widget.definir(dados.nome, dados.segmentos, aberto=(chave == self._evento_aberto))
+
+    def _evento_alternado(self, linha):
+        # toggle fecha as outras linhas visíveis; a aberta fora da vista fecha pelo modelo
+        self._evento_aberto = linha.chave if linha.aberto else None
+
+    def _largura_linha_evento(self):
+        disponivel = max(1, self.canvas_eventos.winfo_width() - 20)
+        return min(disponivel, self._largura_evento) if self._largura_evento else disponivel
+
+    def _limpar_frame_eventos(self):
+        for btn in self._resultados_exibidos:
+            btn.pack_forget()
+            self.pool_linhas.devolver(btn)
+        self._resultados_exibidos = []
+        for w in self.frame_eventos.winfo_children():
+            if not self.pool_linhas.possui(w):
+                w.destroy()
+        self.lista_eventos.definir_itens([])
+        self.lista_eventos.esquecer_alturas()
+        self._evento_aberto = None
+        self._linhas_dono = None
+        self.canvas_eventos.itemconfigure(self.wrapper_id, state='normal')
+        self._ajustar_scroll_wrapper()
 
-            for ev in eventos_filtrados:
-                titulo = ev.get('nome', 'Evento')
-                detalhes = ev.get('detalhes', '')
-                ev_expand = EventoExpandivel(self.frame_eventos, titulo, detalhes)
-                ev_expand.pack(fill='x', padx=10, pady=1)
+    def _ajustar_scroll_wrapper(self):
+        self.canvas_eventos.configure(scrollregion=self.canvas_eventos.bbox(self.wrapper_id))
 
     def _texto_filtro(self):
         txt = self.search_var.get().strip()
@@ -592,16 +701,65 @@ class UmaApp:
             return ""
         return txt.lower()
 
-    def _combina_filtro(self, titulo, filtro):
-        if not filtro:
-            return True
-        # prefixo (mantido); trocar para "in" para conter
-        return str(titulo).lower().startswith(filtro)
+    def _eventos_filtrados(self, item, filtro):
+        # gera (ci, categoria, [(ei, evento)]) usando o índice do item (busca.py),
+        # sem testar título por título; categorias sem nenhum evento são puladas
+        # no modo aproximado as posições vêm por relevância: categorias e eventos seguem essa ordem
+        categorias = item.eventos
+        posicoes = self._busca_do_item(item).buscar(filtro) if filtro else None
+        if posicoes is None:
+            for ci, categoria in enumerate(categorias):
+                if categoria.eventos:
+                    yield ci, categoria, list(enumerate(categoria.eventos))
+            return
+        por_categoria = {}
+        for ci, ei in posicoes:
+            por_categoria.setdefault(ci, []).append((ei, categorias[ci].eventos[ei]))
+        for ci, eventos in por_categoria.items():
+            yield ci, categorias[ci], eventos
+
+    def _busca_do_item(self, item):
+        # reaproveita a última busca do mesmo item/modo, pra refinar enquanto o usuário digita
+        chave = (item.arquivo, item.assinatura, self.modo_filtro)
+        if self._busca_incremental is None or self._busca_incremental[0] != chave:
+            self._busca_incremental = (chave, BuscaIncremental(item.indice(), self.modo_filtro))
+        return self._busca_incremental[1]
+
+    def _alternar_modo_filtro(self):
+        ciclo = (MODO_PREFIXO, MODO_CONTEM, MODO_APROXIMADO)
+        self.modo_filtro = ciclo[(ciclo.index(self.modo_filtro) + 1) % len(ciclo)]
+        self.btn_modo_busca.config(text=self._rotulo_modo_filtro())
+        self._estado_eventos_cache["filtro"] = None  # força refazer a lista com o modo novo
+        self._aplicar_filtro_eventos()
+
+    def _rotulo_modo_filtro(self):
+        return {MODO_CONTEM: "Contém", MODO_APROXIMADO: "Aproximado"}.get(self.modo_filtro, "Começa com")
+
+    def _agendar_filtro_eventos(self):
+        # cada tecla reinicia a espera; a lista só é refeita quando a digitação para
+        if self._filtro_agendado is not None:
+            self.root.after_cancel(self._filtro_agendado)
+        self._filtro_agendado = self.root.after(DEBOUNCE_BUSCA_MS, self._filtro_agendado_disparou)
+
+    def _filtro_agendado_disparou(self):
+        self._filtro_agendado = None
+        try:
+            if self.frame_eventos.winfo_exists():
+                self._aplicar_filtro_eventos()
+        except tk.TclError:
+            pass  # tela trocada enquanto esperava
 
     def _aplicar_filtro_eventos(self):
+        # chamada direta (modo, limpar, seleção) passa na frente de uma filtragem agendada
+        if self._filtro_agendado is not None:
+            self.root.after_cancel(self._filtro_agendado)
+            self._filtro_agendado = None
+        if self._busca_global:
+            self._pagina_global = 0
+            self._mostrar_resultados_globais()
+            return
         if self.selecionado is None:
-            for w in self.frame_eventos.winfo_children():
-                w.destroy()
+            self._limpar_frame_eventos()
             self._mostrar_dica_inicial() if not (self.cavala_selecionada or self.deck or self.carta_avulsa) else None
             return
         if self.selecionado == 'cavala':
@@ -609,6 +767,161 @@ class UmaApp:
         else:
             self.mostrar_eventos(self.selecionado)
 
+    # busca global
+    def _alternar_busca_global(self):
+        self._definir_busca_global(not self._busca_global)
+        self._pagina_global = 0
+        self._estado_eventos_cache["filtro"] = None
+        if self._busca_global:
+            self._mostrar_resultados_globais()
+        else:
+            self._aplicar_filtro_eventos()
+
+    def _definir_busca_global(self, ativo):
+        self._busca_global = ativo
+        self.btn_busca_global.config(
+            text="Global: on" if ativo else "Global: off", bg='#2f4f3a' if ativo else '#1a1a1a'
+        )
+
+    def _garantir_indice_global(self):
+        # devolve o índice global, ou None enquanto ele é montado numa thread
+        if self._indice_global is not None:
+            return self._indice_global
+        if self._indice_global_montando is None:
+            cartas, cavalas = list(self.c.items()), list(self.cv.items())
+            resultado = {}
+
+            def montar():
+                # lê direto do disco: não passa pelo LRU dos eventos exibidos
+                resultado["indice"] = IndiceGlobal.construir(
+                    cartas, cavalas, lambda item: ler_eventos(item.arquivo) if item.arquivo else ()
+                )
+
+            t = threading.Thread(target=montar, daemon=True)
+            t.start()
+            self._indice_global_montando = (t, resultado)
+            self.root.after(50, self._aguardar_indice_global)
+        return None
+
+    def _aguardar_indice_global(self):
+        t, resultado = self._indice_global_montando
+        if t.is_alive():
+            self.root.after(50, self._aguardar_indice_global)
+            return
+        self._indice_global_montando = None
+        self._indice_global = resultado.get("indice") or IndiceGlobal()
+        for cartas, cavalas in self._indice_global_pendente:
+            self._atualizar_indice_global(cartas, cavalas)
+        self._indice_global_pendente = []
+        try:
+            if self._busca_global and self.frame_eventos.winfo_exists():
+                self._mostrar_resultados_globais()
+        except tk.TclError:
+            pass
+
+    def _atualizar_indice_global(self, cartas, cavalas):
+        # hot-reload: troca só os donos alterados no índice global
+        if self._indice_global is None:
+            if self._indice_global_montando is not None:
+                self._indice_global_pendente.append((cartas, cavalas))
+            return
+        for tipo, delta in (("carta", cartas), ("cavala", cavalas)):
+            for chave, item in delta.items():
+                if item is None:
+                    self._indice_global.remover_dono((tipo, chave))
+                else:
+                    self._indice_global.adicionar_dono((tipo, chave), item.nome, item.eventos)
+
+    def _mostrar_resultados_globais(self):
+        self._limpar_frame_eventos()
+        self._remover_dica_inicial()
+        self._estado_eventos_cache["filtro"] = None  # a lista normal precisa ser refeita ao sair
+        self.canvas_eventos.yview_moveto(0)
+
+        consulta = self._texto_filtro()
+        if not consulta:
+            self._rotulo_eventos("Busca global: digite o nome de um evento")
+            return
+        indice = self._garantir_indice_global()
+        if indice is None:
+            self._rotulo_eventos("Indexando eventos…")
+            return
+
+        modo = MODO_APROXIMADO if self.modo_filtro == MODO_APROXIMADO else None
+        total, resultados = indice.buscar(consulta, self._pagina_global, POR_PAGINA_GLOBAL, modo=modo)
+        paginas = max(1, math.ceil(total / POR_PAGINA_GLOBAL))
+        self._rotulo_eventos(f"-- {total} resultado(s) --")
+
+        for r in resultados:
+            if r.dono[0] == "carta":
+                carta = self.c.get(r.dono[1])
+                dono = f"{r.dono_nome} ({carta.raridade})" if carta and carta.raridade else r.dono_nome
+            else:
+                dono = f"{r.dono_nome} (cavala)"
+            btn = self.pool_linhas.pegar("resultado", self.frame_eventos)
+            btn.config(text=f"{r.evento}   —   {dono} · {r.categoria}", command=lambda r=r: self._ir_para_resultado(r))
+            btn.pack(fill='x', padx=10, pady=1)
+            self._resultados_exibidos.append(btn)
+
+        if paginas > 1:
+            nav = tk.Frame(self.frame_eventos, bg='#606060')
+            nav.pack(pady=(8, 4))
+
+            def ir(pagina):
+                self._pagina_global = pagina
+                self._mostrar_resultados_globais()
+
+            estilo = dict(fg='white', bg='#1a1a1a', activebackground='#333333', activeforeground='white', bd=0, width=10)
+            anterior = tk.Button(nav, text="◀ Anterior", command=lambda: ir(self._pagina_global - 1), **estilo)
+            proxima = tk.Button(nav, text="Próxima ▶", command=lambda: ir(self._pagina_global + 1), **estilo)
+            anterior.config(state='normal' if self._pagina_global > 0 else 'disabled')
+            proxima.config(state='normal' if self._pagina_global + 1 < paginas else 'disabled')
+            anterior.pack(side='left', padx=6)
+            tk.Label(nav, text=f"{self._pagina_global + 1}/{paginas}", fg='white', bg='#606060').pack(side='left', padx=6)
+            proxima.pack(side='left', padx=6)
+
+    def _rotulo_eventos(self, texto):
+        lbl = tk.Label(self.frame_eventos, text=texto, font=('Arial', 10, 'bold'), fg='white', bg='#606060')
+        lbl.pack(fill='x', pady=(10, 2))
+        self._repassar_scroll(lbl)
+
+    def _repassar_scroll(self, widget):
+        # repassar scroll pro canvas
+        widget.bind("<MouseWheel>", lambda e: self.canvas_eventos.event_generate("<MouseWheel>", delta=e.delta))
+        widget.bind("<Button-4>", lambda e: self.canvas_eventos.yview_scroll(-1, "units"))
+        widget.bind("<Button-5>", lambda e: self.canvas_eventos.yview_scroll(1, "units"))
+
+    def _ir_para_resultado(self, resultado):
+        # sai da busca global, abre o painel do dono e filtra pelo título do evento
+        self._definir_busca_global(False)
+        tipo, chave = resultado.dono
+        if tipo == "cavala":
+            selecao = 'cavala' if chave == self.cavala_selecionada else f"cavala:{chave}"
+        elif chave in self.deck:
+            selecao = chave
+        elif chave == self.carta_avulsa:
+            selecao = f"avulsa:{chave}"
+        else:
+            selecao = chave
+
+        if self.selecionado != selecao:
+            antigo = self.imagens_exibidas.get(self.selecionado)
+            if antigo:
+                antigo.config(image=antigo.image_cinza)
+                antigo.image = antigo.image_cinza
+            novo = self.imagens_exibidas.get(selecao)
+            if novo:
+                novo.config(image=novo.image_colorida)
+                novo.image = novo.image_colorida
+            self.selecionado = selecao
+
+        self.modo_filtro = MODO_PREFIXO
+        self.btn_modo_busca.config(text=self._rotulo_modo_filtro())
+        self._search_active = True
+        self.search_entry.config(fg='#ffffff')
+        self._estado_eventos_cache["filtro"] = None
+        self.search_var.set(resultado.evento)  # trace -> _aplicar_filtro_eventos -> painel do dono
+
     def _limpar_pesquisa(self):
         self.search_entry.configure(state='normal')
         self.search_entry.focus_set()
@@ -620,14 +933,10 @@ class UmaApp:
     def resetar_escolhas(self):
         self.deck = []
         self.carta_avulsa = None
-        for widget in self.frame_exibicao.winfo_children():
-            widget.destroy()
-        for widget in self.frame_eventos.winfo_children():
-            widget.destroy()
-        self.imagens_exibidas.clear()
-        self.img_refs.clear()
+        self._limpar_frame_eventos()
         self.selecionado = None
         self.cavala_selecionada = None
+        self._reconciliar_barra(separador=False)   # barra vazia, como antes do primeiro mostrar()
 
         # restaura botão de cavala padrão
         for w in self.slot_cavala.winfo_children():
@@ -638,7 +947,6 @@ class UmaApp:
         self.btn_cavala.pack()
 
         self._mostrar_dica_inicial()
-        self.canvas_eventos.update_idletasks()
         self.canvas_eventos.yview_moveto(0)
 
 
@@ -647,8 +955,7 @@ class UmaApp:
         if self._dica_visivel:
             return
 
-        for w in self.frame_eventos.winfo_children():
-            w.destroy()
+        self._limpar_frame_eventos()
 
         dica_canvas, dica_frame, _ = criar_painel_arredondado(
             self.wrapper_eventos,
@@ -674,7 +981,6 @@ class UmaApp:
         self._dica_widget.pack(pady=14, padx=16)
         self._dica_visivel = True
 
-        self.canvas_eventos.update_idletasks()
         self.canvas_eventos.yview_moveto(0)
 
     def _remover_dica_inicial(self):
@@ -1,21 +1,32 @@
 import tkinter as tk
-from tkinter.font import Font
 from PIL import Image, ImageTk, ImageOps
-import re
+
+from .medidas import medidas_de
 
 # Notas:
 # - Painéis/Widgets compartilhados: botão arredondado, painel arredondado, separador, EventoExpandivel.
 # - Preserva o comportamento e as notas originais.
+# - Tamanhos (largura do botão do evento, linhas do texto, botão arredondado) vêm de medidas.py,
+#   sem update_idletasks: montar um painel inteiro não força passe de layout nenhum.
+
+FONTES_EVENTO = {"normal": ("Arial", 10), "bold": ("Arial", 10, "bold")}
+PADX_TEXTO_EVENTO = 14
 
 class EventoExpandivel(tk.Frame):
     # painel simples com título clicável que expande/colapsa para mostrar detalhes
-    # suporta marcações simples de negrito em ANSI (\033[1m ... \033[0m)
-    def __init__(self, master, titulo, detalhes, *args, **kwargs):
+    # segmentos: tuple[(estilo, texto)] com estilo 'normal' ou 'bold' (negrito ANSI pré-processado)
+    # ao_alternar(evento) (opcional) roda depois de abrir/fechar: a lista virtual guarda qual está aberto
+    # fechado, o painel é só Frame + Button: o Text dos detalhes é montado no primeiro toggle
+    # (a maioria dos eventos nunca é aberta) e reaproveitado depois; definir() troca o texto só
+    # quando o painel está aberto
+    def __init__(self, master, titulo, segmentos, *args, ao_alternar=None, **kwargs):
         super().__init__(master, *args, **kwargs)
+        self.ao_alternar = ao_alternar
+        self._dados = (titulo, segmentos)
+        self._segmentos_no_texto = None   # segmentos que estão no Text agora (None = desatualizado)
 
         # Adicione um ID único para este evento
         self.evento_id = id(self)
-        self.aberto = False
 
         # Adicione esta linha (se ainda não tiver):
         self.card_id = None  # Vai ser definido quando o evento for criado
@@ -37,15 +48,21 @@ class EventoExpandivel(tk.Frame):
         )
         self.botao.pack(fill='x')
 
-        self.botao.update_idletasks()
         try:
-            self.botao.config(width=int(4000 / self.botao.winfo_fpixels('1c')))
+            self.botao.config(width=int(4000 / medidas_de(self).px_por_cm()))
         except Exception:
             self.botao.config(width=200)
 
-        self.frame = tk.Frame(self, bg='#324b4c')
+        # detalhes: montados em _montar_detalhes()
+        self.frame = None
+        self.text_widget = None
+
+        self.botao.bind("<MouseWheel>", self._scroll_mousewheel)
+        self.botao.bind("<Button-4>", self._scroll_canvas_para_cima)
+        self.botao.bind("<Button-5>", self._scroll_canvas_para_baixo)
 
-        texto = '\n'.join(detalhes) if isinstance(detalhes, list) else detalhes
+    def _montar_detalhes(self):
+        self.frame = tk.Frame(self, bg='#324b4c')
 
         self.text_widget = tk.Text(
             self.frame,
@@ -56,119 +73,116 @@ class EventoExpandivel(tk.Frame):
             background='#324b4c',
             fg='white',
             insertbackground='white',
-            padx=14,
+            padx=PADX_TEXTO_EVENTO,
             pady=7
         )
         self.text_widget.pack(fill='both', expand=True)
-        self.text_widget.config(state='normal')
 
-        font_normal = Font(family="Arial", size=10)
-        font_bold = Font(family="Arial", size=10, weight="bold")
-
-        self.text_widget.tag_configure("normal", font=font_normal, justify='center', foreground='white')
-        self.text_widget.tag_configure("bold", font=font_bold, justify='center', foreground='#ffff99')
-
-        patterns = [
-            re.compile(r"\033\[1m(.*?)\033\[0m", re.DOTALL),
-            re.compile(r"\\033\[1m(.*?)\\033\[0m", re.DOTALL),
-        ]
-
-        applied = False
-        for pattern in patterns:
-            pos = 0
-            any_match = False
-            for match in pattern.finditer(texto):
-                any_match = True
-                antes = texto[pos:match.start()]
-                if antes:
-                    self.text_widget.insert('end', antes, ("normal",))
-                em_negrito = match.group(1)
-                self.text_widget.insert('end', em_negrito, ("bold",))
-                pos = match.end()
-            if any_match:
-                resto = texto[pos:]
-                if resto:
-                    self.text_widget.insert('end', resto, ("normal",))
-                applied = True
-                break
-
-        if not applied:
-            self.text_widget.insert('end', texto, ("normal",))
+        medidas = medidas_de(self)
+        self.text_widget.tag_configure("normal", font=medidas.fonte(FONTES_EVENTO["normal"]), justify='center', foreground='white')
+        self.text_widget.tag_configure("bold", font=medidas.fonte(FONTES_EVENTO["bold"]), justify='center', foreground='#ffff99')
 
-        self.text_widget.config(state='disabled')
+        # Bindings
+        self.text_widget.bind("<MouseWheel>", self._scroll_mousewheel)
+        self.text_widget.bind("<Button-4>", self._scroll_canvas_para_cima)
+        self.text_widget.bind("<Button-5>", self._scroll_canvas_para_baixo)
 
-        def _scroll_canvas_para_cima(event):
-            try:
-                widget = self
-                while widget and not isinstance(widget, tk.Canvas):
-                    widget = widget.master
-                if widget:
-                    top, bottom = widget.yview()
-                    if top <= 0.0:  # já está no topo, não rola mais
-                        return "break"
-                    widget.yview_scroll(-1, "units")
-                return "break"
-            except Exception:
-                return "break"
-
-        def _scroll_canvas_para_baixo(event):
-            try:
-                widget = self
-                while widget and not isinstance(widget, tk.Canvas):
-                    widget = widget.master
-                if widget:
-                    top, bottom = widget.yview()
-                    if bottom >= 1.0:  # já está no final, não rola mais
-                        return "break"
-                    widget.yview_scroll(1, "units")
-                return "break"
-            except Exception:
-                return "break"
-
-        def _scroll_mousewheel(event):
-            try:
-                delta = int(-1 * (event.delta / 120))
-                widget = self
-                while widget and not isinstance(widget, tk.Canvas):
-                    widget = widget.master
-                if widget:
-                    top, bottom = widget.yview()
-                    if delta < 0 and top <= 0.0:      # tentando subir além do topo
-                        return "break"
-                    if delta > 0 and bottom >= 1.0:   # tentando descer além do final
-                        return "break"
-                    widget.yview_scroll(delta, "units")
-                return "break"
-            except Exception:
-                return "break"
+    def _canvas(self):
+        widget = self
+        while widget and not isinstance(widget, tk.Canvas):
+            widget = widget.master
+        return widget
 
-        # Bindings
-        self.text_widget.bind("<MouseWheel>", _scroll_mousewheel)
-        self.text_widget.bind("<Button-4>", _scroll_canvas_para_cima)
-        self.text_widget.bind("<Button-5>", _scroll_canvas_para_baixo)
-        self.botao.bind("<MouseWheel>", _scroll_mousewheel)
-        self.botao.bind("<Button-4>", _scroll_canvas_para_cima)
-        self.botao.bind("<Button-5>", _scroll_canvas_para_baixo)
+    def _scroll_canvas_para_cima(self, event):
+        try:
+            widget = self._canvas()
+            if widget:
+                top, bottom = widget.yview()
+                if top <= 0.0:  # já está no topo, não rola mais
+                    return "break"
+                widget.yview_scroll(-1, "units")
+            return "break"
+        except Exception:
+            return "break"
+
+    def _scroll_canvas_para_baixo(self, event):
+        try:
+            widget = self._canvas()
+            if widget:
+                top, bottom = widget.yview()
+                if bottom >= 1.0:  # já está no final, não rola mais
+                    return "break"
+                widget.yview_scroll(1, "units")
+            return "break"
+        except Exception:
+            return "break"
+
+    def _scroll_mousewheel(self, event):
+        try:
+            delta = int(-1 * (event.delta / 120))
+            widget = self._canvas()
+            if widget:
+                top, bottom = widget.yview()
+                if delta < 0 and top <= 0.0:      # tentando subir além do topo
+                    return "break"
+                if delta > 0 and bottom >= 1.0:   # tentando descer além do final
+                    return "break"
+                widget.yview_scroll(delta, "units")
+            return "break"
+        except Exception:
+            return "break"
 
+    def _preencher_texto(self, segmentos):
+        self.text_widget.config(state='normal')
+        self.text_widget.delete('1.0', 'end')
+        # segmentos (estilo, texto) já vêm prontos do catálogo (ver data/eventos.segmentar)
+        for estilo, trecho in segmentos:
+            self.text_widget.insert('end', trecho, (estilo,))
 
+        self.text_widget.config(state='disabled')
 
-        self.text_widget.update_idletasks()
-        num_linhas = int(self.text_widget.index('end-1c').split('.')[0])
-        self.text_widget.config(height=num_linhas)
+        # linhas quebradas calculadas pelas métricas da fonte na largura atual da linha
+        # (antes: update_idletasks + contagem das linhas lógicas)
+        medidas = medidas_de(self)
+        largura = self.winfo_width()
+        if largura <= 1:   # ainda não mapeado: largura pedida pelo Text (width=50 caracteres)
+            largura = 50 * medidas.largura("0", FONTES_EVENTO["normal"]) + 2 * PADX_TEXTO_EVENTO
+        util = max(1, largura - 2 * PADX_TEXTO_EVENTO)
+        self.text_widget.config(height=medidas.linhas_quebradas(tuple(segmentos), util, FONTES_EVENTO))
+        self._segmentos_no_texto = segmentos
+
+    def _mostrar_detalhes(self):
+        if self.frame is None:
+            self._montar_detalhes()
+        if self._segmentos_no_texto is not self._dados[1]:
+            self._preencher_texto(self._dados[1])
+        self.frame.pack(fill='x')
+
+    def definir(self, titulo, segmentos, aberto=False):
+        # reaproveita o painel pra mostrar outro evento (linha reciclada da lista virtual)
+        self._dados = (titulo, segmentos)
+        if aberto:
+            self._mostrar_detalhes()
+        elif self.frame is not None:
+            self.frame.pack_forget()
+        self.aberto = aberto
+        self.botao.config(text=f"{'▼' if aberto else '▶'} {titulo}")
 
     def toggle(self):
         # expande/quebra esse painel e fecha outros que estiverem abertos no mesmo coiso
         if self.aberto:
             self.frame.pack_forget()
-            self.botao.config(text=f"▶ {self.botao.cget('text')[2:]}")
+            self.botao.config(text=f"▶ {self._dados[0]}")
             self.aberto = False
         else:
             for child in self.master.winfo_children():
                 if isinstance(child, EventoExpandivel) and child != self and child.aberto:
                     child.toggle()
-            self.frame.pack(fill='x')
-            self.botao.config(text=f"▼ {self.botao.cget('text')[2:]}")
+            self._mostrar_detalhes()
+            self.botao.config(text=f"▼ {self._dados[0]}")
             self.aberto = True
+        if self.ao_alternar:
+            self.ao_alternar(self)
 
 
 def criar_botao_arredondado(parent, texto, comando=None, min_w=140, min_h=40, pad_x=16, pad_y=10, radius=14, btn_style=None):
@@ -182,11 +196,10 @@ def criar_botao_arredondado(parent, texto, comando=None, min_w=140, min_h=40, pa
     active_bg = btn_style['activebackground']
     fg = btn_style['fg']
 
-    temp = tk.Label(c, text=texto, font=("Arial", 11, "bold"))
-    temp.update_idletasks()
-    w = max(min_w, temp.winfo_reqwidth() + 2 * pad_x)
-    h = max(min_h, temp.winfo_reqheight() + 2 * pad_y)
-    temp.destroy()
+    # tamanho do texto pelas métricas da fonte (antes: Label temporário + update_idletasks)
+    tw, th = medidas_de(c).tamanho_rotulo(texto, ("Arial", 11, "bold"))
+    w = max(min_w, tw + 2 * pad_x)
+    h = max(min_h, th + 2 * pad_y)
     c.config(width=w, height=h)
 
     def draw(cor_bg):
@@ -222,8 +222,9 @@ def criar_janela_centrada_custom(largura, altura, titulo="CAVALA Trainer"):
     return root, content
 
 
-def criar_toplevel_custom(parent, largura, altura, titulo="Janela", on_close=None):
+def criar_toplevel_custom(parent, largura, altura, titulo="Janela", on_close=None, esconder_ao_fechar=False):
     # cria Toplevel sem bordas com barra de título custom
+    # esconder_ao_fechar: o ✕ só esconde (withdraw) a janela, pra ser reaberta com deiconify
     win = tk.Toplevel(parent)
     win.overrideredirect(True)
     win.configure(bg='#404040')
@@ -263,7 +264,11 @@ def criar_toplevel_custom(parent, largura, altura, titulo="Janela", on_close=Non
             except Exception:
                 pass
         try:
-            win.destroy()
+            if esconder_ao_fechar:
+                win.grab_release()
+                win.withdraw()
+            else:
+                win.destroy()
         except Exception:
             pass
     
@@ -0,0 +1,173 @@
+import os
+import zlib
+import hashlib
+import threading
+
+from PIL import Image
+
+from .paths import cache_path
+
+# ----------------------------
+# cache de animações pré-renderizadas (gifs do menu) no tamanho de exibição
+# - um pacote (.anim) por gif + tamanho: quadros já convertidos pra RGBA e reduzidos, com as durações
+# - formato: "versao modo largura altura n\n" + durações + tamanhos + quadros (tobytes + zlib nível 1)
+#   inflar um quadro de 400x400 custa ~2 ms; decodificar + LANCZOS do gif custa ~14 ms
+# - chave: caminho + mtime + tamanho do gif + tamanho de exibição (gif trocado = pacote novo;
+#   o pacote antigo do mesmo gif/tamanho é apagado quando o novo é gravado)
+# - gerado na primeira vez que o gif toca (enquanto os quadros são decodificados), em segundo
+#   plano (preparar_em_segundo_plano) ou antes, por src/tools/gerar_animacoes.py
+# ----------------------------
+
+VERSAO_PACOTE = 1
+NIVEL_ZLIB = 1
+DURACAO_PADRAO_MS = 80
+DURACAO_MINIMA_MS = 20
+
+
+def quadros_gif(caminho, largura, altura):
+    # uma volta do gif: cada quadro em RGBA, reduzido pra caber em largura x altura
+    with Image.open(caminho) as pil:
+        idx = 0
+        while True:
+            try:
+                pil.seek(idx)
+            except EOFError:
+                return
+            frm = pil.convert("RGBA")
+            frm.thumbnail((largura, altura), Image.Resampling.LANCZOS)
+            dur = pil.info.get("duration", DURACAO_PADRAO_MS) or DURACAO_PADRAO_MS
+            yield frm, max(DURACAO_MINIMA_MS, int(dur))
+            idx += 1
+
+
+class CacheAnimacoes:
+    def __init__(self, diretorio=None):
+        self.diretorio = str(diretorio or cache_path("animacoes"))
+        self._lock = threading.Lock()
+        self._pedidos = set()      # (gif, largura, altura) já pedidos em segundo plano neste processo
+        self.acertos = 0
+        self.falhas = 0
+
+    def _prefixo(self, caminho, largura, altura):
+        nome = os.path.splitext(os.path.basename(str(caminho)))[0]
+        return f"{nome}-{largura}x{altura}-"
+
+    def arquivo(self, caminho, largura, altura):
+        # levanta OSError se o gif não existe
+        st = os.stat(caminho)
+        bruto = f"{VERSAO_PACOTE}|{os.path.abspath(caminho)}|{st.st_mtime_ns}|{st.st_size}|{largura}x{altura}"
+        chave = hashlib.sha1(bruto.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.diretorio, f"{self._prefixo(caminho, largura, altura)}{chave}.anim")
+
+    def quadros(self, caminho, largura, altura):
+        # mesmo contrato de quadros_gif: lê do pacote se existir, senão decodifica e grava o pacote
+        arquivo = self.arquivo(caminho, largura, altura)
+        if os.path.exists(arquivo):
+            try:
+                yield from self._ler_pacote(arquivo)
+                with self._lock:
+                    self.acertos += 1
+                return
+            except (OSError, ValueError, IndexError, zlib.error) as e:
+                print(f"[CACHE] pacote de animação inválido, gerando de novo: {e}")
+                # quadros já entregues antes do erro se repetem uma vez; melhor que ficar sem animação
+        with self._lock:
+            self.falhas += 1
+        yield from self._gerar(caminho, largura, altura, arquivo)
+
+    def _ler_pacote(self, arquivo):
+        with open(arquivo, "rb") as f:
+            cabecalho = f.readline().split()
+            if int(cabecalho[0]) != VERSAO_PACOTE:
+                raise ValueError(f"versão {cabecalho[0]!r}")
+            modo = cabecalho[1].decode("ascii")
+            w, h, n = int(cabecalho[2]), int(cabecalho[3]), int(cabecalho[4])
+            duracoes = [int(x) for x in f.readline().split()]
+            tamanhos = [int(x) for x in f.readline().split()]
+            if len(duracoes) != n or len(tamanhos) != n:
+                raise ValueError("cabeçalho truncado")
+            for dur, tam in zip(duracoes, tamanhos):
+                dados = f.read(tam)
+                if len(dados) != tam:
+                    raise ValueError("quadro truncado")
+                yield Image.frombytes(modo, (w, h), zlib.decompress(dados)), dur
+
+    def _gerar(self, caminho, largura, altura, arquivo):
+        # entrega cada quadro assim que decodifica; o pacote só é gravado se a volta terminar
+        blocos, duracoes, tamanho = [], [], None
+        for frm, dur in quadros_gif(caminho, largura, altura):
+            if tamanho is None:
+                tamanho = frm.size
+            if frm.size == tamanho:
+                blocos.append(zlib.compress(frm.tobytes(), NIVEL_ZLIB))
+                duracoes.append(dur)
+            else:
+                blocos = None   # quadros de tamanhos diferentes: não cabe no formato, só toca
+            yield frm, dur
+        if blocos:
+            try:
+                self._gravar(arquivo, tamanho, duracoes, blocos, self._prefixo(caminho, largura, altura))
+            except OSError as e:
+                print(f"[CACHE] não consegui gravar pacote de animação {arquivo}: {e}")
+
+    def _gravar(self, arquivo, tamanho, duracoes, blocos, prefixo):
+        os.makedirs(self.diretorio, exist_ok=True)
+        tmp = f"{arquivo}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp, "wb") as f:
+                f.write(f"{VERSAO_PACOTE} RGBA {tamanho[0]} {tamanho[1]} {len(blocos)}\n".encode("ascii"))
+                f.write((" ".join(map(str, duracoes)) + "\n").encode("ascii"))
+                f.write((" ".join(str(len(b)) for b in blocos) + "\n").encode("ascii"))
+                for b in blocos:
+                    f.write(b)
+            os.replace(tmp, arquivo)
+        except OSError:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            raise
+        # pacotes antigos do mesmo gif/tamanho (gif trocado depois da geração)
+        for fname in os.listdir(self.diretorio):
+            velho = os.path.join(self.diretorio, fname)
+            if fname.startswith(prefixo) and fname.endswith(".anim") and velho != arquivo:
+                try:
+                    os.remove(velho)
+                except OSError:
+                    pass
+
+    def gerar(self, caminho, largura, altura):
+        # garante o pacote (consome uma volta inteira); devolve o caminho do arquivo
+        arquivo = self.arquivo(caminho, largura, altura)
+        if not os.path.exists(arquivo):
+            for _ in self._gerar(caminho, largura, altura, arquivo):
+                pass
+        return arquivo
+
+    def preparar_em_segundo_plano(self, caminhos, largura, altura):
+        # gera numa thread os pacotes que faltam ou estão velhos (gif trocado), um gif por vez
+        # cada gif/tamanho é pedido no máximo uma vez por processo: chamar de novo (ex.: a cada
+        # vez que o menu aparece) não cria thread nem faz stat; devolve None se não há nada novo
+        pendentes = []
+        with self._lock:
+            for caminho in caminhos:
+                chave = (str(caminho), largura, altura)
+                if chave not in self._pedidos:
+                    self._pedidos.add(chave)
+                    pendentes.append(chave)
+        if not pendentes:
+            return None
+
+        def trabalho():
+            for chave in pendentes:
+                try:
+                    self.gerar(*chave)   # pacote em dia: só o stat do gif e do pacote
+                except Exception as e:
+                    print(f"[AVISO] Falha pré-renderizando {chave[0]}: {e}")
+
+        t = threading.Thread(target=trabalho, daemon=True, name="animacoes")
+        t.start()
+        return t
+
+
+cache_animacoes = CacheAnimacoes()
@@ -0,0 +1,128 @@
+import os
+import json
+import threading
+from collections import OrderedDict
+
+from .paths import BASE, cache_path
+from .pixels import ler_pixels
+
+# ----------------------------
+# atlas de ícones: todos os ícones já no tamanho de exibição, colados em poucas folhas
+# - gerado por src/tools/gerar_atlas.py (uma folha por variante pasta/tamanho/fundo)
+# - folhas em pixels crus (data/pixels.py): png aqui gastava ~25 ms por folha só no inflate
+# - índice (indice.json): variante -> {asset relativo: [folha, x, y, mtime_ns, tamanho]}
+# - em tempo de execução a folha é decodificada na primeira vez que alguém pede um ícone dela;
+#   os ícones saem por crop (sem abrir o png original nem redimensionar)
+# - folhas decodificadas ficam num LRU pequeno (LIMITE_FOLHAS) e são soltas de vez por
+#   descarregar(), chamado quando os seletores fecham: depois do crop quem segura os ícones são
+#   os pares de app/imagens.py, a folha inteira (~5 MB) não precisa ficar na memória
+# - só as variantes de grade entram (seletores, dezenas de ícones por vez); ícone avulso
+#   (cavala da barra de cima) vai pelo cache de miniaturas, que no quente já é rápido
+# - o lock só cobre índice e dict de folhas: decodificar a folha e recortar ficam fora dele,
+#   então threads pedindo ícones de folhas já carregadas não esperam uma folha nova decodificar
+# - ícone que não está no atlas ou cujo png mudou depois da geração (mtime/tamanho diferente)
+#   devolve None: quem chamou cai no caminho normal (cache de miniaturas)
+# ----------------------------
+
+VERSAO_ATLAS = 1
+LADO_FOLHA = 2048
+LIMITE_FOLHAS = 2
+
+# fundo em que todo ícone é composto: seletores e barra de cima têm a mesma cor de área,
+# então a mesma carta no deck e no seletor é a mesma miniatura (e o mesmo par Tk em app/imagens.py)
+FUNDO_ICONES = "#505050"
+
+# (pasta de origem, tamanho de exibição, fundo) — os tamanhos das grades dos seletores
+VARIANTES = (
+    ("icon_cartas", (96, 96), FUNDO_ICONES),    # seletor de cartas + deck / avulsa na barra de cima
+    ("icon_cavalas", (96, 96), FUNDO_ICONES),   # seletor de cavala
+)
+
+
+def nome_variante(tamanho, fundo):
+    return f"{tamanho[0]}x{tamanho[1]}-{(fundo or 'alpha').lstrip('#')}"
+
+
+def chave_asset(caminho):
+    # caminho absoluto ou relativo a BASE -> "icon_cartas/speed/x.png"
+    rel = os.path.relpath(os.path.abspath(os.path.join(BASE, caminho)), BASE)
+    return rel.replace(os.sep, "/")
+
+
+class Atlas:
+    def __init__(self, diretorio=None):
+        self.diretorio = str(diretorio or cache_path("atlas"))
+        self._lock = threading.Lock()
+        self._indice = None     # variante -> {asset: [folha, x, y, mtime_ns, tamanho]}
+        self._folhas = OrderedDict()   # nome da folha -> PIL.Image decodificada (LRU, LIMITE_FOLHAS)
+        self._decodificando = {}       # nome da folha -> lock de quem está decodificando
+        self.acertos = 0
+        self.falhas = 0
+
+    def _carregar_indice(self):
+        try:
+            with open(os.path.join(self.diretorio, "indice.json"), encoding="utf-8") as f:
+                bruto = json.load(f)
+            if bruto.get("versao") != VERSAO_ATLAS:
+                print(f"[CACHE] atlas em versão antiga, ignorando: {self.diretorio}")
+                return {}
+            return bruto.get("variantes", {})
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f"[CACHE] índice do atlas inválido, ignorando: {e}")
+            return {}
+
+    def recortar(self, caminho, sig, tamanho, fundo=None):
+        # devolve o ícone (PIL.Image RGBA) ou None se não estiver no atlas / estiver velho
+        with self._lock:
+            if self._indice is None:
+                self._indice = self._carregar_indice()
+            entrada = self._indice.get(nome_variante(tamanho, fundo), {}).get(chave_asset(caminho))
+            if entrada is None or (entrada[3], entrada[4]) != tuple(sig):
+                self.falhas += 1
+                return None
+            folha, x, y = entrada[0], entrada[1], entrada[2]
+            pixels = self._folhas.get(folha)
+            if pixels is not None:
+                self._folhas.move_to_end(folha)
+        if pixels is None:
+            pixels = self._decodificar(folha)
+            if pixels is None:
+                return None
+        img = pixels.crop((x, y, x + tamanho[0], y + tamanho[1]))
+        with self._lock:
+            self.acertos += 1
+        return img
+
+    def _decodificar(self, folha):
+        # fora do lock geral: ícones de outras folhas continuam saindo enquanto esta decodifica.
+        # o lock por folha faz as threads que pedem a mesma folha esperarem uma decodificação só
+        with self._lock:
+            lock_folha = self._decodificando.setdefault(folha, threading.Lock())
+        with lock_folha:
+            with self._lock:
+                pixels = self._folhas.get(folha)
+            if pixels is None:
+                pixels = ler_pixels(os.path.join(self.diretorio, folha))
+            with self._lock:
+                self._decodificando.pop(folha, None)
+                if pixels is None:
+                    print(f"[CACHE] folha do atlas ilegível {folha}: ausente ou truncada")
+                    self._indice = {}
+                    return None
+                self._folhas[folha] = pixels
+                self._folhas.move_to_end(folha)
+                while len(self._folhas) > LIMITE_FOLHAS:
+                    self._folhas.popitem(last=False)
+        return pixels
+
+    def descarregar(self):
+        # solta as folhas decodificadas (os ícones já recortados continuam válidos);
+        # chamado quando um seletor fecha
+        with self._lock:
+            self._folhas.clear()
+            self._indice = None
+
+
+atlas = Atlas()
@@ -0,0 +1,318 @@
+import re
+import heapq
+import unicodedata
+from bisect import bisect_left, insort
+
+# ----------------------------
+# índice de busca por carta/cavala (filtro de eventos da caixa de pesquisa)
+# - construído uma vez por item (junto com os eventos, no cache de eventos.py)
+# - prefixo: array ordenado dos títulos normalizados -> bisect, O(log n + k)
+# - contém ("in"): array de sufixos (título, deslocamento) ordenado -> bisect, O(log n + k)
+#   sem varrer todos os títulos; os sufixos não são copiados, só fatiados na comparação
+# - posições devolvidas como (indice_categoria, indice_evento), em ordem de exibição
+# - BuscaIncremental: enquanto o usuário só acrescenta letras, filtra o resultado anterior
+# ----------------------------
+
+MODO_PREFIXO = "prefixo"
+MODO_CONTEM = "contem"
+MODO_APROXIMADO = "aproximado"
+
+_FIM = "\U0010ffff"  # maior code point: p + _FIM limita o intervalo dos que começam com p
+
+
+def normalizar(texto):
+    # critério de comparação dos títulos (filtro da lista e busca global): só minúsculas
+    return str(texto).lower()
+
+
+class IndiceEventos:
+    __slots__ = ("_titulos", "_posicoes", "_prefixos", "_sufixos", "_fuzzy")
+
+    def __init__(self, categorias):
+        self._titulos = []    # título normalizado por evento
+        self._posicoes = []   # (ci, ei) por evento
+        for ci, categoria in enumerate(categorias):
+            for ei, ev in enumerate(categoria.eventos):
+                self._titulos.append(normalizar(ev.nome))
+                self._posicoes.append((ci, ei))
+
+        titulos = self._titulos
+        self._fuzzy = None  # IndiceFuzzy, montado no primeiro uso do modo aproximado
+        self._prefixos = sorted(range(len(titulos)), key=titulos.__getitem__)
+        self._sufixos = sorted(
+            ((i, off) for i, t in enumerate(titulos) for off in range(len(t))),
+            key=lambda s: titulos[s[0]][s[1]:],
+        )
+
+    def __len__(self):
+        return len(self._titulos)
+
+    def _faixa(self, ordenado, chave, filtro):
+        lo = bisect_left(ordenado, filtro, key=chave)
+        hi = bisect_left(ordenado, filtro + _FIM, lo=lo, key=chave)
+        return ordenado[lo:hi]
+
+    def buscar(self, filtro, modo=MODO_PREFIXO):
+        # devolve as posições (ci, ei) que casam com o filtro, na ordem do catálogo
+        # (no modo aproximado, na ordem de relevância)
+        # filtro vazio: None (= tudo, sem custo de montar a lista)
+        if not filtro:
+            return None
+        return self.posicoes(self.ids(filtro, modo))
+
+    def ids(self, filtro, modo=MODO_PREFIXO):
+        # mesma busca, mas devolvendo os ids internos dos eventos (ver refinar)
+        if modo == MODO_APROXIMADO:
+            if self._fuzzy is None:
+                self._fuzzy = IndiceFuzzy(self._titulos)
+            return [i for i, _ in self._fuzzy.buscar(filtro)]
+        filtro = normalizar(filtro)
+        titulos = self._titulos
+        if modo == MODO_CONTEM:
+            achados = {i for i, _ in self._faixa(self._sufixos, lambda s: titulos[s[0]][s[1]:], filtro)}
+        else:
+            achados = self._faixa(self._prefixos, titulos.__getitem__, filtro)
+        return sorted(achados)
+
+    def refinar(self, ids, filtro, modo=MODO_PREFIXO):
+        # filtro que estende o anterior ("cha" -> "chas"): só testa quem já tinha casado
+        filtro = normalizar(filtro)
+        titulos = self._titulos
+        if modo == MODO_CONTEM:
+            return [i for i in ids if filtro in titulos[i]]
+        return [i for i in ids if titulos[i].startswith(filtro)]
+
+    def posicoes(self, ids):
+        return [self._posicoes[i] for i in ids]
+
+
+class BuscaIncremental:
+    # lembra a última consulta feita num IndiceEventos: se a próxima só acrescenta letras
+    # no fim (digitação normal), o resultado novo é um subconjunto do anterior e só ele é
+    # testado. no modo aproximado a nota muda a cada letra, então sempre refaz a busca
+    __slots__ = ("indice", "modo", "_filtro", "_ids")
+
+    def __init__(self, indice, modo=MODO_PREFIXO):
+        self.indice = indice
+        self.modo = modo
+        self._filtro = ""
+        self._ids = None
+
+    def buscar(self, filtro):
+        if not filtro:
+            self._filtro, self._ids = "", None
+            return None
+        filtro = normalizar(filtro)
+        if self._ids is not None and self.modo != MODO_APROXIMADO and filtro.startswith(self._filtro):
+            ids = self._ids if filtro == self._filtro else self.indice.refinar(self._ids, filtro, self.modo)
+        else:
+            ids = self.indice.ids(filtro, self.modo)
+        self._filtro, self._ids = filtro, ids
+        return self.indice.posicoes(ids)
+
+
+# ----------------------------
+# busca aproximada (tolerante a erro de digitação) por trigramas de caracteres
+# - normalização: sem acento, minúsculas, pontuação e símbolos (as setas ❯ etc.) viram espaço
+# - cada palavra vira trigramas com borda (" ch", "cha", ..., "ng "); a última palavra da
+#   consulta fica "aberta" (sem borda final) porque ainda está sendo digitada
+# - índice invertido trigrama -> títulos; nota = fração dos trigramas da consulta presentes
+#   no título (+ bônus se a consulta normalizada aparece inteira); corta abaixo de NOTA_MINIMA
+# - consultas com menos de 3 caracteres caem em "contém" sobre o texto normalizado
+# ----------------------------
+
+NOTA_MINIMA = 0.5
+
+_RE_SEPARADOR = re.compile(r"[\W_]+")
+
+
+def normalizar_aproximado(texto):
+    texto = unicodedata.normalize("NFKD", str(texto))
+    texto = "".join(c for c in texto if not unicodedata.combining(c)).lower()
+    return " ".join(_RE_SEPARADOR.sub(" ", texto).split())
+
+
+def trigramas(texto_normalizado, aberto=False):
+    palavras = texto_normalizado.split()
+    grams = set()
+    for i, palavra in enumerate(palavras):
+        borda = "" if aberto and i == len(palavras) - 1 else " "
+        p = f" {palavra}{borda}"
+        if len(p) < 3:
+            grams.add(p)
+            continue
+        for j in range(len(p) - 2):
+            grams.add(p[j:j + 3])
+    return grams
+
+
+class IndiceFuzzy:
+    __slots__ = ("_normalizados", "_postings")
+
+    def __init__(self, titulos):
+        # titulos: lista de str (None = posição vaga, ignorada)
+        self._normalizados = [normalizar_aproximado(t) if t is not None else None for t in titulos]
+        self._postings = {}
+        for doc, norm in enumerate(self._normalizados):
+            if not norm:
+                continue
+            for gram in trigramas(norm):
+                self._postings.setdefault(gram, []).append(doc)
+
+    def buscar(self, consulta, minimo=NOTA_MINIMA):
+        # devolve [(doc, nota)] do mais relevante pro menos
+        alvo = normalizar_aproximado(consulta)
+        if not alvo:
+            return []
+        normalizados = self._normalizados
+        if len(alvo) < 3:
+            achados = [(doc, 1.0) for doc, n in enumerate(normalizados) if n and alvo in n]
+            achados.sort(key=lambda d: (len(normalizados[d[0]]), d[0]))
+            return achados
+
+        grams = trigramas(alvo, aberto=True)
+        comuns = {}
+        for gram in grams:
+            for doc in self._postings.get(gram, ()):
+                comuns[doc] = comuns.get(doc, 0) + 1
+        total = len(grams)
+        achados = []
+        for doc, n in comuns.items():
+            nota = n / total
+            if nota < minimo:
+                continue
+            if alvo in normalizados[doc]:
+                nota += 1.0
+            achados.append((doc, nota))
+        achados.sort(key=lambda d: (-d[1], len(normalizados[d[0]]), d[0]))
+        return achados
+
+
+# ----------------------------
+# busca global: um índice invertido sobre TODOS os eventos de cartas e cavalas
+# - documento = (dono, categoria, evento); dono = ("carta", card_id) ou ("cavala", nome)
+# - termo = palavra do título normalizado; vocabulário ordenado -> termos por prefixo via bisect
+#   (dá pra achar enquanto a palavra ainda está sendo digitada)
+# - todas as palavras da consulta precisam casar (AND); ranking por palavra inteira > prefixo,
+#   bônus se o título começa com a consulta, depois título mais curto
+# - atualizável por dono (hot-reload) sem reconstruir o resto
+# ----------------------------
+
+_RE_PALAVRA = re.compile(r"\w+")
+
+
+def tokens(texto):
+    return _RE_PALAVRA.findall(normalizar(texto))
+
+
+class ResultadoBusca:
+    __slots__ = ("dono", "dono_nome", "categoria", "evento")
+
+    def __init__(self, dono, dono_nome, categoria, evento):
+        self.dono = dono              # ("carta", card_id) | ("cavala", nome)
+        self.dono_nome = dono_nome    # nome exibível da carta/cavala
+        self.categoria = categoria    # nome da categoria
+        self.evento = evento          # título do evento
+
+    def __repr__(self):
+        return f"ResultadoBusca({self.evento!r} @ {self.dono_nome!r})"
+
+
+class IndiceGlobal:
+    def __init__(self):
+        self._docs = []          # id -> ResultadoBusca (None = removido)
+        self._titulos = []       # id -> título normalizado
+        self._postings = {}      # termo -> set(ids)
+        self._vocab = []         # termos ordenados
+        self._por_dono = {}      # dono -> [ids]
+        self._fuzzy = None       # IndiceFuzzy sobre os títulos, refeito após mudanças
+
+    def __len__(self):
+        return sum(len(ids) for ids in self._por_dono.values())
+
+    @classmethod
+    def construir(cls, cartas, cavalas, ler_eventos):
+        # cartas/cavalas: iteráveis de (chave, item); ler_eventos(item) -> tuple[CategoriaEventos]
+        # roda bem numa thread: não toca em Tk nem no cache LRU de quem chamou
+        indice = cls()
+        for tipo, itens in (("cavala", cavalas), ("carta", cartas)):
+            for chave, item in itens:
+                indice.adicionar_dono((tipo, chave), item.nome, ler_eventos(item))
+        return indice
+
+    def adicionar_dono(self, dono, dono_nome, categorias):
+        self.remover_dono(dono)
+        self._fuzzy = None
+        ids = []
+        for categoria in categorias:
+            for ev in categoria.eventos:
+                doc = len(self._docs)
+                self._docs.append(ResultadoBusca(dono, dono_nome, categoria.nome, ev.nome))
+                self._titulos.append(normalizar(ev.nome))
+                for termo in set(tokens(ev.nome)):
+                    posting = self._postings.get(termo)
+                    if posting is None:
+                        posting = self._postings[termo] = set()
+                        insort(self._vocab, termo)
+                    posting.add(doc)
+                ids.append(doc)
+        if ids:
+            self._por_dono[dono] = ids
+
+    def remover_dono(self, dono):
+        if dono in self._por_dono:
+            self._fuzzy = None
+        for doc in self._por_dono.pop(dono, ()):
+            for termo in set(tokens(self._docs[doc].evento)):
+                posting = self._postings.get(termo)
+                if posting is None:
+                    continue
+                posting.discard(doc)
+                if not posting:
+                    del self._postings[termo]
+                    i = bisect_left(self._vocab, termo)
+                    if i < len(self._vocab) and self._vocab[i] == termo:
+                        del self._vocab[i]
+            self._docs[doc] = None
+            self._titulos[doc] = None
+
+    def buscar(self, consulta, pagina=0, por_pagina=20, modo=None):
+        # devolve (total, [ResultadoBusca]) da página pedida
+        if modo == MODO_APROXIMADO:
+            if self._fuzzy is None:
+                self._fuzzy = IndiceFuzzy([d.evento if d else None for d in self._docs])
+            achados = self._fuzzy.buscar(consulta)
+            inicio = pagina * por_pagina
+            return len(achados), [self._docs[d] for d, _ in achados[inicio:inicio + por_pagina]]
+
+        termos = tokens(consulta)
+        if not termos:
+            return 0, []
+        pontos = {}
+        conjuntos = []
+        for termo in termos:
+            lo = bisect_left(self._vocab, termo)
+            hi = bisect_left(self._vocab, termo + _FIM, lo=lo)
+            docs_termo = set()
+            for palavra in self._vocab[lo:hi]:
+                posting = self._postings[palavra]
+                docs_termo |= posting
+                if palavra == termo:
+                    for doc in posting:
+                        pontos[doc] = pontos.get(doc, 0) + 1
+            if not docs_termo:
+                return 0, []
+            conjuntos.append(docs_termo)
+        conjuntos.sort(key=len)
+        candidatos = conjuntos[0].intersection(*conjuntos[1:])
+
+        inicio = normalizar(consulta).strip()
+        titulos = self._titulos
+
+        def ordem(doc):
+            bonus = 2 if titulos[doc].startswith(inicio) else 0
+            return (-(pontos.get(doc, 0) + bonus), len(titulos[doc]), doc)
+
+        fim = (pagina + 1) * por_pagina
+        melhores = heapq.nsmallest(fim, candidatos, key=ordem)
+        return len(candidatos), [self._docs[d] for d in melhores[pagina * por_pagina:fim]]
@@ -0,0 +1,70 @@
+import sys
+
+from .eventos import cache_eventos
+
+# ----------------------------
+# modelo tipado do catálogo (substitui os dicts crus do json.load)
+# - Carta / Cavala: cabeçalho com __slots__ (nome, imagem, tipo, raridade, arquivo, assinatura)
+# - .eventos: tuple[CategoriaEventos] carregada sob demanda (cache LRU em eventos.py)
+# - .indice(): índice de busca dos títulos, montado uma vez por item (busca.py)
+# - strings repetidas (tipo, raridade, nomes) são internadas
+# app.c: card_id -> Carta | app.cv: nome -> Cavala
+# ----------------------------
+
+__all__ = ["ItemCatalogo", "Carta", "Cavala", "item_de_cabecalho"]
+
+_intern = sys.intern
+
+
+def _opcional(valor):
+    return _intern(valor) if isinstance(valor, str) else valor
+
+
+class ItemCatalogo:
+    __slots__ = ("nome", "imagem", "tipo", "raridade", "arquivo", "assinatura")
+
+    def __init__(self, nome, imagem, tipo=None, raridade=None, arquivo=None, assinatura=None):
+        self.nome = _opcional(nome)
+        self.imagem = _opcional(imagem)        # caminho relativo à BASE
+        self.tipo = _opcional(tipo)            # 'speed', 'power'... ou 'cavala'
+        self.raridade = _opcional(raridade)    # 'SSR', 'SR', 'R' ou None
+        self.arquivo = arquivo                 # .json de origem (eventos sob demanda)
+        self.assinatura = assinatura           # (mtime_ns, tamanho) do .json no load
+
+    @property
+    def eventos(self):
+        if not self.arquivo:
+            return ()
+        return cache_eventos.obter(self.arquivo, self.assinatura)
+
+    def indice(self):
+        # IndiceEventos dos títulos (ver busca.py); None se o item não tem arquivo
+        if not self.arquivo:
+            return None
+        return cache_eventos.indice(self.arquivo, self.assinatura)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.nome!r}, {self.imagem!r})"
+
+
+class Carta(ItemCatalogo):
+    __slots__ = ()
+
+    @property
+    def card_id(self):
+        # cartas são indexadas pela imagem (nomes se repetem entre raridades)
+        return self.imagem
+
+
+class Cavala(ItemCatalogo):
+    __slots__ = ()
+
+
+def item_de_cabecalho(cab, tipo):
+    # cabeçalho (dict produzido pelos loaders/snapshot) -> Carta ou Cavala
+    classe = Carta if tipo == "carta" else Cavala
+    return classe(
+        cab.get('nome'), cab.get('imagem'),
+        tipo="cavala" if classe is Cavala else cab.get('tipo'),
+        raridade=cab.get('raridade'), arquivo=cab.get('arquivo'), assinatura=cab.get('assinatura'),
+    )
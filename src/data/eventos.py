@@ -0,0 +1,174 @@
+import re
+import sys
+import json
+import threading
+from collections import OrderedDict
+
+from .busca import IndiceEventos
+
+# ----------------------------
+# eventos sob demanda
+# - os loaders só guardam o cabeçalho de cada carta/cavala (nome, imagem, tipo, raridade)
+#   + de onde veio ('arquivo') e a assinatura do arquivo no momento do load
+# - a árvore de 'eventos' é lida do .json na primeira vez que alguém pede
+#   e fica num cache LRU limitado (deck + avulsa + cavala cabem com folga)
+# - a chave inclui a assinatura (mtime/tamanho): depois de um hot-reload o cabeçalho novo
+#   aponta pra uma chave nova e a entrada velha simplesmente sai pelo LRU
+# - os eventos viram objetos compactos (__slots__ + tuplas) com strings internadas:
+#   "Opção de cima", "Mood +1", nomes de categoria etc. existem uma vez só na memória
+# - as marcações de negrito ANSI (\033[1m ... \033[0m) dos 'detalhes' são resolvidas aqui,
+#   uma vez por carga: o widget recebe segmentos (estilo, texto) prontos, sem regex
+# ----------------------------
+
+LIMITE_CACHE_EVENTOS = 32
+
+_intern = sys.intern
+
+NORMAL = _intern("normal")
+NEGRITO = _intern("bold")
+
+# o json pode trazer o ESC de verdade ou o texto literal "\033"
+_PADROES_NEGRITO = (
+    re.compile(r"\033\[1m(.*?)\033\[0m", re.DOTALL),
+    re.compile(r"\\033\[1m(.*?)\\033\[0m", re.DOTALL),
+)
+
+
+class Evento:
+    __slots__ = ("nome", "segmentos")
+
+    def __init__(self, nome, segmentos):
+        self.nome = nome              # str
+        self.segmentos = segmentos    # tuple[(estilo, texto)], estilo = NORMAL | NEGRITO
+
+    @property
+    def texto(self):
+        # detalhes em texto puro (sem marcações)
+        return ''.join(t for _, t in self.segmentos)
+
+    def __repr__(self):
+        return f"Evento({self.nome!r})"
+
+
+class CategoriaEventos:
+    __slots__ = ("nome", "eventos")
+
+    def __init__(self, nome, eventos):
+        self.nome = nome          # str, ex: "Eventos aleatórios"
+        self.eventos = eventos    # tuple[Evento]
+
+    def __repr__(self):
+        return f"CategoriaEventos({self.nome!r}, {len(self.eventos)} eventos)"
+
+
+def _texto(valor):
+    return _intern(valor) if isinstance(valor, str) else _intern(str(valor))
+
+
+def segmentar(texto):
+    # "a \033[1mb\033[0m c" -> ((NORMAL, "a "), (NEGRITO, "b"), (NORMAL, " c"))
+    # mesmo critério que o EventoExpandivel usava: o primeiro padrão que casar vale pro texto todo
+    for padrao in _PADROES_NEGRITO:
+        segmentos = []
+        pos = 0
+        for match in padrao.finditer(texto):
+            antes = texto[pos:match.start()]
+            if antes:
+                segmentos.append((NORMAL, _intern(antes)))
+            segmentos.append((NEGRITO, _intern(match.group(1))))
+            pos = match.end()
+        if segmentos:
+            resto = texto[pos:]
+            if resto:
+                segmentos.append((NORMAL, _intern(resto)))
+            return tuple(segmentos)
+    return ((NORMAL, _intern(texto)),) if texto else ()
+
+
+def montar_eventos(bruto):
+    # converte o dict 'eventos' do json em tuple[CategoriaEventos]
+    if not isinstance(bruto, dict):
+        return ()
+    categorias = []
+    for cat, eventos in bruto.items():
+        lista = []
+        for ev in eventos if isinstance(eventos, list) else ():
+            if not isinstance(ev, dict):
+                continue
+            detalhes = ev.get('detalhes', '')
+            if isinstance(detalhes, list):
+                detalhes = '\n'.join(str(d) for d in detalhes)
+            lista.append(Evento(_texto(ev.get('nome', 'Evento')), segmentar(str(detalhes))))
+        categorias.append(CategoriaEventos(_texto(cat), tuple(lista)))
+    return tuple(categorias)
+
+
+class CacheEventos:
+    def __init__(self, limite=LIMITE_CACHE_EVENTOS):
+        self.limite = limite
+        self._itens = OrderedDict()   # (arquivo, assinatura) -> tuple[CategoriaEventos]
+        self._indices = {}            # mesma chave -> IndiceEventos (sai junto pelo LRU)
+        self._lock = threading.Lock()
+        self.acertos = 0
+        self.falhas = 0
+
+    def obter(self, arquivo, sig):
+        chave = (arquivo, sig)
+        with self._lock:
+            eventos = self._itens.get(chave)
+            if eventos is not None:
+                self._itens.move_to_end(chave)
+                self.acertos += 1
+                return eventos
+        try:
+            eventos = _ler_eventos(arquivo)
+        except Exception as e:
+            # falha não entra no cache: o próximo pedido tenta ler de novo
+            print(f"[ERRO] Falha lendo eventos de {arquivo}: {e}")
+            return ()
+        with self._lock:
+            self.falhas += 1
+            self._itens[chave] = eventos
+            self._itens.move_to_end(chave)
+            while len(self._itens) > self.limite:
+                velha, _ = self._itens.popitem(last=False)
+                self._indices.pop(velha, None)
+        return eventos
+
+    def indice(self, arquivo, sig):
+        # índice de busca dos títulos do item, montado uma vez e guardado junto dos eventos
+        # (se a leitura falhou não há entrada no cache e o índice também não é guardado)
+        eventos = self.obter(arquivo, sig)
+        chave = (arquivo, sig)
+        with self._lock:
+            indice = self._indices.get(chave)
+        if indice is None:
+            indice = IndiceEventos(eventos)
+            with self._lock:
+                if chave in self._itens:
+                    self._indices[chave] = indice
+        return indice
+
+    def limpar(self):
+        with self._lock:
+            self._itens.clear()
+            self._indices.clear()
+
+
+def _ler_eventos(arquivo):
+    # lê só a parte 'eventos' do json (o resto já está no cabeçalho); levanta em caso de erro
+    with open(arquivo, encoding='utf-8') as f:
+        dados = json.load(f)
+    return montar_eventos(dados.get('eventos', {}))
+
+
+def ler_eventos(arquivo):
+    # igual a _ler_eventos, mas devolve () (com aviso) se não conseguir ler
+    try:
+        return _ler_eventos(arquivo)
+    except Exception as e:
+        print(f"[ERRO] Falha lendo eventos de {arquivo}: {e}")
+        return ()
+
+
+cache_eventos = CacheEventos()
@@ -1,44 +1,196 @@
 import os
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .snapshot import SnapshotCatalogo, assinatura, _FALTA
+from .catalogo import item_de_cabecalho
 
 # ----------------------------
 # carrega os dados armazenados em .json
+# obs: leitura pode ser sequencial (padrão) ou paralela (pool de threads)
+# o merge é sempre feito na ordem em que os arquivos foram listados,
+# então avisos de duplicata e precedência de chaves não mudam com o modo
+# snapshot: caminho opcional de um snapshot compilado (ver snapshot.py);
+# arquivos não alterados desde a última execução não são relidos
+# os itens devolvidos são Carta/Cavala (ver catalogo.py): só o cabeçalho fica em memória,
+# os eventos são carregados sob demanda em item.eventos
+# obs: na leitura o json ainda é parseado inteiro (eventos inclusive) e o resto é descartado;
+# o ganho aqui é de memória. o tempo de parse é o que o snapshot evita nas execuções seguintes
 # ----------------------------
-def carregar_jsons(diretorio, recursivo=False, tipo="item"):
+
+def _listar_jsons(diretorio, recursivo):
+    # lista os .json na mesma ordem que o os.walk/os.listdir devolvem
+    walker = os.walk(diretorio) if recursivo else [(diretorio, [], os.listdir(diretorio))]
+    caminhos = []
+    for root, _, files in walker:
+        for fname in files:
+            if fname.endswith('.json'):
+                caminhos.append(os.path.join(root, fname))
+    return caminhos
+
+
+def _tipo_e_raridade(imagem):
+    # 'icon_cartas/speed/Kitasan_Black_SSR.png' -> ('speed', 'SSR')
+    # 'icon_cavalas/Vodka.png' -> ('cavala', None)
+    if not isinstance(imagem, str):
+        return None, None
+    partes = imagem.replace('\\', '/').split('/')
+    if partes[0] == 'icon_cavalas':
+        return 'cavala', None
+    tipo = partes[1] if partes[0] == 'icon_cartas' and len(partes) >= 3 else None
+    sufixo = os.path.splitext(partes[-1])[0].rsplit('_', 1)[-1]
+    raridade = sufixo if sufixo in ('SSR', 'SR', 'R') else None
+    return tipo, raridade
+
+
+def _cabecalho(dados, path, sig):
+    # só o que a tela inicial e os seletores precisam; 'eventos' é parseado junto
+    # (json.load não pula campos) mas descartado aqui, e relido sob demanda
+    # (ver eventos.py) a partir de 'arquivo' + 'assinatura'
+    imagem = dados.get('imagem')
+    tipo, raridade = _tipo_e_raridade(imagem)
+    return {
+        'nome': dados.get('nome'),
+        'imagem': imagem,
+        'tipo': tipo,
+        'raridade': raridade,
+        'arquivo': path,
+        'assinatura': sig,
+    }
+
+
+def _ler_json(path):
+    # lê e faz parse de um arquivo, devolvendo (path, cabeçalho, erro, segundos)
+    t0 = time.perf_counter()
+    try:
+        sig = assinatura(os.stat(path))
+        with open(path, encoding='utf-8') as f:
+            dados = json.load(f)
+        if isinstance(dados, dict):
+            dados = _cabecalho(dados, path, sig)
+        erro = None
+    except Exception as e:
+        dados, erro = None, e
+    return path, dados, erro, time.perf_counter() - t0
+
+
+def _ler_todos(caminhos, paralelo=False, workers=None, snapshot=None):
+    # ex.map preserva a ordem de entrada, então o resultado é determinístico
+    # com snapshot: arquivos sem mudança (mtime/tamanho) vêm do cache e só o resto é lido
+    sigs = {}
+    pendentes = caminhos
+    if snapshot is not None:
+        cache = _abrir_snapshot(snapshot)
+        prontos = {}
+        pendentes = []
+        for p in caminhos:
+            try:
+                sigs[p] = assinatura(os.stat(p))
+            except OSError:
+                pendentes.append(p)
+                continue
+            dados = cache.obter(p, sigs[p])
+            if dados is _FALTA:
+                pendentes.append(p)
+            else:
+                prontos[p] = (p, dados, None, None)
+
+    if paralelo and len(pendentes) > 1:
+        workers = workers or min(8, (os.cpu_count() or 1) + 4)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="loader") as ex:
+            lidos = list(ex.map(_ler_json, pendentes))
+    else:
+        lidos = [_ler_json(p) for p in pendentes]
+
+    if snapshot is None:
+        return lidos
+
+    for r in lidos:
+        path, dados, erro, _ = r
+        if erro is None and path in sigs:
+            cache.guardar(path, sigs[path], dados)
+        prontos[path] = r
+    cache.podar(caminhos)
+    cache.salvar()
+    if pendentes:
+        print(f"[CACHE] {os.path.basename(str(snapshot))}: {len(caminhos) - len(pendentes)} do snapshot, "
+              f"{len(pendentes)} relidos")
+    return [prontos[p] for p in caminhos]
+
+
+def _abrir_snapshot(snapshot):
+    # aceita o caminho do arquivo ou uma instância já aberta
+    if isinstance(snapshot, SnapshotCatalogo):
+        return snapshot
+    return SnapshotCatalogo(snapshot)
+
+
+def relatorio_tempos(tempos, rotulo="dados", top=5):
+    # imprime total e os arquivos mais lentos de um dict path -> segundos
+    if not tempos:
+        return
+    total = sum(tempos.values())
+    print(f"[TEMPO] {rotulo}: {len(tempos)} arquivos, {total * 1000:.1f} ms somando leituras")
+    for path, dt in sorted(tempos.items(), key=lambda kv: kv[1], reverse=True)[:top]:
+        print(f"[TEMPO]   {dt * 1000:7.2f} ms  {path}")
+
+
+def _chave_item(dados, path, tipo):
+    # chave do item no catálogo: 'imagem' para cartas, 'nome' para o resto
+    # devolve None (com aviso) se o json não tiver os campos necessários
+    nome = dados.get('nome')
+    if tipo == "carta":
+        imagem = dados.get('imagem')  # caminho relativo p/ imagem (único por tipo/raridade)
+        if not nome or not imagem:
+            print(f"[AVISO] carta com 'nome' ou 'imagem' ausente: {path}")
+            return None
+        return imagem
+    if not nome:
+        print(f"[AVISO] JSON sem 'nome': {path}")
+        return None
+    return nome
+
+
+def carregar_jsons(diretorio, recursivo=False, tipo="item", paralelo=False, workers=None, tempos=None,
+                   snapshot=None, origens=None):
     # ----------------------------
-    # carrega json de um diretório e retorna um dicionário mapeando 'nome' -> dados
-    # obs: para cartas com nomes repetidos, ia sobrescrever 
+    # carrega json de um diretório e retorna um dicionário mapeando 'nome' -> Cavala
+    # obs: para cartas com nomes repetidos, ia sobrescrever
     # por isso usamos essa função para 'cavalas' (onde o nome deve ser unico)
     # e uma função custom para 'cartas' (indexando por imagem, nome não unico)
+    # tempos: dict opcional preenchido com path -> segundos de leitura/parse
+    # origens: dict opcional preenchido com chave -> [paths] na ordem de leitura, o último é o que
+    # vale (usado pelo hot-reload, que precisa saber das duplicatas sobrescritas também)
     # ----------------------------
     itens = {}
     if not os.path.isdir(diretorio):
         print(f"[AVISO] Diretório não encontrado: {diretorio}")
         return itens
 
-    walker = os.walk(diretorio) if recursivo else [(diretorio, [], os.listdir(diretorio))]
-    for root, _, files in walker:
-        for fname in files:
-            if not fname.endswith('.json'):
+    caminhos = _listar_jsons(diretorio, recursivo)
+    for path, dados, erro, dt in _ler_todos(caminhos, paralelo, workers, snapshot):
+        if tempos is not None and dt is not None:
+            tempos[path] = dt
+        if erro is not None:
+            print(f"[ERRO] Falha lendo {path}: {erro}")
+            continue
+        try:
+            nome = _chave_item(dados, path, tipo)
+            if not nome:
                 continue
-            path = os.path.join(root, fname)
-            try:
-                with open(path, encoding='utf-8') as f:
-                    dados = json.load(f)
-                nome = dados.get('nome')
-                if not nome:
-                    print(f"[AVISO] JSON sem 'nome': {path}")
-                    continue
-                # aviso para duplicatas por nome (só pra cavalas)
-                if nome in itens:
-                    print(f"[AVISO] {tipo} duplicado '{nome}' em {path}")
-                itens[nome] = dados
-            except Exception as e:
-                print(f"[ERRO] Falha lendo {path}: {e}")
+            # aviso para duplicatas por nome (só pra cavalas)
+            if nome in itens:
+                print(f"[AVISO] {tipo} duplicado '{nome}' em {path}")
+            itens[nome] = item_de_cabecalho(dados, tipo)
+            if origens is not None:
+                origens.setdefault(nome, []).append(path)
+        except Exception as e:
+            print(f"[ERRO] Falha lendo {path}: {e}")
     return itens
 
 
-def carregar_cartas(diretorio):
+def carregar_cartas(diretorio, paralelo=False, workers=None, tempos=None, snapshot=None, origens=None):
     # ----------------------------
     # carrega cartas indexando pelo caminho da imagem (card_id)
     # permite que cartas com o mesmo nome existam (contanto que tenham imagens diferentes)
@@ -48,34 +200,54 @@ def carregar_cartas(diretorio):
         print(f"[AVISO] Diretório não encontrado: {diretorio}")
         return itens
 
-    for root, _, files in os.walk(diretorio):
-        for fname in files:
-            if not fname.endswith('.json'):
+    caminhos = _listar_jsons(diretorio, recursivo=True)
+    for path, dados, erro, dt in _ler_todos(caminhos, paralelo, workers, snapshot):
+        if tempos is not None and dt is not None:
+            tempos[path] = dt
+        if erro is not None:
+            print(f"[ERRO] Falha lendo {path}: {erro}")
+            continue
+        try:
+            key = _chave_item(dados, path, "carta")
+            if not key:
                 continue
-            path = os.path.join(root, fname)
-            try:
-                with open(path, encoding='utf-8') as f:
-                    dados = json.load(f)
-
-                nome = dados.get('nome')
-                imagem = dados.get('imagem')  # caminho relativo p/ imagem (único por tipo/raridade)
-                if not nome or not imagem:
-                    print(f"[AVISO] carta com 'nome' ou 'imagem' ausente: {path}")
-                    continue
 
-                key = imagem
-                if key in itens:
-                    # se duas cartas apontarem para a mesma imagem, tem aviso no terminal
-                    print(f"[AVISO] carta duplicada por imagem '{key}' em {path}")
+            if key in itens:
+                # se duas cartas apontarem para a mesma imagem, tem aviso no terminal
+                print(f"[AVISO] carta duplicada por imagem '{key}' em {path}")
 
-                itens[key] = dados
-            except Exception as e:
-                print(f"[ERRO] Falha lendo {path}: {e}")
+            itens[key] = item_de_cabecalho(dados, "carta")
+            if origens is not None:
+                origens.setdefault(key, []).append(path)
+        except Exception as e:
+            print(f"[ERRO] Falha lendo {path}: {e}")
     return itens
 
 
-def carregar_cavalas(diretorio):
+def carregar_cavalas(diretorio, paralelo=False, workers=None, tempos=None, snapshot=None, origens=None):
     # ----------------------------
     # carrega cavalas indexando por 'nome' (nome é único)
     # ----------------------------
-    return carregar_jsons(diretorio, recursivo=False, tipo="cavala")
\ No newline at end of file
+    return carregar_jsons(diretorio, recursivo=False, tipo="cavala",
+                          paralelo=paralelo, workers=workers, tempos=tempos,
+                          snapshot=snapshot, origens=origens)
+
+
+def reler_arquivos(caminhos, tipo):
+    # ----------------------------
+    # relê só os arquivos informados (hot-reload) e devolve [(path, chave, Carta | Cavala)]
+    # chave é None se o arquivo sumiu, está inválido ou sem os campos obrigatórios
+    # ----------------------------
+    resultado = []
+    for path, dados, erro, _ in _ler_todos(list(caminhos)):
+        chave = None
+        if erro is not None:
+            if not isinstance(erro, FileNotFoundError):
+                print(f"[ERRO] Falha lendo {path}: {erro}")
+        else:
+            try:
+                chave = _chave_item(dados, path, tipo)
+            except Exception as e:
+                print(f"[ERRO] Falha lendo {path}: {e}")
+        resultado.append((path, chave, item_de_cabecalho(dados, tipo) if chave else None))
+    return resultado
@@ -0,0 +1,157 @@
+import os
+import time
+import hashlib
+import threading
+
+from PIL import Image
+
+from .paths import cache_path
+from .pixels import ler_pixels, gravar_pixels
+from .atlas import atlas as atlas_padrao
+
+# ----------------------------
+# cache de miniaturas em disco (ícones de cartas/cavalas já redimensionados)
+# - chave: caminho da imagem original + (mtime_ns, tamanho) + tamanho alvo + cor de fundo;
+#   trocar o png original (ou o tamanho/fundo pedido) gera outra chave, a velha sai pela poda
+# - guarda os pixels crus (data/pixels.py): no acerto não há
+#   decode de png nem LANCZOS, só ler ~36 KB e Image.frombytes
+# - tamanho total limitado (LIMITE_MINIATURAS_BYTES): ao passar do limite, apaga as menos
+#   usadas até ficar em 90% do limite. o último uso fica em memória (atualizado a cada acerto);
+#   o mtime do arquivo só é "tocado" quando está mais velho que TOQUE_MINIMO_NS, pra ordem de uso
+#   sobreviver entre execuções sem um utime por acerto
+# - antes de tudo tenta o atlas de ícones (data/atlas.py): uma folha decodificada serve todos
+# - sem Tk: devolve PIL.Image; quem exibe cria o PhotoImage
+# ----------------------------
+
+LIMITE_MINIATURAS_BYTES = 64 * 1024 * 1024
+TOQUE_MINIMO_NS = 3600 * 10**9   # 1 h
+_EXT = ".px"
+
+
+def _redimensionar(caminho, tamanho, fundo):
+    # o mesmo tratamento que seletores e barra de cima faziam direto
+    img = Image.open(caminho).convert("RGBA")
+    img = img.resize(tamanho, Image.Resampling.LANCZOS)
+    if fundo is not None:
+        img = Image.alpha_composite(Image.new("RGBA", img.size, fundo), img)
+    return img
+
+
+class CacheMiniaturas:
+    def __init__(self, diretorio=None, limite_bytes=LIMITE_MINIATURAS_BYTES, atlas=atlas_padrao):
+        self.diretorio = str(diretorio or cache_path("miniaturas"))
+        self.atlas = atlas      # None = não consulta atlas
+        self.limite_bytes = limite_bytes
+        self._lock = threading.Lock()
+        self._entradas = None   # nome -> (bytes, último uso, mtime no disco); lido do disco no primeiro uso
+        self._total = 0
+        self.acertos = 0
+        self.falhas = 0
+
+    def _indexar(self):
+        self._entradas = {}
+        self._total = 0
+        try:
+            with os.scandir(self.diretorio) as it:
+                for entrada in it:
+                    if not entrada.name.endswith(_EXT):
+                        continue
+                    st = entrada.stat()
+                    self._entradas[entrada.name] = (st.st_size, st.st_mtime_ns, st.st_mtime_ns)
+                    self._total += st.st_size
+        except FileNotFoundError:
+            pass
+
+    def _nome(self, caminho, sig, tamanho, fundo):
+        bruto = f"{os.path.abspath(caminho)}|{sig[0]}|{sig[1]}|{tamanho[0]}x{tamanho[1]}|{fundo}"
+        return hashlib.sha1(bruto.encode("utf-8")).hexdigest() + _EXT
+
+    def obter(self, caminho, tamanho, fundo=None):
+        # devolve a miniatura (PIL.Image RGBA); levanta OSError/erro do Pillow se o original
+        # não existe ou não abre, igual ao Image.open que substitui
+        st = os.stat(caminho)
+        sig = (st.st_mtime_ns, st.st_size)
+        if self.atlas is not None:
+            img = self.atlas.recortar(caminho, sig, tamanho, fundo)
+            if img is not None:
+                return img
+        nome = self._nome(caminho, sig, tamanho, fundo)
+        arquivo = os.path.join(self.diretorio, nome)
+        with self._lock:
+            if self._entradas is None:
+                self._indexar()
+            conhecida = nome in self._entradas
+
+        if conhecida:
+            img = ler_pixels(arquivo)   # None se sumiu/truncou: trata como falha e regrava
+            if img is not None:
+                agora = time.time_ns()
+                tocar = False
+                with self._lock:
+                    self.acertos += 1
+                    entrada = self._entradas.get(nome)
+                    if entrada is not None:
+                        tamanho_bytes, _, disco = entrada
+                        tocar = agora - disco > TOQUE_MINIMO_NS
+                        self._entradas[nome] = (tamanho_bytes, agora, agora if tocar else disco)
+                if tocar:
+                    try:
+                        os.utime(arquivo, ns=(agora, agora))
+                    except OSError:
+                        pass
+                return img
+
+        img = _redimensionar(caminho, tamanho, fundo)
+        with self._lock:
+            self.falhas += 1
+        self._gravar(arquivo, nome, img)
+        return img
+
+    def _gravar(self, arquivo, nome, img):
+        try:
+            gravar_pixels(arquivo, img, tmp=f"{arquivo}.{threading.get_ident()}.tmp")
+            tamanho = os.path.getsize(arquivo)
+        except OSError as e:
+            print(f"[CACHE] Falha gravando miniatura {arquivo}: {e}")
+            return
+        with self._lock:
+            antigo = self._entradas.pop(nome, (0, 0, 0))[0]
+            agora = time.time_ns()
+            self._entradas[nome] = (tamanho, agora, agora)
+            self._total += tamanho - antigo
+            if self._total > self.limite_bytes:
+                self._podar()
+
+    def _podar(self):
+        # chamado com o lock: apaga as menos usadas até 90% do limite
+        alvo = self.limite_bytes * 0.9
+        for nome, (tamanho, _, _) in sorted(self._entradas.items(), key=lambda e: e[1][1]):
+            if self._total <= alvo:
+                break
+            try:
+                os.remove(os.path.join(self.diretorio, nome))
+            except FileNotFoundError:
+                pass
+            except OSError:
+                continue
+            del self._entradas[nome]
+            self._total -= tamanho
+
+    def limpar(self):
+        with self._lock:
+            if self._entradas is None:
+                self._indexar()
+            for nome in list(self._entradas):
+                try:
+                    os.remove(os.path.join(self.diretorio, nome))
+                except OSError:
+                    pass
+            self._entradas = {}
+            self._total = 0
+
+    @property
+    def total_bytes(self):
+        return self._total
+
+
+cache_miniaturas = CacheMiniaturas()
@@ -5,6 +5,10 @@ from pathlib import Path
 DATA_DIR = Path(__file__).resolve().parent            # .../src/data
 SRC_DIR = DATA_DIR.parent                             # .../src
 BASE = SRC_DIR.parent                                 # .../
+CACHE_DIR = BASE / ".cache"                           # .../.cache (gerado, fora do git)
 
 def asset_path(*parts: str) -> Path:
-    return BASE.joinpath(*parts)
\ No newline at end of file
+    return BASE.joinpath(*parts)
+
+def cache_path(*parts: str) -> Path:
+    return CACHE_DIR.joinpath(*parts)
\ No newline at end of file
@@ -0,0 +1,39 @@
+import os
+
+from PIL import Image
+
+# ----------------------------
+# formato "pixels crus" usado pelos caches de imagem (miniaturas, atlas):
+# cabeçalho "modo largura altura\n" + Image.tobytes()
+# - ler é um read + Image.frombytes, sem decoder (png/zlib) no caminho
+# - gravação atômica (tmp + os.replace): quem lê nunca vê arquivo pela metade
+# ----------------------------
+
+
+def ler_pixels(arquivo):
+    # devolve PIL.Image ou None se o arquivo não existe / está truncado
+    try:
+        with open(arquivo, "rb") as f:
+            cabecalho = f.readline().split()
+            dados = f.read()
+        modo, w, h = cabecalho[0].decode("ascii"), int(cabecalho[1]), int(cabecalho[2])
+        return Image.frombytes(modo, (w, h), dados)
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def gravar_pixels(arquivo, img, tmp=None):
+    # levanta OSError se não conseguir gravar (o tmp é removido)
+    tmp = tmp or arquivo + ".tmp"
+    try:
+        os.makedirs(os.path.dirname(arquivo) or ".", exist_ok=True)
+        with open(tmp, "wb") as f:
+            f.write(f"{img.mode} {img.width} {img.height}\n".encode("ascii"))
+            f.write(img.tobytes())
+        os.replace(tmp, arquivo)
+    except OSError:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
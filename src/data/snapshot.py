@@ -0,0 +1,84 @@
+import os
+import pickle
+
+# ----------------------------
+# snapshot compilado do catálogo (cartas/cavalas) em disco
+# - guarda, por arquivo .json, o cabeçalho extraído no parse junto com (mtime_ns, tamanho)
+# - na próxima abertura, arquivos com mesmo mtime/tamanho são reaproveitados
+#   direto do snapshot (uma leitura só) e apenas os editados são relidos
+# - formato: pickle (binário, rápido de carregar); se estiver corrompido ou
+#   numa versão antiga é simplesmente ignorado e recriado
+# ----------------------------
+
+VERSAO_SNAPSHOT = 2
+
+_FALTA = object()
+
+
+def assinatura(st):
+    # o "manifesto" de um arquivo: mtime em ns + tamanho
+    return (st.st_mtime_ns, st.st_size)
+
+
+class SnapshotCatalogo:
+    def __init__(self, arquivo):
+        self.arquivo = str(arquivo)
+        self.entradas = {}   # path -> (assinatura, dados)
+        self.sujo = False
+        self.acertos = 0
+        self.falhas = 0
+        self._carregar()
+
+    def _carregar(self):
+        try:
+            with open(self.arquivo, "rb") as f:
+                bruto = pickle.load(f)
+            if bruto.get("versao") != VERSAO_SNAPSHOT:
+                print(f"[CACHE] snapshot em versão antiga, ignorando: {self.arquivo}")
+                return
+            self.entradas = bruto.get("entradas", {})
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"[CACHE] snapshot inválido, ignorando {self.arquivo}: {e}")
+            self.entradas = {}
+
+    def obter(self, path, sig):
+        # devolve os dados em cache se o arquivo não mudou, senão _FALTA
+        entrada = self.entradas.get(path)
+        if entrada is not None and entrada[0] == sig:
+            self.acertos += 1
+            return entrada[1]
+        self.falhas += 1
+        return _FALTA
+
+    def guardar(self, path, sig, dados):
+        self.entradas[path] = (sig, dados)
+        self.sujo = True
+
+    def podar(self, caminhos_vivos):
+        # remove entradas de arquivos que foram apagados/renomeados
+        vivos = set(caminhos_vivos)
+        mortos = [p for p in self.entradas if p not in vivos]
+        for p in mortos:
+            del self.entradas[p]
+        if mortos:
+            self.sujo = True
+
+    def salvar(self):
+        if not self.sujo:
+            return
+        tmp = self.arquivo + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(self.arquivo) or ".", exist_ok=True)
+            with open(tmp, "wb") as f:
+                pickle.dump({"versao": VERSAO_SNAPSHOT, "entradas": self.entradas},
+                            f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self.arquivo)
+            self.sujo = False
+        except Exception as e:
+            print(f"[CACHE] Falha salvando snapshot {self.arquivo}: {e}")
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
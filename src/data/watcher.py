@@ -0,0 +1,194 @@
+import os
+
+from .loaders import reler_arquivos, _listar_jsons
+from .snapshot import assinatura
+
+# ----------------------------
+# hot-reload de cartas/ e cavalas/ enquanto o app está aberto
+# - polling barato: mtime de cada pasta (detecta arquivos novos/removidos sem relistar tudo)
+#   + cache de stat por arquivo (detecta edição in-place, que não muda o mtime da pasta)
+# - só os arquivos alterados são relidos; o custo é proporcional ao que mudou
+# - não conhece Tk: quem chama (menu/UmaApp) decide quando verificar e como redesenhar
+# ----------------------------
+
+
+class ObservadorDiretorio:
+    def __init__(self, diretorio, recursivo=True):
+        self.diretorio = str(diretorio)
+        self.recursivo = recursivo
+        self._dirs = {}       # pasta -> mtime_ns
+        self._arquivos = {}   # path .json -> (mtime_ns, tamanho)
+        if os.path.isdir(self.diretorio):
+            self._indexar(self.diretorio)
+
+    def _indexar(self, raiz):
+        # registra uma pasta (e subpastas, se recursivo) e devolve os .json encontrados
+        encontrados = []
+        walker = os.walk(raiz) if self.recursivo else [(raiz, [], os.listdir(raiz))]
+        for root, _, files in walker:
+            try:
+                self._dirs[root] = os.stat(root).st_mtime_ns
+            except OSError:
+                continue
+            for fname in files:
+                if not fname.endswith('.json'):
+                    continue
+                path = os.path.join(root, fname)
+                try:
+                    self._arquivos[path] = assinatura(os.stat(path))
+                except OSError:
+                    continue
+                encontrados.append(path)
+        return encontrados
+
+    def verificar(self):
+        # devolve (alterados, removidos) desde a última verificação
+        alterados, removidos = [], []
+
+        # 1) pastas cujo mtime mudou: procura arquivos/subpastas novos
+        for pasta, mtime in list(self._dirs.items()):
+            try:
+                atual = os.stat(pasta).st_mtime_ns
+            except OSError:
+                del self._dirs[pasta]
+                continue
+            if atual == mtime:
+                continue
+            self._dirs[pasta] = atual
+            try:
+                nomes = os.listdir(pasta)
+            except OSError:
+                continue
+            for nome in nomes:
+                path = os.path.join(pasta, nome)
+                if nome.endswith('.json'):
+                    if path not in self._arquivos:
+                        try:
+                            self._arquivos[path] = assinatura(os.stat(path))
+                        except OSError:
+                            continue
+                        alterados.append(path)
+                elif self.recursivo and path not in self._dirs and os.path.isdir(path):
+                    alterados.extend(self._indexar(path))
+
+        # 2) stat de cada arquivo conhecido (edição ou remoção)
+        novos = set(alterados)
+        for path, sig in list(self._arquivos.items()):
+            if path in novos:
+                continue
+            try:
+                atual = assinatura(os.stat(path))
+            except OSError:
+                del self._arquivos[path]
+                removidos.append(path)
+                continue
+            if atual != sig:
+                self._arquivos[path] = atual
+                alterados.append(path)
+
+        return alterados, removidos
+
+
+class RecarregadorCatalogo:
+    # junta um observador por pasta e traduz arquivos alterados em mudanças de catálogo:
+    # {"cartas": {card_id: dados | None}, "cavalas": {nome: dados | None}} (None = removido)
+    # cada chave guarda todos os arquivos que a fornecem (duplicatas sobrescritas inclusive),
+    # então apagar/editar o arquivo que vale faz a duplicata de baixo voltar, como num load novo
+    def __init__(self, dir_cartas, dir_cavalas):
+        self._fontes = {
+            "cartas": {"obs": ObservadorDiretorio(dir_cartas, recursivo=True), "tipo": "carta",
+                       "chaves": {}, "caminhos": {}},
+            "cavalas": {"obs": ObservadorDiretorio(dir_cavalas, recursivo=False), "tipo": "cavala",
+                        "chaves": {}, "caminhos": {}},
+        }
+
+    def registrar_origens(self, nome, origens):
+        # origens: chave -> [paths] na ordem de leitura, como preenchido pelos loaders
+        fonte = self._fontes[nome]
+        fonte["caminhos"] = {chave: list(paths) for chave, paths in origens.items()}
+        fonte["chaves"] = {path: chave for chave, paths in origens.items() for path in paths}
+
+    def verificar(self):
+        mudancas = {}
+        for nome, fonte in self._fontes.items():
+            alterados, removidos = fonte["obs"].verificar()
+            if not alterados and not removidos:
+                continue
+            delta = self._delta(fonte, alterados, removidos)
+            if delta:
+                print(f"[RELOAD] {nome}: {len(alterados)} alterado(s), {len(removidos)} removido(s)")
+                mudancas[nome] = delta
+        return mudancas
+
+    def _delta(self, fonte, alterados, removidos):
+        chaves, caminhos = fonte["chaves"], fonte["caminhos"]
+        antes = {}   # chave afetada -> arquivo que valia antes da mudança
+
+        def tocar(chave):
+            if chave not in antes:
+                antes[chave] = precedencia(caminhos.get(chave))
+
+        def soltar(path):
+            chave = chaves.pop(path, None)
+            if chave:
+                tocar(chave)
+                caminhos[chave].remove(path)
+            return chave
+
+        for path in removidos:
+            soltar(path)
+        lidos = {}
+        for path, chave, dados in reler_arquivos(alterados, fonte["tipo"]):
+            if chaves.get(path) != chave:
+                soltar(path)
+                if chave:
+                    tocar(chave)
+                    lista = caminhos.setdefault(chave, [])
+                    if lista:
+                        print(f"[AVISO] {fonte['tipo']} duplicado '{chave}' em {path}")
+                    lista.append(path)   # a posição certa sai da listagem, logo abaixo
+                    chaves[path] = chave
+            elif chave:
+                tocar(chave)
+            if chave:
+                lidos[path] = dados
+
+        # chave com mais de um arquivo: ordena pela mesma listagem que o loader usa
+        # (os.walk/os.listdir), então o vencedor é o mesmo que um load do zero escolheria
+        duplicadas = [c for c in antes if len(caminhos.get(c) or ()) > 1]
+        if duplicadas:
+            obs = fonte["obs"]
+            ordem = {p: i for i, p in enumerate(_listar_jsons(obs.diretorio, obs.recursivo))}
+            for chave in duplicadas:
+                caminhos[chave].sort(key=lambda p: ordem.get(p, len(ordem)))
+
+        delta, reler = {}, {}
+        for chave, anterior in antes.items():
+            vencedor = precedencia(caminhos.get(chave))
+            if vencedor is None:
+                caminhos.pop(chave, None)
+                delta[chave] = None
+            elif vencedor in lidos:
+                delta[chave] = lidos[vencedor]
+            elif vencedor != anterior:
+                # quem valia saiu e uma duplicata sobrescrita volta: relê essa
+                reler[vencedor] = chave
+        for path, chave, dados in reler_arquivos(reler, fonte["tipo"]):
+            # se mudou de chave nesse meio tempo, a próxima verificação acerta
+            delta[reler[path]] = dados if chave == reler[path] else None
+        return delta
+
+
+def precedencia(caminhos):
+    # arquivo que vale entre os que fornecem a mesma chave, com caminhos na ordem da listagem;
+    # mesma regra dos loaders: o último na ordem de leitura sobrescreve os anteriores
+    return caminhos[-1] if caminhos else None
+
+
+def aplicar_mudancas(catalogo, delta):
+    # aplica um delta {chave: dados | None} num dict de catálogo (in-place)
+    for chave, dados in delta.items():
+        if dados is None:
+            catalogo.pop(chave, None)
+        else:
+            catalogo[chave] = dados
@@ -0,0 +1,57 @@
+# ----------------------------
+# mede memória por entrada do catálogo: dicts crus do json.load vs modelo tipado
+# uso: python -m src.tools.bench_catalogo
+# ----------------------------
+import gc
+import json
+import tracemalloc
+
+from ..data.paths import asset_path
+from ..data.loaders import carregar_cartas, carregar_cavalas, _listar_jsons
+from ..data.eventos import ler_eventos
+
+
+def _medir(fn):
+    gc.collect()
+    tracemalloc.start()
+    resultado = fn()
+    gc.collect()
+    usado = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return resultado, usado
+
+
+def _crus():
+    itens = []
+    for pasta, recursivo in (("cartas", True), ("cavalas", False)):
+        for path in _listar_jsons(str(asset_path(pasta)), recursivo):
+            with open(path, encoding='utf-8') as f:
+                itens.append(json.load(f))
+    return itens
+
+
+def _tipados():
+    cartas = carregar_cartas(str(asset_path("cartas")))
+    cavalas = carregar_cavalas(str(asset_path("cavalas")))
+    # materializa todos os eventos (sem o LRU) pra comparar a árvore inteira
+    eventos = [ler_eventos(item.arquivo) for item in list(cartas.values()) + list(cavalas.values())]
+    return cartas, cavalas, eventos
+
+
+def _so_cabecalhos():
+    return carregar_cartas(str(asset_path("cartas"))), carregar_cavalas(str(asset_path("cavalas")))
+
+
+def main():
+    crus, b_crus = _medir(_crus)
+    (cartas, cavalas, _), b_tip = _medir(_tipados)
+    _, b_cab = _medir(_so_cabecalhos)
+    n = len(crus)
+    print(f"entradas: {n} arquivos ({len(cartas)} cartas, {len(cavalas)} cavalas)")
+    print(f"dicts crus (json.load):      {b_crus / 1024:8.1f} KB  | {b_crus / n:7.0f} B/entrada")
+    print(f"modelo tipado + eventos:     {b_tip / 1024:8.1f} KB  | {b_tip / n:7.0f} B/entrada")
+    print(f"modelo tipado só cabeçalho:  {b_cab / 1024:8.1f} KB  | {b_cab / n:7.0f} B/entrada")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+# ----------------------------
+# mede o custo de montar o painel de eventos da maior carta (mais eventos):
+# - antes: réplica do EventoExpandivel antigo (_evento_antigo), a partir dos 'detalhes' crus do json:
+#   update_idletasks no botão, Text montado na hora com 2 Font novas, regex de negrito,
+#   update_idletasks no Text pra contar as linhas e os 6 binds de scroll
+# - depois: EventoExpandivel atual, só Frame + Button; detalhes montados no primeiro toggle
+# precisa de display (abre uma janela Tk escondida)
+# uso: python -m src.tools.bench_eventos [--repeticoes 3]
+# ----------------------------
+import re
+import json
+import time
+import argparse
+import tkinter as tk
+from tkinter.font import Font
+
+from ..data.paths import asset_path
+from ..data.loaders import carregar_cartas, carregar_cavalas
+from ..app.widgets import EventoExpandivel
+
+
+def _maior_item():
+    itens = list(carregar_cartas(str(asset_path("cartas"))).values())
+    itens += list(carregar_cavalas(str(asset_path("cavalas"))).values())
+    return max(itens, key=lambda item: sum(len(c.eventos) for c in item.eventos))
+
+
+def _eventos_brutos(item):
+    # [(categoria, [(titulo, detalhes)])] como estão no json, sem passar por eventos.py
+    with open(item.arquivo, encoding='utf-8') as f:
+        bruto = json.load(f).get('eventos', {})
+    return [
+        (cat, [(ev.get('nome', 'Evento'), ev.get('detalhes', '')) for ev in evs if isinstance(ev, dict)])
+        for cat, evs in bruto.items() if isinstance(evs, list)
+    ]
+
+
+_PADROES_ANTIGOS = [
+    re.compile(r"\033\[1m(.*?)\033\[0m", re.DOTALL),
+    re.compile(r"\\033\[1m(.*?)\\033\[0m", re.DOTALL),
+]
+
+
+def _evento_antigo(master, titulo, detalhes):
+    # mesmo trabalho que o construtor do EventoExpandivel fazia antes do toggle sob demanda
+    painel = tk.Frame(master, bg='#606060')
+    botao = tk.Button(painel, text=f"▶ {titulo}", anchor="center", justify="center", fg='white',
+                      bg='#1a1a1a', activebackground='#333333', activeforeground='white', bd=0)
+    botao.pack(fill='x')
+    botao.update_idletasks()
+    botao.config(width=int(4000 / botao.winfo_fpixels('1c')))
+
+    frame = tk.Frame(painel, bg='#324b4c')
+    texto = '\n'.join(detalhes) if isinstance(detalhes, list) else detalhes
+    text_widget = tk.Text(frame, wrap='word', height=1, width=50, borderwidth=0, background='#324b4c',
+                          fg='white', insertbackground='white', padx=14, pady=7)
+    text_widget.pack(fill='both', expand=True)
+    text_widget.config(state='normal')
+    text_widget.tag_configure("normal", font=Font(family="Arial", size=10), justify='center', foreground='white')
+    text_widget.tag_configure("bold", font=Font(family="Arial", size=10, weight="bold"), justify='center',
+                              foreground='#ffff99')
+
+    aplicado = False
+    for padrao in _PADROES_ANTIGOS:
+        pos = 0
+        achou = False
+        for match in padrao.finditer(texto):
+            achou = True
+            antes = texto[pos:match.start()]
+            if antes:
+                text_widget.insert('end', antes, ("normal",))
+            text_widget.insert('end', match.group(1), ("bold",))
+            pos = match.end()
+        if achou:
+            resto = texto[pos:]
+            if resto:
+                text_widget.insert('end', resto, ("normal",))
+            aplicado = True
+            break
+    if not aplicado:
+        text_widget.insert('end', texto, ("normal",))
+    text_widget.config(state='disabled')
+
+    def _rolar(event):
+        return "break"
+    for w in (text_widget, botao):
+        w.bind("<MouseWheel>", _rolar)
+        w.bind("<Button-4>", _rolar)
+        w.bind("<Button-5>", _rolar)
+
+    text_widget.update_idletasks()
+    num_linhas = int(text_widget.index('end-1c').split('.')[0])
+    text_widget.config(height=num_linhas)
+    return painel
+
+
+def _contar_widgets(w):
+    return 1 + sum(_contar_widgets(filho) for filho in w.winfo_children())
+
+
+def _montar(canvas, item, antigo):
+    frame = tk.Frame(canvas, bg='#606060')
+    canvas.create_window((0, 0), window=frame, anchor='n')
+    t0 = time.perf_counter()
+    if antigo:
+        # como era: parte dos detalhes crus, regex e medida síncrona em cada evento
+        for nome_cat, eventos in _eventos_brutos(item):
+            tk.Label(frame, text=f"-- {nome_cat} --", fg='white', bg='#606060').pack(fill='x')
+            for titulo, detalhes in eventos:
+                _evento_antigo(frame, titulo, detalhes).pack(fill='x', padx=10, pady=1)
+    else:
+        for categoria in item.eventos:
+            tk.Label(frame, text=f"-- {categoria.nome} --", fg='white', bg='#606060').pack(fill='x')
+            for ev in categoria.eventos:
+                EventoExpandivel(frame, ev.nome, ev.segmentos).pack(fill='x', padx=10, pady=1)
+    canvas.update_idletasks()
+    dt = time.perf_counter() - t0
+    widgets = _contar_widgets(frame)
+    frame.destroy()
+    return dt, widgets
+
+
+def main():
+    parser = argparse.ArgumentParser(description="mede a montagem do painel de eventos")
+    parser.add_argument("--repeticoes", type=int, default=3)
+    args = parser.parse_args()
+
+    item = _maior_item()
+    n = sum(len(c.eventos) for c in item.eventos)
+    root = tk.Tk()
+    root.withdraw()
+    canvas = tk.Canvas(root)
+    canvas.pack()
+
+    print(f"item: {item.nome} ({n} eventos em {len(item.eventos)} categorias)")
+    for rotulo, antigo in (("antes (detalhes na hora)", True), ("depois (detalhes no toggle)", False)):
+        tempos = []
+        for _ in range(args.repeticoes):
+            dt, widgets = _montar(canvas, item, antigo)
+            tempos.append(dt)
+        print(f"[TEMPO] {rotulo:28s}: {min(tempos) * 1000:8.1f} ms | {widgets} widgets")
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+# ----------------------------
+# mede o cache de miniaturas: decode+LANCZOS direto vs cache frio (gera e grava) vs quente
+# e o atlas de ícones (se já gerado com python -m src.tools.gerar_atlas)
+# usa um diretório temporário, não mexe no .cache/ do app
+# uso: python -m src.tools.bench_miniaturas [--tamanho 96] [--repeticoes 3]
+# ----------------------------
+import os
+import time
+import shutil
+import argparse
+import tempfile
+
+from ..data.paths import BASE, asset_path
+from ..data.loaders import carregar_cartas, carregar_cavalas
+from ..data.miniaturas import CacheMiniaturas, _redimensionar
+from ..data.atlas import Atlas
+
+
+def _imagens():
+    cartas = carregar_cartas(str(asset_path("cartas")))
+    cavalas = carregar_cavalas(str(asset_path("cavalas")))
+    caminhos = [os.path.join(BASE, item.imagem or "") for item in list(cartas.values()) + list(cavalas.values())]
+    return [c for c in caminhos if os.path.isfile(c)]
+
+
+def _cronometrar(fn, caminhos):
+    t0 = time.perf_counter()
+    for c in caminhos:
+        fn(c)
+    return time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tamanho", type=int, default=96)
+    parser.add_argument("--repeticoes", type=int, default=3)
+    args = parser.parse_args()
+    tamanho, fundo = (args.tamanho, args.tamanho), "#505050"
+
+    caminhos = _imagens()
+    if not caminhos:
+        print("[AVISO] nenhuma imagem encontrada")
+        return
+    n = len(caminhos)
+
+    direto = min(_cronometrar(lambda c: _redimensionar(c, tamanho, fundo), caminhos)
+                 for _ in range(args.repeticoes))
+
+    pasta = tempfile.mkdtemp(prefix="miniaturas-bench-")
+    try:
+        frio = []
+        for _ in range(args.repeticoes):
+            shutil.rmtree(pasta, ignore_errors=True)
+            cache = CacheMiniaturas(pasta, atlas=None)
+            frio.append(_cronometrar(lambda c: cache.obter(c, tamanho, fundo), caminhos))
+        quente = []
+        for _ in range(args.repeticoes):
+            cache = CacheMiniaturas(pasta, atlas=None)   # instância nova: simula abrir o app de novo
+            quente.append(_cronometrar(lambda c: cache.obter(c, tamanho, fundo), caminhos))
+        total = cache.total_bytes
+
+        # atlas: instância nova a cada rodada (inclui decodificar as folhas uma vez)
+        shutil.rmtree(pasta, ignore_errors=True)
+        com_atlas, atlas = [], None
+        for _ in range(args.repeticoes):
+            atlas = Atlas()
+            cache = CacheMiniaturas(pasta, atlas=atlas)
+            com_atlas.append(_cronometrar(lambda c: cache.obter(c, tamanho, fundo), caminhos))
+    finally:
+        shutil.rmtree(pasta, ignore_errors=True)
+
+    print(f"imagens: {n} | miniatura {tamanho[0]}x{tamanho[1]} | melhor de {args.repeticoes}")
+    print(f"direto (open+LANCZOS):  {direto * 1000:8.1f} ms | {direto / n * 1000:6.2f} ms/img")
+    print(f"cache frio (gera+grava): {min(frio) * 1000:7.1f} ms | {min(frio) / n * 1000:6.2f} ms/img")
+    print(f"cache quente (lê):       {min(quente) * 1000:7.1f} ms | {min(quente) / n * 1000:6.2f} ms/img")
+    if atlas.acertos:
+        print(f"atlas (folhas + crop):   {min(com_atlas) * 1000:7.1f} ms | {min(com_atlas) / n * 1000:6.2f} ms/img"
+              f" | {atlas.acertos}/{n} no atlas, {len(atlas._folhas)} folha(s) lida(s)")
+    else:
+        print("atlas: não gerado (python -m src.tools.gerar_atlas)")
+    print(f"disco: {total / 1024:.0f} KB ({total / n / 1024:.1f} KB/img)")
+
+
+if __name__ == "__main__":
+    main()
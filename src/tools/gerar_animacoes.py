@@ -0,0 +1,38 @@
+# ----------------------------
+# pré-renderiza os gifs do menu (imagens/main_menu_*.gif) no tamanho de exibição (.cache/animacoes)
+# opcional: sem isso o pacote de cada gif é gravado na primeira vez que ele toca
+# uso: python -m src.tools.gerar_animacoes [--largura 700] [--altura 400] [--destino PASTA]
+# ----------------------------
+import os
+import glob
+import time
+import argparse
+
+from ..data.paths import asset_path, cache_path
+from ..data.animacoes import CacheAnimacoes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="pré-renderiza os gifs do menu")
+    parser.add_argument("--largura", type=int, default=700)
+    parser.add_argument("--altura", type=int, default=400)
+    parser.add_argument("--destino", default=str(cache_path("animacoes")))
+    args = parser.parse_args()
+
+    cache = CacheAnimacoes(args.destino)
+    t0 = time.perf_counter()
+    total = 0
+    arquivos = sorted(glob.glob(os.path.join(asset_path("imagens"), "main_menu_*.gif")))
+    # mesmos gifs que o menu sorteia (app/menu._carregar_gif_aleatorio)
+    arquivos = [p for p in arquivos if any(p.endswith(f"main_menu_{i}.gif") for i in range(1, 13))]
+    for caminho in arquivos:
+        t = time.perf_counter()
+        arquivo = cache.gerar(caminho, args.largura, args.altura)
+        total += os.path.getsize(arquivo)
+        print(f"[TEMPO] {os.path.basename(caminho)}: {(time.perf_counter() - t) * 1000:.0f} ms "
+              f"-> {os.path.basename(arquivo)} ({os.path.getsize(arquivo) / 1e6:.1f} MB)")
+    print(f"[TEMPO] animações: {total / 1e6:.1f} MB em {time.perf_counter() - t0:.2f}s -> {args.destino}")
+
+
+if __name__ == "__main__":
+    main()
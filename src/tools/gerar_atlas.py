@@ -0,0 +1,81 @@
+# ----------------------------
+# gera o atlas de ícones (.cache/atlas): para cada variante de data/atlas.VARIANTES,
+# redimensiona todos os png da pasta e cola em folhas LADO_FOLHA x LADO_FOLHA
+# rodar de novo depois de adicionar/trocar ícones (os que mudaram caem no caminho normal até lá)
+# uso: python -m src.tools.gerar_atlas [--destino PASTA]
+# ----------------------------
+import os
+import json
+import time
+import argparse
+
+from PIL import Image
+
+from ..data.paths import BASE, cache_path
+from ..data.atlas import VERSAO_ATLAS, LADO_FOLHA, VARIANTES, nome_variante, chave_asset
+from ..data.miniaturas import _redimensionar
+from ..data.pixels import gravar_pixels
+
+
+def _pngs(pasta):
+    raiz = os.path.join(BASE, pasta)
+    encontrados = []
+    for root, _, files in os.walk(raiz):
+        for fname in files:
+            if fname.lower().endswith(".png"):
+                encontrados.append(os.path.join(root, fname))
+    return sorted(encontrados)
+
+
+def gerar(destino):
+    os.makedirs(destino, exist_ok=True)
+    variantes = {}
+    folhas = []
+    for pasta, tamanho, fundo in VARIANTES:
+        w, h = tamanho
+        por_linha, por_coluna = LADO_FOLHA // w, LADO_FOLHA // h
+        por_folha = por_linha * por_coluna
+        entradas = variantes.setdefault(nome_variante(tamanho, fundo), {})
+        caminhos = _pngs(pasta)
+        lotes = [caminhos[i:i + por_folha] for i in range(0, len(caminhos), por_folha)]
+        for n, lote in enumerate(lotes):
+            linhas = -(-len(lote) // por_linha)
+            folha = Image.new("RGBA", (min(len(lote), por_linha) * w, linhas * h), (0, 0, 0, 0))
+            nome_folha = f"{pasta}-{nome_variante(tamanho, fundo)}-{n}.px"
+            for i, caminho in enumerate(lote):
+                try:
+                    img = _redimensionar(caminho, tamanho, fundo)
+                    st = os.stat(caminho)
+                except Exception as e:
+                    print(f"[AVISO] ícone ignorado {caminho}: {e}")
+                    continue
+                x, y = (i % por_linha) * w, (i // por_linha) * h
+                folha.paste(img, (x, y))
+                entradas[chave_asset(caminho)] = [nome_folha, x, y, st.st_mtime_ns, st.st_size]
+            gravar_pixels(os.path.join(destino, nome_folha), folha)
+            folhas.append(nome_folha)
+
+    tmp = os.path.join(destino, "indice.json.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({"versao": VERSAO_ATLAS, "variantes": variantes}, f)
+    os.replace(tmp, os.path.join(destino, "indice.json"))
+
+    # folhas de uma geração anterior que não existem mais
+    for fname in os.listdir(destino):
+        if fname.endswith((".px", ".png")) and fname not in folhas:
+            os.remove(os.path.join(destino, fname))
+    return variantes, folhas
+
+
+def main():
+    parser = argparse.ArgumentParser(description="gera o atlas de ícones")
+    parser.add_argument("--destino", default=str(cache_path("atlas")))
+    args = parser.parse_args()
+    t0 = time.perf_counter()
+    variantes, folhas = gerar(args.destino)
+    total = sum(len(v) for v in variantes.values())
+    print(f"[TEMPO] atlas: {total} ícones em {len(folhas)} folha(s), {time.perf_counter() - t0:.2f}s -> {args.destino}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+import os
+import json
+import shutil
+import tempfile
+import unittest
+
+from src.data.loaders import carregar_cartas, carregar_cavalas
+from src.data.watcher import RecarregadorCatalogo, aplicar_mudancas
+
+# hot-reload x load do zero: depois de cada mudança na árvore, o catálogo mantido pelo
+# RecarregadorCatalogo tem que apontar pros mesmos arquivos que um carregar_* novo escolheria
+# (inclusive qual duplicata vale, que depende da ordem de listagem do os.walk/os.listdir)
+
+
+def _gravar(caminho, **dados):
+    os.makedirs(os.path.dirname(caminho), exist_ok=True)
+    with open(caminho, "w", encoding="utf-8") as f:
+        json.dump(dados, f)
+
+
+def _carta(caminho, imagem, nome="Carta", versao=0):
+    _gravar(caminho, nome=nome, imagem=imagem, versao=versao, eventos={})
+
+
+def _cavala(caminho, nome, versao=0):
+    _gravar(caminho, nome=nome, imagem=f"icon_cavalas/{nome}.png", versao=versao, eventos={})
+
+
+def _origens(catalogo):
+    return {chave: item.arquivo for chave, item in catalogo.items()}
+
+
+class TestRecarregadorPrecedencia(unittest.TestCase):
+    def setUp(self):
+        self.raiz = tempfile.mkdtemp()
+        self.dir_cartas = os.path.join(self.raiz, "cartas")
+        self.dir_cavalas = os.path.join(self.raiz, "cavalas")
+        for i in range(6):
+            _carta(os.path.join(self.dir_cartas, "speed", f"c{i}.json"), f"icon_cartas/speed/c{i}_SSR.png")
+            _cavala(os.path.join(self.dir_cavalas, f"v{i}.json"), f"V{i}")
+        # duplicatas desde o começo: mais de um arquivo pras mesmas chaves
+        for i in range(3):
+            _carta(os.path.join(self.dir_cartas, "wisdom", f"d{i}.json"), f"icon_cartas/speed/c{i}_SSR.png")
+            _cavala(os.path.join(self.dir_cavalas, f"dup{i}.json"), f"V{i}")
+
+        self.recarregador = RecarregadorCatalogo(self.dir_cartas, self.dir_cavalas)
+        origens_cartas, origens_cavalas = {}, {}
+        self.cartas = carregar_cartas(self.dir_cartas, origens=origens_cartas)
+        self.cavalas = carregar_cavalas(self.dir_cavalas, origens=origens_cavalas)
+        self.recarregador.registrar_origens("cartas", origens_cartas)
+        self.recarregador.registrar_origens("cavalas", origens_cavalas)
+
+    def tearDown(self):
+        shutil.rmtree(self.raiz, ignore_errors=True)
+
+    def _recarregar_e_comparar(self):
+        mudancas = self.recarregador.verificar()
+        aplicar_mudancas(self.cartas, mudancas.get("cartas", {}))
+        aplicar_mudancas(self.cavalas, mudancas.get("cavalas", {}))
+        self.assertEqual(_origens(self.cartas), _origens(carregar_cartas(self.dir_cartas)))
+        self.assertEqual(_origens(self.cavalas), _origens(carregar_cavalas(self.dir_cavalas)))
+
+    def test_arquivo_renomeado_pra_chave_existente(self):
+        # renomear muda a posição do arquivo na listagem
+        for i in range(3):
+            os.rename(os.path.join(self.dir_cavalas, f"dup{i}.json"), os.path.join(self.dir_cavalas, f"a{i}.json"))
+            os.rename(os.path.join(self.dir_cartas, "wisdom", f"d{i}.json"),
+                      os.path.join(self.dir_cartas, "wisdom", f"a{i}.json"))
+        self._recarregar_e_comparar()
+        # arquivo de outra chave renomeado e editado pra uma chave que já existe
+        os.rename(os.path.join(self.dir_cavalas, "v5.json"), os.path.join(self.dir_cavalas, "b4.json"))
+        _cavala(os.path.join(self.dir_cavalas, "b4.json"), "V4", versao=1)
+        os.rename(os.path.join(self.dir_cartas, "speed", "c5.json"), os.path.join(self.dir_cartas, "speed", "b4.json"))
+        _carta(os.path.join(self.dir_cartas, "speed", "b4.json"), "icon_cartas/speed/c4_SSR.png", versao=1)
+        self._recarregar_e_comparar()
+
+    def test_duplicata_em_subpasta_nova(self):
+        for i in range(6):
+            _carta(os.path.join(self.dir_cartas, f"nova{i}", "x.json"), f"icon_cartas/speed/c{i}_SSR.png")
+        self._recarregar_e_comparar()
+        # a que valia sai: volta a de baixo na ordem de listagem
+        for i in range(6):
+            os.remove(os.path.join(self.dir_cartas, f"nova{i}", "x.json"))
+        self._recarregar_e_comparar()
+
+    def test_editar_duplicata_sobrescrita_nao_muda_o_vencedor(self):
+        for i in range(3):
+            _cavala(os.path.join(self.dir_cavalas, f"dup{i}.json"), f"V{i}", versao=1)
+            _cavala(os.path.join(self.dir_cavalas, f"v{i}.json"), f"V{i}", versao=1)
+        self._recarregar_e_comparar()
+
+
+if __name__ == "__main__":
+    unittest.main()